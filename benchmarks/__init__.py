@@ -0,0 +1,4 @@
+"""
+Benchmarks that run real extensions against stand ins for discord and postgres
+These are run with make bench, and are not part of the test suite
+"""
@@ -0,0 +1,360 @@
+"""
+An in memory stand in for the gino models used by extensions
+Queries are built the same way as with gino, and every query that would
+reach postgres is counted, and can be given a simulated round trip time
+Only equality filters are applied, ordering and other filters are ignored
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from collections.abc import Callable
+from typing import Self
+
+
+class FakeDatabase:
+    """Holds the rows of every table, and counts the queries made
+
+    Args:
+        latency (float, optional): The simulated round trip time of every query,
+            in seconds. Defaults to 0.
+
+    Attributes:
+        total (int): The number of queries made so far, across all tables
+    """
+
+    def __init__(self: Self, latency: float = 0) -> None:
+        self.latency = latency
+        self.queries: collections.Counter[str] = collections.Counter()
+        self.models = FakeModels(self)
+
+    @property
+    def total(self: Self) -> int:
+        """The number of queries made so far, across all tables
+
+        Returns:
+            int: The total number of queries
+        """
+        return sum(self.queries.values())
+
+    async def execute(self: Self, statement: str) -> None:
+        """Counts a single query
+
+        Args:
+            statement (str): A short name for the query, such as "Factoid.first"
+        """
+        self.queries[statement] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def all(self: Self, query: FakeQuery) -> list[FakeRow]:
+        """Runs a query and returns every row, like bot.db.all
+
+        Args:
+            query (FakeQuery): The query to run
+
+        Returns:
+            list[FakeRow]: The matching rows
+        """
+        return await query.all()
+
+    async def first(self: Self, query: FakeQuery) -> FakeRow:
+        """Runs a query and returns the first row, like bot.db.first
+
+        Args:
+            query (FakeQuery): The query to run
+
+        Returns:
+            FakeRow: The first matching row, or None
+        """
+        return await query.first()
+
+
+class FakeModels:
+    """Makes a table for every model name that is asked for, like bot.models
+
+    Args:
+        database (FakeDatabase): The database the tables belong to
+    """
+
+    def __init__(self: Self, database: FakeDatabase) -> None:
+        self.database = database
+        self.tables: dict[str, FakeTable] = {}
+
+    def __getattr__(self: Self, name: str) -> FakeTable:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name not in self.tables:
+            self.tables[name] = FakeTable(self.database, name)
+        return self.tables[name]
+
+
+class FakeColumn:
+    """A column of a table, comparing it makes a filter
+
+    Args:
+        name (str): The name of the column
+    """
+
+    def __init__(self: Self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self: Self, other: object) -> Callable[[FakeRow], bool]:
+        return lambda row: getattr(row, self.name) == other
+
+    def __ne__(self: Self, other: object) -> Callable[[FakeRow], bool]:
+        return lambda row: getattr(row, self.name) != other
+
+    def __gt__(self: Self, other: object) -> Callable[[FakeRow], bool]:
+        return lambda _: True
+
+    def __lt__(self: Self, other: object) -> Callable[[FakeRow], bool]:
+        return lambda _: True
+
+    def __neg__(self: Self) -> FakeColumn:
+        return self
+
+    def __hash__(self: Self) -> int:
+        return hash(self.name)
+
+    def desc(self: Self) -> FakeColumn:
+        """Orders by this column, newest first. Ordering is ignored
+
+        Returns:
+            FakeColumn: This column
+        """
+        return self
+
+    def asc(self: Self) -> FakeColumn:
+        """Orders by this column, oldest first. Ordering is ignored
+
+        Returns:
+            FakeColumn: This column
+        """
+        return self
+
+
+class FakeTable:
+    """A table, which is also the model class used to make new rows
+    Any other attribute is a column, so the table's own attributes are private
+
+    Args:
+        database (FakeDatabase): The database the table belongs to
+        name (str): The name of the model
+
+    Attributes:
+        query (FakeQuery): A new query on the table, that matches every row
+    """
+
+    def __init__(self: Self, database: FakeDatabase, name: str) -> None:
+        self._database = database
+        self._name = name
+        self._rows: list[FakeRow] = []
+
+    def __call__(self: Self, **values: object) -> FakeRow:
+        return FakeRow(self, **values)
+
+    def __getattr__(self: Self, name: str) -> FakeColumn:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return FakeColumn(name)
+
+    @property
+    def query(self: Self) -> FakeQuery:
+        """Starts a new query on the table
+
+        Returns:
+            FakeQuery: A query that matches every row
+        """
+        return FakeQuery(self)
+
+    def add(self: Self, **values: object) -> FakeRow:
+        """Adds a row without counting a query, to seed the table before a run
+
+        Args:
+            **values (object): The values of the row
+
+        Returns:
+            FakeRow: The new row
+        """
+        row = FakeRow(self, **values)
+        self._rows.append(row)
+        return row
+
+    async def run(self: Self, operation: str) -> None:
+        """Counts a query on the table
+
+        Args:
+            operation (str): The operation, such as "first" or "create"
+        """
+        await self._database.execute(f"{self._name}.{operation}")
+
+    def insert(self: Self, row: FakeRow) -> None:
+        """Stores a row, once its create query has been counted
+
+        Args:
+            row (FakeRow): The row to store
+        """
+        self._rows.append(row)
+
+    def remove(self: Self, row: FakeRow) -> None:
+        """Drops a row, once its delete query has been counted
+
+        Args:
+            row (FakeRow): The row to drop
+        """
+        if row in self._rows:
+            self._rows.remove(row)
+
+    def select(self: Self, filters: list[Callable[[FakeRow], bool]]) -> list[FakeRow]:
+        """Finds the rows that pass every filter, without counting a query
+
+        Args:
+            filters (list[Callable[[FakeRow], bool]]): The filters of the query
+
+        Returns:
+            list[FakeRow]: The matching rows
+        """
+        return [
+            row for row in self._rows if all(condition(row) for condition in filters)
+        ]
+
+
+class FakeRow:
+    """A row of a table, columns that were never set are None
+
+    Args:
+        table (FakeTable): The table the row belongs to
+        **values (object): The values of the row
+    """
+
+    def __init__(self: Self, table: FakeTable, **values: object) -> None:
+        self._table = table
+        self.__dict__.update(values)
+
+    def __getattr__(self: Self, name: str) -> None:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+    async def create(self: Self) -> FakeRow:
+        """Inserts the row
+
+        Returns:
+            FakeRow: This row
+        """
+        await self._table.run("create")
+        self._table.insert(self)
+        return self
+
+    async def delete(self: Self) -> None:
+        """Deletes the row"""
+        await self._table.run("delete")
+        self._table.remove(self)
+
+    def update(self: Self, **values: object) -> FakeUpdate:
+        """Prepares an update of the row
+
+        Args:
+            **values (object): The new values
+
+        Returns:
+            FakeUpdate: The update, which is run with apply()
+        """
+        return FakeUpdate(self._table, self, values)
+
+
+class FakeUpdate:
+    """An update of a row that hasn't been run yet
+
+    Args:
+        table (FakeTable): The table the row belongs to
+        row (FakeRow): The row to update
+        values (dict[str, object]): The new values
+    """
+
+    def __init__(
+        self: Self, table: FakeTable, row: FakeRow, values: dict[str, object]
+    ) -> None:
+        self.table = table
+        self.row = row
+        self.values = values
+
+    async def apply(self: Self) -> None:
+        """Runs the update"""
+        await self.table.run("update")
+        self.row.__dict__.update(self.values)
+
+
+class FakeQuery:
+    """A select on a table, built up like a gino query
+
+    Args:
+        table (FakeTable): The table to select from
+
+    Attributes:
+        gino (FakeQuery): The gino loader of the query, which is the query itself
+    """
+
+    def __init__(self: Self, table: FakeTable) -> None:
+        self.table = table
+        self.filters: list[Callable[[FakeRow], bool]] = []
+
+    @property
+    def gino(self: Self) -> FakeQuery:
+        """The gino loader of the query, which is the query itself
+
+        Returns:
+            FakeQuery: This query
+        """
+        return self
+
+    def where(self: Self, condition: Callable[[FakeRow], bool]) -> FakeQuery:
+        """Adds a filter to the query
+
+        Args:
+            condition (Callable[[FakeRow], bool]): The filter, made by comparing a column
+
+        Returns:
+            FakeQuery: This query
+        """
+        self.filters.append(condition)
+        return self
+
+    def order_by(self: Self, *columns: FakeColumn) -> FakeQuery:
+        """Orders the query. Ordering is ignored
+
+        Args:
+            *columns (FakeColumn): The columns to order by
+
+        Returns:
+            FakeQuery: This query
+        """
+        return self
+
+    def limit(self: Self, _: int) -> FakeQuery:
+        """Limits the query. Limits are ignored
+
+        Returns:
+            FakeQuery: This query
+        """
+        return self
+
+    async def all(self: Self) -> list[FakeRow]:
+        """Runs the query
+
+        Returns:
+            list[FakeRow]: The matching rows
+        """
+        await self.table.run("all")
+        return self.table.select(self.filters)
+
+    async def first(self: Self) -> FakeRow:
+        """Runs the query for a single row
+
+        Returns:
+            FakeRow: The first matching row, or None
+        """
+        await self.table.run("first")
+        rows = self.table.select(self.filters)
+        return rows[0] if rows else None
@@ -0,0 +1,568 @@
+"""
+Stand ins for the discord objects that extensions use while handling events
+Every call that would reach the discord API goes through a FakeTransport,
+which counts it and can add a simulated round trip time
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import datetime
+import io
+from collections.abc import AsyncIterator
+from typing import Self
+
+import discord
+
+
+class FakeTransport:
+    """Counts the calls that would have been made to the discord API
+
+    Args:
+        latency (float, optional): The simulated round trip time of every call,
+            in seconds. Defaults to 0.
+
+    Attributes:
+        total (int): The number of calls made so far, across all routes
+    """
+
+    def __init__(self: Self, latency: float = 0) -> None:
+        self.latency = latency
+        self.calls: collections.Counter[str] = collections.Counter()
+
+    @property
+    def total(self: Self) -> int:
+        """The number of calls made so far, across all routes
+
+        Returns:
+            int: The total number of calls
+        """
+        return sum(self.calls.values())
+
+    async def request(self: Self, route: str) -> None:
+        """Counts a single API call
+
+        Args:
+            route (str): A short name for what the call does
+        """
+        self.calls[route] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+
+class FakeRole:
+    """A role, compared by its position like a discord.Role
+
+    Args:
+        role_id (int): The ID of the role
+        name (str): The name of the role
+        position (int): The position of the role in the role list
+    """
+
+    def __init__(self: Self, role_id: int, name: str, position: int) -> None:
+        self.id = role_id
+        self.name = name
+        self.position = position
+        self.mention = f"<@&{role_id}>"
+
+    def __lt__(self: Self, other: FakeRole) -> bool:
+        return self.position < other.position
+
+    def __le__(self: Self, other: FakeRole) -> bool:
+        return self.position <= other.position
+
+    def __gt__(self: Self, other: FakeRole) -> bool:
+        return self.position > other.position
+
+    def __ge__(self: Self, other: FakeRole) -> bool:
+        return self.position >= other.position
+
+    def __hash__(self: Self) -> int:
+        return hash(self.id)
+
+
+class FakeAsset:
+    """An avatar, which has to be downloaded to be reuploaded
+
+    Args:
+        transport (FakeTransport): The transport to count downloads with
+        url (str): The URL of the avatar
+    """
+
+    def __init__(self: Self, transport: FakeTransport, url: str) -> None:
+        self.transport = transport
+        self.url = url
+
+    async def to_file(self: Self, filename: str) -> discord.File:
+        """Downloads the avatar as a file
+
+        Args:
+            filename (str): The name to give the file
+
+        Returns:
+            discord.File: The downloaded avatar
+        """
+        await self.transport.request("download avatar")
+        return discord.File(io.BytesIO(b"\x89PNG"), filename=filename)
+
+
+class FakeAttachment:
+    """A file attached to a message
+
+    Args:
+        transport (FakeTransport): The transport to count downloads with
+        attachment_id (int): The ID of the attachment
+        filename (str): The name of the file
+        size (int): The size of the file, in bytes
+    """
+
+    def __init__(
+        self: Self,
+        transport: FakeTransport,
+        attachment_id: int,
+        filename: str,
+        size: int,
+    ) -> None:
+        self.transport = transport
+        self.id = attachment_id
+        self.filename = filename
+        self.size = size
+        self.url = f"https://cdn.invalid/attachments/{attachment_id}/{filename}"
+        self.description = None
+
+    def is_spoiler(self: Self) -> bool:
+        """Attachments in a replay are never spoilers
+
+        Returns:
+            bool: Always False
+        """
+        return False
+
+    async def read(self: Self) -> bytes:
+        """Downloads the attachment
+
+        Returns:
+            bytes: The contents of the file, all zeros
+        """
+        await self.transport.request("download attachment")
+        return bytes(self.size)
+
+
+class FakeMember:
+    """A member of the replay guild
+
+    Args:
+        transport (FakeTransport): The transport to count API calls with
+        guild (FakeGuild): The guild the member is in
+        member_id (int): The ID of the member
+        name (str): The username of the member
+        roles (list[FakeRole]): The roles of the member, lowest first
+        bot (bool, optional): If the member is a bot. Defaults to False.
+
+    Attributes:
+        display_name (str): The nickname, global name or username of the member
+        top_role (FakeRole): The highest role of the member
+        mutual_guilds (list[FakeGuild]): The guilds the member shares with the bot
+    """
+
+    def __init__(
+        self: Self,
+        transport: FakeTransport,
+        guild: FakeGuild,
+        member_id: int,
+        name: str,
+        roles: list[FakeRole],
+        bot: bool = False,
+    ) -> None:
+        self.transport = transport
+        self.guild = guild
+        self.id = member_id
+        self.name = name
+        self.global_name = None
+        self.nick = None
+        self.roles = roles
+        self.bot = bot
+        self.mention = f"<@{member_id}>"
+        self.created_at = datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC)
+        self.joined_at = self.created_at
+        self.display_avatar = FakeAsset(
+            transport, f"https://cdn.invalid/avatars/{member_id}.png"
+        )
+        self.default_avatar = self.display_avatar
+
+    def __str__(self: Self) -> str:
+        return self.name
+
+    @property
+    def display_name(self: Self) -> str:
+        """The name shown for the member in the guild
+
+        Returns:
+            str: The nickname, global name or username of the member
+        """
+        return self.nick or self.global_name or self.name
+
+    @property
+    def top_role(self: Self) -> FakeRole:
+        """The highest role of the member
+
+        Returns:
+            FakeRole: The highest role
+        """
+        return max(self.roles)
+
+    @property
+    def mutual_guilds(self: Self) -> list[FakeGuild]:
+        """The guilds the member shares with the bot
+
+        Returns:
+            list[FakeGuild]: The replay guild
+        """
+        return [self.guild]
+
+    async def edit(self: Self, nick: str = None, **kwargs: object) -> None:
+        """Changes the nickname of the member
+
+        Args:
+            nick (str, optional): The new nickname. Defaults to None.
+            **kwargs (object): Other changes, which are ignored
+        """
+        await self.transport.request("edit member")
+        self.nick = nick
+
+    async def send(self: Self, *args: object, **kwargs: object) -> None:
+        """Sends the member a DM
+
+        Args:
+            *args (object): The arguments of the message, which are ignored
+            **kwargs (object): The keyword arguments of the message, which are ignored
+        """
+        await self.transport.request("send DM")
+
+    async def add_roles(self: Self, *roles: FakeRole, **kwargs: object) -> None:
+        """Gives the member roles
+
+        Args:
+            *roles (FakeRole): The roles to give
+            **kwargs (object): The reason for the change, which is ignored
+        """
+        await self.transport.request("add role")
+        self.roles = self.roles + list(roles)
+
+    async def remove_roles(self: Self, *roles: FakeRole, **kwargs: object) -> None:
+        """Takes roles from the member
+
+        Args:
+            *roles (FakeRole): The roles to take
+            **kwargs (object): The reason for the change, which is ignored
+        """
+        await self.transport.request("remove role")
+        self.roles = [role for role in self.roles if role not in roles]
+
+
+class FakeMessage:
+    """A message in a replay channel
+
+    Args:
+        message_id (int): The ID of the message
+        channel (FakeChannel): The channel the message was sent in
+        author (FakeMember): The member who sent the message
+        content (str): The text of the message
+        attachments (list[FakeAttachment], optional): The files attached to the message.
+            Defaults to None.
+
+    Attributes:
+        clean_content (str): The text of the message, mentions are never used in a replay
+    """
+
+    def __init__(
+        self: Self,
+        message_id: int,
+        channel: FakeChannel,
+        author: FakeMember,
+        content: str,
+        attachments: list[FakeAttachment] = None,
+    ) -> None:
+        self.id = message_id
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.content = content
+        self.attachments = attachments or []
+        self.mentions = []
+        self.embeds = []
+        self.reference = None
+        self.message_snapshots = []
+        self.type = discord.MessageType.default
+        self.created_at = datetime.datetime.now(datetime.UTC)
+        self.edited_at = None
+        self.jump_url = (
+            f"https://discord.com/channels/{channel.guild.id}/{channel.id}/{message_id}"
+        )
+
+    @property
+    def clean_content(self: Self) -> str:
+        """The text of the message, mentions are never used in a replay
+
+        Returns:
+            str: The text of the message
+        """
+        return self.content
+
+    async def delete(self: Self) -> None:
+        """Deletes the message"""
+        await self.channel.transport.request("delete message")
+
+
+class FakeChannel:
+    """A text channel in the replay guild
+    The channel keeps every message sent in it, so they can be fetched later
+
+    Args:
+        transport (FakeTransport): The transport to count API calls with
+        guild (FakeGuild): The guild the channel is in
+        channel_id (int): The ID of the channel
+        name (str): The name of the channel
+        category_id (int): The ID of the category the channel is in
+    """
+
+    def __init__(
+        self: Self,
+        transport: FakeTransport,
+        guild: FakeGuild,
+        channel_id: int,
+        name: str,
+        category_id: int,
+    ) -> None:
+        self.transport = transport
+        self.guild = guild
+        self.id = channel_id
+        self.name = name
+        self.category_id = category_id
+        self.mention = f"<#{channel_id}>"
+        self.messages: dict[int, FakeMessage] = {}
+
+    async def send(self: Self, *args: object, **kwargs: object) -> FakeMessage:
+        """Sends a message from the bot in the channel
+
+        Args:
+            *args (object): The arguments of the message, which are ignored
+            **kwargs (object): The keyword arguments of the message, which are ignored
+
+        Returns:
+            FakeMessage: The message that was sent
+        """
+        await self.transport.request("send message")
+        message = FakeMessage(
+            self.guild.next_id(), self, self.guild.me, "", attachments=[]
+        )
+        self.messages[message.id] = message
+        return message
+
+    async def fetch_message(self: Self, message_id: int) -> FakeMessage:
+        """Gets a message from the API
+
+        Args:
+            message_id (int): The ID of the message to get
+
+        Returns:
+            FakeMessage: The message, or None if it was never sent
+        """
+        await self.transport.request("fetch message")
+        return self.messages.get(message_id)
+
+    async def history(self: Self, limit: int = 100) -> AsyncIterator[FakeMessage]:
+        """Reads the most recent messages in the channel, newest first
+
+        Args:
+            limit (int, optional): How many messages to read. Defaults to 100.
+
+        Yields:
+            FakeMessage: The next older message
+        """
+        await self.transport.request("read history")
+        for message_id in sorted(self.messages, reverse=True)[:limit]:
+            yield self.messages[message_id]
+
+
+class FakeGuild:
+    """The single guild events are replayed in
+    Channels and members are made the first time an event mentions them
+
+    Args:
+        transport (FakeTransport): The transport to count API calls with
+        guild_id (int): The ID of the guild
+        category_id (int): The ID of the category every channel is put in
+    """
+
+    def __init__(
+        self: Self, transport: FakeTransport, guild_id: int, category_id: int
+    ) -> None:
+        self.transport = transport
+        self.id = guild_id
+        self.name = "Replay guild"
+        self.category_id = category_id
+        self.filesize_limit = 10 * 1024 * 1024
+        self.last_id = guild_id
+        self.channels: dict[int, FakeChannel] = {}
+        self.members: dict[int, FakeMember] = {}
+        self.default_role = FakeRole(guild_id, "@everyone", 0)
+        self.member_role = FakeRole(guild_id + 1, "Member", 1)
+        self.roles = {role.id: role for role in (self.default_role, self.member_role)}
+        self.me = FakeMember(
+            transport,
+            self,
+            guild_id + 2,
+            "Replay Bot",
+            [self.default_role, FakeRole(guild_id + 3, "Bot", 100)],
+            bot=True,
+        )
+
+    def next_id(self: Self) -> int:
+        """Makes a new snowflake for something the bot created
+
+        Returns:
+            int: An ID that hasn't been used yet
+        """
+        self.last_id += 1
+        return self.last_id
+
+    def get_channel(self: Self, channel_id: int) -> FakeChannel:
+        """Gets a channel from the cache
+
+        Args:
+            channel_id (int): The ID of the channel
+
+        Returns:
+            FakeChannel: The channel, or None if it was never made
+        """
+        return self.channels.get(channel_id)
+
+    def get_member(self: Self, member_id: int) -> FakeMember:
+        """Gets a member from the cache
+
+        Args:
+            member_id (int): The ID of the member
+
+        Returns:
+            FakeMember: The member, or None if it was never made
+        """
+        return self.members.get(member_id)
+
+    def get_role(self: Self, role_id: int) -> FakeRole:
+        """Gets a role from the cache
+
+        Args:
+            role_id (int): The ID of the role
+
+        Returns:
+            FakeRole: The role, or None if it was never made
+        """
+        return self.roles.get(role_id)
+
+    async def fetch_role(self: Self, role_id: int) -> FakeRole:
+        """Gets a role from the API, making it if it doesn't exist
+
+        Args:
+            role_id (int): The ID of the role
+
+        Returns:
+            FakeRole: The role
+        """
+        await self.transport.request("fetch role")
+        return self.roles.setdefault(
+            role_id, FakeRole(role_id, f"role-{role_id}", len(self.roles))
+        )
+
+    async def fetch_member(self: Self, member_id: int) -> FakeMember:
+        """Gets a member from the API
+
+        Args:
+            member_id (int): The ID of the member
+
+        Returns:
+            FakeMember: The member, or None if it was never made
+        """
+        await self.transport.request("fetch member")
+        return self.members.get(int(member_id))
+
+    def make_channel(self: Self, channel_id: int) -> FakeChannel:
+        """Gets a channel, making it the first time it is seen
+
+        Args:
+            channel_id (int): The ID of the channel
+
+        Returns:
+            FakeChannel: The channel
+        """
+        if channel_id not in self.channels:
+            self.channels[channel_id] = FakeChannel(
+                self.transport,
+                self,
+                channel_id,
+                f"channel-{channel_id}",
+                self.category_id,
+            )
+        return self.channels[channel_id]
+
+    def make_member(self: Self, member_id: int, name: str = None) -> FakeMember:
+        """Gets a member, making them the first time they are seen
+
+        Args:
+            member_id (int): The ID of the member
+            name (str, optional): The username to give a new member. Defaults to None.
+
+        Returns:
+            FakeMember: The member
+        """
+        if member_id not in self.members:
+            self.members[member_id] = FakeMember(
+                self.transport,
+                self,
+                member_id,
+                name or f"member{member_id}",
+                [self.default_role, self.member_role],
+            )
+        return self.members[member_id]
+
+
+class FakeContext:
+    """The command context made for every message
+
+    Args:
+        bot (object): The bot the context was made by
+        message (FakeMessage): The message the context is for
+    """
+
+    def __init__(self: Self, bot: object, message: FakeMessage) -> None:
+        self.bot = bot
+        self.message = message
+        self.guild = message.guild
+        self.channel = message.channel
+        self.author = message.author
+        self.filesize_limit = message.guild.filesize_limit
+
+    async def send(self: Self, *args: object, **kwargs: object) -> FakeMessage:
+        """Sends a message in the channel of the context
+
+        Args:
+            *args (object): The arguments of the message
+            **kwargs (object): The keyword arguments of the message
+
+        Returns:
+            FakeMessage: The message that was sent
+        """
+        return await self.channel.send(*args, **kwargs)
+
+    async def reply(self: Self, *args: object, **kwargs: object) -> FakeMessage:
+        """Replies to the message of the context
+
+        Args:
+            *args (object): The arguments of the message
+            **kwargs (object): The keyword arguments of the message
+
+        Returns:
+            FakeMessage: The message that was sent
+        """
+        return await self.channel.send(*args, **kwargs)
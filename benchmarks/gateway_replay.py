@@ -0,0 +1,849 @@
+"""
+Replays a stream of gateway events through the real message handling extensions
+Extensions are loaded with their own setup functions, against a fake discord
+transport and an in memory database, so the numbers only measure the bot
+
+Events are read from a JSON lines file, or generated from a seed. Each line is
+one of these, with IDs being any snowflake:
+    {"type": "message", "message_id", "channel_id", "author_id", "author_name",
+        "content", "attachments": [{"filename", "size"}]}
+    {"type": "edit", "message_id", "content"}
+    {"type": "reaction", "message_id", "user_id", "emoji"}
+    {"type": "member_update", "member_id", "nick"}
+
+Usage: python -m benchmarks.gateway_replay [--events FILE] [--count N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import copy
+import dataclasses
+import datetime
+import hashlib
+import importlib
+import json
+import math
+import os
+import random
+import shutil
+import tempfile
+import time
+import types
+from collections.abc import Callable, Iterator
+from typing import Self
+from unittest import mock
+
+import discord
+import munch
+import yaml
+
+import configuration
+from benchmarks import fake_database, fake_discord
+from botlogging import LogLevel
+from core import auxiliary, cogs, message_window, startup
+
+GUILD_ID: int = 1000
+CATEGORY_ID: int = 1100
+GENERAL_CHANNEL_ID: int = 1200
+HELP_CHANNEL_ID: int = 1201
+LOG_CHANNEL_ID: int = 1202
+FIRST_MEMBER_ID: int = 5000
+FIRST_MESSAGE_ID: int = 10**9
+
+DEFAULT_EXTENSIONS: tuple[str, ...] = (
+    "operation.factoids",
+    "moderation.automod",
+    "operation.paste",
+    "operation.xp",
+    "moderation.logger",
+    "moderation.nickname",
+)
+
+FACTOIDS: dict[str, str] = {
+    "hello": "Hello! How can we help you today?",
+    "ask": "Don't ask to ask, just ask your question",
+    "logs": "Please upload your logs to a paste site",
+}
+
+BANNED_WORD: str = "freenitro"
+
+WORDS: tuple[str, ...] = (
+    "my",
+    "computer",
+    "will",
+    "not",
+    "boot",
+    "after",
+    "the",
+    "update",
+    "and",
+    "fans",
+    "are",
+    "loud",
+    "driver",
+    "crash",
+    "when",
+    "gaming",
+    "help",
+    "please",
+    "windows",
+    "linux",
+)
+
+
+def build_guild_config(extensions: tuple[str, ...]) -> dict:
+    """Builds the config of the replay guild, which turns on every replayed extension
+
+    Args:
+        extensions (tuple[str, ...]): The extensions being replayed
+
+    Returns:
+        dict: The guild config, to be written next to the default config
+    """
+    watched_channels = [str(GENERAL_CHANNEL_ID), str(HELP_CHANNEL_ID)]
+    return {
+        "core_guild_id": GUILD_ID,
+        "core_enabled_extensions": list(extensions),
+        "core_logging_channel": str(LOG_CHANNEL_ID),
+        "automod_channels": watched_channels,
+        "automod_alert_channel": str(LOG_CHANNEL_ID),
+        "automod_string_map": {
+            BANNED_WORD: {
+                "message": "Scam links are not allowed",
+                "delete": True,
+                "warn": False,
+                "mute": 0,
+                "silent_punishment": False,
+            }
+        },
+        "paste_channels": watched_channels,
+        "logger_channel_map": {str(HELP_CHANNEL_ID): str(LOG_CHANNEL_ID)},
+        "xp_categories_counted": [CATEGORY_ID],
+        "core_nickname_filter": True,
+    }
+
+
+def generate_events(count: int, seed: int = 0) -> list[dict]:
+    """Generates a stream of events that looks like a busy support guild
+    Most events are chat messages, with factoid calls, long messages, automod
+    violations, attachments, edits, reactions and nickname changes mixed in
+
+    Args:
+        count (int): How many events to generate
+        seed (int, optional): The random seed, the same seed gives the same events.
+            Defaults to 0.
+
+    Returns:
+        list[dict]: The events, in the format described at the top of this file
+    """
+    rng = random.Random(seed)
+    member_names = [
+        f"Ｆａｎｃｙ{index}" if index % 10 == 0 else f"member{index}"
+        for index in range(50)
+    ]
+    sent_messages: list[int] = []
+    events: list[dict] = []
+
+    for _ in range(count):
+        roll = rng.random()
+        if sent_messages and roll < 0.12:
+            events.append(
+                {
+                    "type": "edit",
+                    "message_id": rng.choice(sent_messages[-50:]),
+                    "content": " ".join(rng.choices(WORDS, k=rng.randint(4, 20))),
+                }
+            )
+            continue
+        if sent_messages and roll < 0.22:
+            events.append(
+                {
+                    "type": "reaction",
+                    "message_id": rng.choice(sent_messages[-50:]),
+                    "user_id": FIRST_MEMBER_ID + rng.randrange(len(member_names)),
+                    "emoji": rng.choice(["👍", "👀", "✅"]),
+                }
+            )
+            continue
+        if roll < 0.25:
+            events.append(
+                {
+                    "type": "member_update",
+                    "member_id": FIRST_MEMBER_ID + rng.randrange(len(member_names)),
+                    "nick": rng.choice([None, "Helper", "Ｎｉｃｋ"]),
+                }
+            )
+            continue
+
+        author = rng.randrange(len(member_names))
+        kind = rng.random()
+        attachments = []
+        if kind < 0.10:
+            content = "?" + rng.choice([*FACTOIDS, "missing"])
+        elif kind < 0.14:
+            content = "\n".join(
+                " ".join(rng.choices(WORDS, k=12)) for _ in range(rng.randint(10, 40))
+            )
+        elif kind < 0.17:
+            content = f"get your {BANNED_WORD} here"
+        else:
+            content = " ".join(rng.choices(WORDS, k=rng.randint(2, 30)))
+            if kind > 0.95:
+                attachments = [{"filename": "log.txt", "size": rng.randint(1, 50000)}]
+
+        message_id = FIRST_MESSAGE_ID + len(events)
+        sent_messages.append(message_id)
+        events.append(
+            {
+                "type": "message",
+                "message_id": message_id,
+                "channel_id": rng.choice([GENERAL_CHANNEL_ID, HELP_CHANNEL_ID]),
+                "author_id": FIRST_MEMBER_ID + author,
+                "author_name": member_names[author],
+                "content": content,
+                "attachments": attachments,
+            }
+        )
+
+    return events
+
+
+def load_events(events_path: str) -> list[dict]:
+    """Reads a recorded stream of events from a JSON lines file
+
+    Args:
+        events_path (str): The path to the file
+
+    Returns:
+        list[dict]: The events, in the order they were recorded
+    """
+    with open(events_path, encoding="utf8") as events_file:
+        return [json.loads(line) for line in events_file if line.strip()]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Gets a percentile of a list of values, by the nearest rank
+
+    Args:
+        values (list[float]): The values, in any order
+        fraction (float): The percentile to get, from 0 to 1
+
+    Returns:
+        float: The value at the percentile, or 0 if there are no values
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+@contextlib.contextmanager
+def replay_config(guild_config: dict) -> Iterator[None]:
+    """Points the guild config system at a temporary folder holding the replay
+    guild config, so config is still read from disk like it is in the bot
+
+    Args:
+        guild_config (dict): The config of the replay guild
+    """
+    original_path = configuration.config.BASE_PATH
+    default_path = os.path.join(
+        os.path.dirname(configuration.config.__file__), "config.default.json"
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        shutil.copy(default_path, config_dir)
+        os.makedirs(os.path.join(config_dir, "guild_configs"))
+        with open(
+            os.path.join(config_dir, "guild_configs", f"{GUILD_ID}.json"),
+            "w",
+            encoding="utf8",
+        ) as config_file:
+            json.dump(guild_config, config_file)
+
+        configuration.config.BASE_PATH = config_dir + os.sep
+        try:
+            yield
+        finally:
+            configuration.config.BASE_PATH = original_path
+
+
+class FakeLogger:
+    """Stands in for the bot logger, keeping errors so they can be reported"""
+
+    def __init__(self: Self) -> None:
+        self.errors: list[str] = []
+
+    async def send_log(
+        self: Self,
+        message: str,
+        level: LogLevel = LogLevel.INFO,
+        exception: Exception = None,
+        **kwargs: object,
+    ) -> None:
+        """Drops a log, unless it is an error
+
+        Args:
+            message (str): The message of the log
+            level (LogLevel, optional): The level of the log. Defaults to LogLevel.INFO.
+            exception (Exception, optional): The exception of the log. Defaults to None.
+            **kwargs (object): The context and channel of the log, which are ignored
+        """
+        if level == LogLevel.ERROR:
+            self.errors.append(f"{message} {exception!r}" if exception else message)
+
+
+class FakeHTTP:
+    """Stands in for the bot HTTP functions, counting calls as API calls
+
+    Args:
+        transport (fake_discord.FakeTransport): The transport to count calls with
+    """
+
+    def __init__(self: Self, transport: fake_discord.FakeTransport) -> None:
+        self.transport = transport
+
+    async def http_call(
+        self: Self, method: str, url: str, *args: object, **kwargs: object
+    ) -> munch.Munch:
+        """Makes a fake HTTP call, which always succeeds
+
+        Args:
+            method (str): The HTTP method
+            url (str): The URL called
+            *args (object): Other arguments of the call, which are ignored
+            **kwargs (object): The headers and data of the call, which are ignored
+
+        Returns:
+            munch.Munch: A response with a made up URL, as the paste service returns
+        """
+        await self.transport.request(f"{method.upper()} {url.split('/')[2]}")
+        return munch.Munch(url=f"https://paste.invalid/{hash(url) & 0xFFFF:x}")
+
+
+class ReplayBot:
+    """The parts of the bot that extensions use while handling events
+
+    Args:
+        transport (fake_discord.FakeTransport): The transport to count API calls with
+        database (fake_database.FakeDatabase): The in memory database
+
+    Attributes:
+        EXTENSIONS_DIR_NAME (str): The folder the extensions are in
+        guilds (list[fake_discord.FakeGuild]): The guilds the bot is in
+    """
+
+    EXTENSIONS_DIR_NAME: str = "modules"
+
+    def __init__(
+        self: Self,
+        transport: fake_discord.FakeTransport,
+        database: fake_database.FakeDatabase,
+    ) -> None:
+        self.transport = transport
+        self.db = database
+        self.models = database.models
+        self.guild = fake_discord.FakeGuild(transport, GUILD_ID, CATEGORY_ID)
+        self.user = self.guild.me
+        self.logger = FakeLogger()
+        self.http_functions = FakeHTTP(transport)
+        self.startup_timeline = startup.StartupTimeline()
+        self.cogs: dict[str, cogs.BaseCog] = {}
+        self.irc = None
+
+        with open("config.default.yml", encoding="utf8") as iostream:
+            self.file_config = munch.munchify(yaml.safe_load(iostream))
+        self.file_config.api.api_url.linx = "https://linx.invalid/upload"
+        self.file_config.api.irc.enable_irc = False
+
+    @property
+    def guilds(self: Self) -> list[fake_discord.FakeGuild]:
+        """The guilds the bot is in
+
+        Returns:
+            list[fake_discord.FakeGuild]: The replay guild
+        """
+        return [self.guild]
+
+    async def wait_until_ready(self: Self) -> None:
+        """The replay bot is always ready"""
+
+    def get_guild(self: Self, guild_id: int) -> fake_discord.FakeGuild:
+        """Gets a guild from the cache
+
+        Args:
+            guild_id (int): The ID of the guild
+
+        Returns:
+            fake_discord.FakeGuild: The replay guild, or None for any other ID
+        """
+        return self.guild if guild_id == self.guild.id else None
+
+    def get_channel(self: Self, channel_id: int) -> fake_discord.FakeChannel:
+        """Gets a channel from the cache
+
+        Args:
+            channel_id (int): The ID of the channel
+
+        Returns:
+            fake_discord.FakeChannel: The channel, or None if it was never made
+        """
+        return self.guild.get_channel(channel_id)
+
+    async def get_context(
+        self: Self, message: fake_discord.FakeMessage
+    ) -> fake_discord.FakeContext:
+        """Makes the context for a message
+
+        Args:
+            message (fake_discord.FakeMessage): The message to make the context for
+
+        Returns:
+            fake_discord.FakeContext: The context
+        """
+        return fake_discord.FakeContext(self, message)
+
+    async def get_prefix(self: Self, message: fake_discord.FakeMessage) -> str:
+        """Gets the command prefix, the same way the bot does
+
+        Args:
+            message (fake_discord.FakeMessage): The message to get the prefix for
+
+        Returns:
+            str: The command prefix of the guild
+        """
+        return configuration.get_config_entry(message.guild.id, "core_command_prefix")
+
+    async def add_cog(self: Self, cog: cogs.BaseCog) -> None:
+        """Adds a cog, called by the setup function of each extension
+
+        Args:
+            cog (cogs.BaseCog): The cog to add
+        """
+        self.cogs[cog.qualified_name] = cog
+
+    async def remove_cog(self: Self, cog: cogs.BaseCog) -> None:
+        """Removes a cog, which happens if its preconfig fails
+
+        Args:
+            cog (cogs.BaseCog): The cog to remove
+        """
+        self.cogs.pop(cog.qualified_name, None)
+
+
+@dataclasses.dataclass
+class EventStats:
+    """The measurements of a single type of event
+
+    Attributes:
+        latencies (list[float]): How long each event took to handle, in seconds
+        db_queries (int): The database queries made while handling the events
+        rest_calls (int): The API calls made while handling the events
+        skipped (int): Events that were skipped, as they referred to an unknown message
+    """
+
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    db_queries: int = 0
+    rest_calls: int = 0
+    skipped: int = 0
+
+    def to_dict(self: Self) -> dict[str, float]:
+        """Summarizes the measurements
+
+        Returns:
+            dict[str, float]: The event count, latency percentiles in milliseconds,
+                and the queries and API calls per event
+        """
+        count = len(self.latencies)
+        return {
+            "events": count,
+            "skipped": self.skipped,
+            "p50_ms": percentile(self.latencies, 0.5) * 1000,
+            "p99_ms": percentile(self.latencies, 0.99) * 1000,
+            "db_queries_per_event": self.db_queries / count if count else 0,
+            "rest_calls_per_event": self.rest_calls / count if count else 0,
+        }
+
+
+@dataclasses.dataclass
+class ReplayResult:
+    """The measurements of a whole replay
+
+    Attributes:
+        extensions (tuple[str, ...]): The extensions that were replayed
+        duration (float): How long the replay took, in seconds
+        events (dict[str, EventStats]): The measurements of each type of event
+        background_db_queries (int): Queries made by background work after the replay
+        background_rest_calls (int): API calls made by background work after the replay
+        db_queries (collections.Counter[str]): Every query made, by table and operation
+        rest_calls (collections.Counter[str]): Every API call made, by route
+        errors (list[str]): Errors raised or logged by the extensions
+    """
+
+    extensions: tuple[str, ...]
+    duration: float
+    events: dict[str, EventStats]
+    background_db_queries: int
+    background_rest_calls: int
+    db_queries: collections.Counter[str]
+    rest_calls: collections.Counter[str]
+    errors: list[str]
+
+    def to_dict(self: Self) -> dict:
+        """Summarizes the replay, for saving as JSON
+
+        Returns:
+            dict: The summary, with the headline numbers at the top level
+        """
+        messages = self.events.get("message", EventStats())
+        message_count = len(messages.latencies)
+        return {
+            "extensions": list(self.extensions),
+            "duration_seconds": self.duration,
+            "messages_per_second": (
+                message_count / self.duration if self.duration else 0
+            ),
+            "message_p50_ms": percentile(messages.latencies, 0.5) * 1000,
+            "message_p99_ms": percentile(messages.latencies, 0.99) * 1000,
+            "db_queries_per_message": (
+                (messages.db_queries + self.background_db_queries) / message_count
+                if message_count
+                else 0
+            ),
+            "rest_calls_per_message": (
+                (messages.rest_calls + self.background_rest_calls) / message_count
+                if message_count
+                else 0
+            ),
+            "events": {
+                event_type: stats.to_dict() for event_type, stats in self.events.items()
+            },
+            "db_queries": dict(self.db_queries.most_common()),
+            "rest_calls": dict(self.rest_calls.most_common()),
+            "errors": len(self.errors),
+        }
+
+    def build_report(self: Self) -> str:
+        """Builds a plain text report of the replay
+
+        Returns:
+            str: The report, one line per measurement
+        """
+        summary = self.to_dict()
+        lines = [
+            f"Extensions: {', '.join(self.extensions)}",
+            f"Messages/sec: {summary['messages_per_second']:.1f}"
+            f" ({self.duration:.2f} s total)",
+            f"Message handler latency: p50 {summary['message_p50_ms']:.3f} ms,"
+            f" p99 {summary['message_p99_ms']:.3f} ms",
+            f"DB queries/message: {summary['db_queries_per_message']:.3f}",
+            f"REST calls/message: {summary['rest_calls_per_message']:.3f}",
+            "Events:",
+        ]
+        for event_type, stats in summary["events"].items():
+            lines.append(
+                f"  {event_type:<14} {stats['events']:>7} events"
+                f"  p50 {stats['p50_ms']:>8.3f} ms  p99 {stats['p99_ms']:>8.3f} ms"
+                f"  db {stats['db_queries_per_event']:.3f}"
+                f"  rest {stats['rest_calls_per_event']:.3f}"
+            )
+        lines.append("DB queries: " + format_counter(self.db_queries))
+        lines.append("REST calls: " + format_counter(self.rest_calls))
+        lines.append(f"Errors: {len(self.errors)}")
+        lines.extend(f"  {error}" for error in self.errors[:10])
+        return "\n".join(lines)
+
+
+def format_counter(counter: collections.Counter[str]) -> str:
+    """Formats call counts as a single line, most common first
+
+    Args:
+        counter (collections.Counter[str]): The counts
+
+    Returns:
+        str: The counts, comma separated, or "none" if there are none
+    """
+    return ", ".join(f"{name} {count}" for name, count in counter.most_common()) or (
+        "none"
+    )
+
+
+class GatewayReplay:
+    """Loads extensions on a replay bot, and replays events through them
+
+    Args:
+        extensions (tuple[str, ...], optional): The extensions to replay through.
+            Defaults to DEFAULT_EXTENSIONS.
+        rest_latency (float, optional): The simulated time of each API call,
+            in seconds. Defaults to 0.
+        db_latency (float, optional): The simulated time of each database query,
+            in seconds. Defaults to 0.
+    """
+
+    def __init__(
+        self: Self,
+        extensions: tuple[str, ...] = DEFAULT_EXTENSIONS,
+        rest_latency: float = 0,
+        db_latency: float = 0,
+    ) -> None:
+        self.extensions = extensions
+        self.transport = fake_discord.FakeTransport(rest_latency)
+        self.database = fake_database.FakeDatabase(db_latency)
+        self.bot = ReplayBot(self.transport, self.database)
+        self.messages: dict[int, fake_discord.FakeMessage] = {}
+        self.listeners: dict[str, list[Callable]] = collections.defaultdict(list)
+
+        for factoid_name, factoid_message in FACTOIDS.items():
+            self.database.models.Factoid.add(
+                name=factoid_name,
+                guild=str(GUILD_ID),
+                message=factoid_message,
+                alias=None,
+                disabled=False,
+                restricted=False,
+                hidden=False,
+            )
+        for channel_id in (GENERAL_CHANNEL_ID, HELP_CHANNEL_ID, LOG_CHANNEL_ID):
+            self.bot.guild.make_channel(channel_id)
+
+    async def fake_file_hash(self: Self, url: str) -> str:
+        """Stands in for hashing an attachment, which downloads it
+
+        Args:
+            url (str): The URL of the attachment
+
+        Returns:
+            str: A hash of the URL
+        """
+        await self.transport.request("download attachment")
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    async def load_extensions(self: Self) -> None:
+        """Loads every extension with its own setup function, and waits for preconfig"""
+        for extension in self.extensions:
+            module = importlib.import_module(
+                f"{self.bot.EXTENSIONS_DIR_NAME}.{extension}"
+            )
+            await module.setup(self.bot)
+
+        await asyncio.gather(
+            *(cog.preconfig_task for cog in list(self.bot.cogs.values()))
+        )
+
+        for cog in self.bot.cogs.values():
+            for event_name, listener in cog.get_listeners():
+                self.listeners[event_name].append(listener)
+
+    async def unload_extensions(self: Self) -> None:
+        """Unloads every cog, so background workers are stopped"""
+        for cog in self.bot.cogs.values():
+            await discord.utils.maybe_coroutine(cog.cog_unload)
+
+    async def wait_for_background_work(self: Self) -> None:
+        """Waits for work that extensions queued to be done later, such as pastes"""
+        for cog in self.bot.cogs.values():
+            queue = getattr(cog, "paste_queue", None)
+            if queue:
+                await queue.join()
+
+    def build_dispatches(self: Self, event: dict) -> list[tuple[str, tuple]]:
+        """Applies an event to the replay guild, and builds the gateway events it causes
+
+        Args:
+            event (dict): The event to apply
+
+        Returns:
+            list[tuple[str, tuple]]: The name and arguments of every listener
+                event to dispatch, or an empty list if the event was skipped
+        """
+        guild = self.bot.guild
+        event_type = event["type"]
+
+        if event_type == "message":
+            channel = guild.make_channel(event["channel_id"])
+            author = guild.make_member(event["author_id"], event.get("author_name"))
+            attachments = [
+                fake_discord.FakeAttachment(
+                    self.transport,
+                    guild.next_id(),
+                    attachment["filename"],
+                    attachment["size"],
+                )
+                for attachment in event.get("attachments", [])
+            ]
+            message = fake_discord.FakeMessage(
+                event["message_id"], channel, author, event["content"], attachments
+            )
+            channel.messages[message.id] = message
+            self.messages[message.id] = message
+            message_window.recent_messages.add_message(message)
+            return [("on_message", (message,))]
+
+        if event_type == "member_update":
+            after = guild.make_member(event["member_id"])
+            before = copy.copy(after)
+            after.nick = event.get("nick")
+            return [("on_member_update", (before, after))]
+
+        before = self.messages.get(event["message_id"])
+        if not before:
+            return []
+
+        if event_type == "edit":
+            after = copy.copy(before)
+            after.content = event["content"]
+            after.edited_at = datetime.datetime.now(datetime.UTC)
+            after.channel.messages[after.id] = after
+            self.messages[after.id] = after
+            message_window.recent_messages.edit_message(after)
+            payload = types.SimpleNamespace(
+                guild_id=guild.id,
+                channel_id=after.channel.id,
+                message_id=after.id,
+                cached_message=before,
+                message=after,
+            )
+            return [
+                ("on_message_edit", (before, after)),
+                ("on_raw_message_edit", (payload,)),
+            ]
+
+        user = guild.make_member(event["user_id"])
+        reaction = types.SimpleNamespace(message=before, emoji=event["emoji"], count=1)
+        payload = types.SimpleNamespace(
+            guild_id=guild.id,
+            channel_id=before.channel.id,
+            message_id=before.id,
+            user_id=user.id,
+            member=user,
+            emoji=event["emoji"],
+        )
+        return [
+            ("on_reaction_add", (reaction, user)),
+            ("on_raw_reaction_add", (payload,)),
+        ]
+
+    async def replay(self: Self, events: list[dict]) -> ReplayResult:
+        """Replays events one at a time, timing every listener of each event together
+
+        Args:
+            events (list[dict]): The events to replay
+
+        Returns:
+            ReplayResult: The measurements of the replay
+        """
+        stats: dict[str, EventStats] = collections.defaultdict(EventStats)
+        errors: list[str] = []
+        message_window.recent_messages.clear()
+
+        with (
+            replay_config(build_guild_config(self.extensions)),
+            mock.patch.object(auxiliary, "stream_file_hash", self.fake_file_hash),
+        ):
+            await self.load_extensions()
+            # Preconfig isn't part of the replay, so its calls aren't counted
+            setup_queries = collections.Counter(self.database.queries)
+            setup_calls = collections.Counter(self.transport.calls)
+
+            replay_start = time.perf_counter()
+            for event in events:
+                event_stats = stats[event["type"]]
+                dispatches = self.build_dispatches(event)
+                if not dispatches:
+                    event_stats.skipped += 1
+                    continue
+
+                queries_before = self.database.total
+                calls_before = self.transport.total
+                start = time.perf_counter()
+                results = await asyncio.gather(
+                    *(
+                        listener(*args)
+                        for event_name, args in dispatches
+                        for listener in self.listeners.get(event_name, [])
+                    ),
+                    return_exceptions=True,
+                )
+                event_stats.latencies.append(time.perf_counter() - start)
+                event_stats.db_queries += self.database.total - queries_before
+                event_stats.rest_calls += self.transport.total - calls_before
+                errors.extend(
+                    f"{event['type']}: {result!r}"
+                    for result in results
+                    if isinstance(result, Exception)
+                )
+
+            handled_queries = self.database.total
+            handled_calls = self.transport.total
+            await self.wait_for_background_work()
+            duration = time.perf_counter() - replay_start
+            await self.unload_extensions()
+
+        return ReplayResult(
+            extensions=self.extensions,
+            duration=duration,
+            events=dict(stats),
+            background_db_queries=self.database.total - handled_queries,
+            background_rest_calls=self.transport.total - handled_calls,
+            db_queries=self.database.queries - setup_queries,
+            rest_calls=self.transport.calls - setup_calls,
+            errors=errors + self.bot.logger.errors,
+        )
+
+
+async def run_benchmark(args: argparse.Namespace) -> ReplayResult:
+    """Replays the events asked for on the command line
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments
+
+    Returns:
+        ReplayResult: The measurements of the replay
+    """
+    if args.events:
+        events = load_events(args.events)
+    else:
+        events = generate_events(args.count, args.seed)
+
+    replay = GatewayReplay(
+        extensions=tuple(args.extensions.split(",")),
+        rest_latency=args.rest_latency_ms / 1000,
+        db_latency=args.db_latency_ms / 1000,
+    )
+    return await replay.replay(events)
+
+
+def main() -> None:
+    """Runs the benchmark, printing the report and optionally saving it as JSON"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", help="A JSON lines file of recorded events")
+    parser.add_argument(
+        "--count", type=int, default=2000, help="How many events to generate"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="The generator seed")
+    parser.add_argument(
+        "--extensions",
+        default=",".join(DEFAULT_EXTENSIONS),
+        help="A comma separated list of extensions to replay through",
+    )
+    parser.add_argument(
+        "--rest-latency-ms", type=float, default=0, help="Simulated API call time"
+    )
+    parser.add_argument(
+        "--db-latency-ms", type=float, default=0, help="Simulated query time"
+    )
+    parser.add_argument("--output", help="A file to save the results to, as JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args))
+    print(result.build_report())
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as output_file:
+            json.dump(result.to_dict(), output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
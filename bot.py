@@ -10,6 +10,8 @@ import io
 import os
 import sys
 import threading
+import time
+from collections.abc import Awaitable, Callable
 from typing import Self
 
 import discord
@@ -25,7 +27,21 @@ import configuration
 import ircrelay
 import ui
 from botlogging import LogContext, LogLevel
-from core import auxiliary, custom_errors, databases, http, scheduler
+from core import (
+    app_command_sync,
+    auxiliary,
+    command_checks,
+    custom_errors,
+    databases,
+    http,
+    lazy_extensions,
+    loop_monitor,
+    message_window,
+    metrics,
+    rate_limit,
+    scheduler,
+    startup,
+)
 
 loop = asyncio.new_event_loop()
 asyncio.set_event_loop(loop)
@@ -45,6 +61,8 @@ class TechSupportBot(commands.Bot):
         CONFIG_PATH (str): The hard coded path to the yaml config file
         EXTENSIONS_DIR_NAME (str): The hardcoded folder for commands
         EXTENSIONS_DIR (str): The list of all files in the EXTENSIONS_DIR_NAME folder
+        OWNER_REFRESH_SECONDS (int): How long the owner is cached before it is looked up again
+        MANIFEST_PATH (str): The path to the manifest used to load extensions lazily
     """
 
     CONFIG_PATH: str = os.environ.get("CONFIG_YML", "./config.yml")
@@ -52,36 +70,70 @@ class TechSupportBot(commands.Bot):
     EXTENSIONS_DIR: str = (
         f"{os.path.join(os.path.dirname(__file__))}/{EXTENSIONS_DIR_NAME}"
     )
+    OWNER_REFRESH_SECONDS: int = 3600
+    MANIFEST_PATH: str = os.environ.get(
+        "EXTENSION_MANIFEST", "./extension_manifest.json"
+    )
 
     def __init__(
         self: Self, intents: discord.Intents, allowed_mentions: discord.AllowedMentions
     ) -> None:
         # Sets a few properires to None to avoid ValueErrors later on
         self.startup_time: datetime = None
+        self.startup_timeline = startup.StartupTimeline()
         self.owner: discord.User = None
+        self.owner_expires: datetime.datetime = None
         self.guild_config_lock = None
         self.db = None
         self.file_config = None
 
         # Sets up some dicts and arrays
         self.extension_states = munch.DefaultMunch(None)
+        # The stub commands of extensions that haven't been imported yet
+        self.lazy_extensions: dict[str, list[commands.Command]] = {}
+        self.lazy_extension_locks: dict[str, asyncio.Lock] = {}
         self.command_rate_limit_bans: expiringdict.ExpiringDict[str, bool] = (
             expiringdict.ExpiringDict(
                 max_len=5000,
                 max_age_seconds=600,
             )
         )
-        self.command_execute_history: dict[str, dict[int, bool]] = {}
-        self.notified_dm_log: list[int] = []
+        self.command_rate_limiter = rate_limit.RateLimiter(max_keys=20000)
+        self.notified_dm_log: expiringdict.ExpiringDict[int, bool] = (
+            expiringdict.ExpiringDict(
+                max_len=10000,
+                max_age_seconds=604800,
+            )
+        )
+        self.admin_ids: frozenset[int] = frozenset()
+        self.admin_role_names: frozenset[str] = frozenset()
+        # Whether a member has an admin role, by guild ID and member ID
+        self.admin_role_verdicts: expiringdict.ExpiringDict[tuple[int, int], bool] = (
+            expiringdict.ExpiringDict(
+                max_len=10000,
+                max_age_seconds=3600,
+            )
+        )
+
+        self.check_planner = command_checks.CheckPlanner(self.EXTENSIONS_DIR_NAME)
+        # The timed wrapper of every listener, by event name and listener
+        self.timed_listeners: dict[
+            tuple[str, Callable[..., Awaitable[None]]], Callable[..., Awaitable[None]]
+        ] = {}
+        self.metrics_runner = None
+        self.metrics_collector: Callable[[], None] = None
+        self.loop_watchdog = None
 
         # Loads the file config, which includes things like the token
         self.load_file_config()
 
         # Call the discord.py init function to create a new commands.Bot object
+        # The trace counts every request discord.py makes to the REST API
         super().__init__(
             command_prefix=self.get_prefix,
             intents=intents,
             allowed_mentions=allowed_mentions,
+            http_trace=metrics.create_discord_trace(),
         )
 
         # Setup the regular or delayed logger, depending on the file config
@@ -102,6 +154,9 @@ class TechSupportBot(commands.Bot):
         # Creates a http calls class and a reference to it to the bot
         self.http_functions = http.HTTPCalls(self)
 
+        # Commands that ran are logged together every few seconds
+        self.command_audit_log = command_checks.CommandAuditLog(self)
+
         # Set the app command on error function to log errors in slash commands
         self.tree.on_error = self.on_app_command_error
 
@@ -121,10 +176,49 @@ class TechSupportBot(commands.Bot):
         if isinstance(self.logger, botlogging.DelayedLogger):
             self.logger.register_queue()
             asyncio.create_task(self.logger.run())
+        asyncio.create_task(self.command_audit_log.run())
+
+        # Watch for code that blocks the event loop, if a threshold is set
+        lag_threshold_ms = self.file_config.bot_config.get("loop_lag_threshold_ms")
+        if lag_threshold_ms:
+            self.loop_watchdog = loop_monitor.LoopWatchdog(
+                self, threshold=lag_threshold_ms / 1000
+            )
+            self.loop_watchdog.start()
 
-        # Start the IRC bot in an asynchronous task
+        # IRC and postgres don't depend on each other, so connect to both at once
         irc_config = self.file_config.api.irc
+        startup_stages = [self.connect_postgres()]
         if irc_config.enable_irc:
+            startup_stages.append(self.connect_irc())
+        await asyncio.gather(*startup_stages)
+
+        await self.logger.send_log(
+            message="Logging into Discord...", level=LogLevel.DEBUG, console_only=True
+        )
+        self.guild_config_lock = asyncio.Lock()
+        self.startup_timeline.mark("login started")
+        await super().start(self.file_config.bot_config.auth_token)
+
+    async def close(self: Self) -> None:
+        """Stops the loop watchdog and the metrics server, and closes the attachment
+        download session, then closes the connection to discord
+        See: https://discordpy.readthedocs.io/en/latest/api.html#discord.Client.close
+        """
+        if self.loop_watchdog:
+            self.loop_watchdog.stop()
+        if self.metrics_runner:
+            await self.metrics_runner.cleanup()
+            self.metrics_runner = None
+        if self.metrics_collector:
+            metrics.registry.remove_collector(self.metrics_collector)
+            self.metrics_collector = None
+        await auxiliary.close_download_session()
+        await super().close()
+
+    async def connect_irc(self: Self) -> None:
+        """Starts the IRC bot, and times how long it took"""
+        with self.startup_timeline.time_stage("irc"):
             await self.logger.send_log(
                 message="Connecting to IRC...", level=LogLevel.DEBUG, console_only=True
             )
@@ -132,17 +226,17 @@ class TechSupportBot(commands.Bot):
             # We need to pass it the running loop so it can interact with discord
             await self.start_irc()
 
-        # this is required for the bot
-        await self.logger.send_log(
-            message="Connecting to Postgres...", level=LogLevel.DEBUG, console_only=True
-        )
-        self.db = await self.get_postgres_ref()
-
-        await self.logger.send_log(
-            message="Logging into Discord...", level=LogLevel.DEBUG, console_only=True
-        )
-        self.guild_config_lock = asyncio.Lock()
-        await super().start(self.file_config.bot_config.auth_token)
+    async def connect_postgres(self: Self) -> None:
+        """Binds to postgres, and times how long it took
+        This is required for the bot
+        """
+        with self.startup_timeline.time_stage("postgres"):
+            await self.logger.send_log(
+                message="Connecting to Postgres...",
+                level=LogLevel.DEBUG,
+                console_only=True,
+            )
+            self.db = await self.get_postgres_ref()
 
     # Discord.py called functions
 
@@ -161,15 +255,20 @@ class TechSupportBot(commands.Bot):
         )
         self.remove_command("help")
 
+        if self.file_config.bot_config.get("metrics_port"):
+            await self.start_metrics_server()
+
         # Get all the tables setup and create them all if needed
         await self.logger.send_log(
             message="Syncing Postgres tables...",
             level=LogLevel.DEBUG,
             console_only=True,
         )
-        self.models = munch.DefaultMunch(None)
-        databases.setup_models(self)
-        await self.db.gino.create_all()
+        with self.startup_timeline.time_stage("postgres tables"):
+            self.models = munch.DefaultMunch(None)
+            databases.setup_models(self)
+            await self.db.gino.create_all()
+            await databases.create_missing_indexes(self)
 
         # Adds persistent views to the bot
         self.add_view(ui.VotingButtonPersistent())
@@ -184,11 +283,64 @@ class TechSupportBot(commands.Bot):
             message="Loading extensions...", level=LogLevel.DEBUG, console_only=True
         )
         self.extension_name_list = []
-        await self.load_extensions()
+        with self.startup_timeline.time_stage("extensions"):
+            await self.load_extensions()
+
+        # Only scopes of the command tree that changed are synced,
+        # so this costs nothing on a normal restart
+        if self.file_config.bot_config.get("auto_sync_app_commands"):
+            with self.startup_timeline.time_stage("app command sync"):
+                await self.auto_sync_app_commands()
 
         # Star the scheduler
         await self.scheduler.start()
 
+    async def auto_sync_app_commands(self: Self) -> None:
+        """Syncs the slash commands that changed since the last sync"""
+        try:
+            synced = await app_command_sync.sync_changed_scopes(self)
+        except discord.HTTPException as exception:
+            await self.logger.send_log(
+                message="Could not sync slash commands on startup",
+                level=LogLevel.ERROR,
+                console_only=True,
+                exception=exception,
+            )
+            return
+
+        await self.logger.send_log(
+            message=f"Synced slash commands in {len(synced)} changed scope(s)",
+            level=LogLevel.INFO,
+            console_only=True,
+        )
+        if app_command_sync.GLOBAL_SCOPE in synced:
+            self.dispatch("app_commands_synced", synced[app_command_sync.GLOBAL_SCOPE])
+
+    async def start_metrics_server(self: Self) -> None:
+        """Starts serving the metrics of the bot over HTTP, for prometheus to scrape"""
+        host = self.file_config.bot_config.get("metrics_host") or "127.0.0.1"
+        port = self.file_config.bot_config.metrics_port
+        # The registry is global, so the bot is only ever added to it once
+        if self.metrics_collector is None:
+            self.metrics_collector = lambda: metrics.collect_bot_metrics(self)
+            metrics.registry.add_collector(self.metrics_collector)
+        try:
+            self.metrics_runner = await metrics.start_server(host, port)
+        except OSError as exception:
+            await self.logger.send_log(
+                message=f"Could not serve metrics on {host}:{port}",
+                level=LogLevel.ERROR,
+                console_only=True,
+                exception=exception,
+            )
+            return
+
+        await self.logger.send_log(
+            message=f"Serving metrics on http://{host}:{port}/metrics",
+            level=LogLevel.INFO,
+            console_only=True,
+        )
+
     async def on_guild_remove(self: Self, guild: discord.Guild) -> None:
         """See: https://discordpy.readthedocs.io/en/latest/api.html#discord.on_guild_remove
 
@@ -200,6 +352,7 @@ class TechSupportBot(commands.Bot):
             level=LogLevel.INFO,
             console_only=True,
         )
+        message_window.recent_messages.remove_guild(guild.id)
 
     async def on_error(self: Self, event_method: str) -> None:
         """Catches non-command errors and sends them to the error logger for processing.
@@ -216,6 +369,10 @@ class TechSupportBot(commands.Bot):
 
     async def on_connect(self: Self) -> None:
         """See: https://discordpy.readthedocs.io/en/latest/api.html#discord.on_connect"""
+        # A new session means events may have been missed, so the window has gaps
+        # and role changes that admin verdicts depend on may have been lost
+        message_window.recent_messages.clear()
+        self.admin_role_verdicts.clear()
         await self.logger.send_log(
             message="Connected to Discord",
             level=LogLevel.INFO,
@@ -224,6 +381,8 @@ class TechSupportBot(commands.Bot):
 
     async def on_resumed(self: Self) -> None:
         """See: https://discordpy.readthedocs.io/en/latest/api.html#discord.on_resumed"""
+        # Role changes may have been missed while the connection was down
+        self.admin_role_verdicts.clear()
         await self.logger.send_log(
             message="Resume connection to discord",
             level=LogLevel.INFO,
@@ -273,6 +432,14 @@ class TechSupportBot(commands.Bot):
         )
         await self.get_owner()
 
+        if "ready" not in self.startup_timeline.stages:
+            self.startup_timeline.mark("ready")
+            await self.logger.send_log(
+                message=("Startup timeline:\n" + self.startup_timeline.build_report()),
+                level=LogLevel.INFO,
+                console_only=True,
+            )
+
     # DM Logging
 
     async def log_DM(self: Self, sent_from: str, source: str, content: str) -> None:
@@ -303,6 +470,8 @@ class TechSupportBot(commands.Bot):
         Args:
             message (discord.Message): the message object
         """
+        message_window.recent_messages.add_message(message)
+
         owner = await self.get_owner()
         if (
             owner
@@ -311,7 +480,7 @@ class TechSupportBot(commands.Bot):
             and not message.author.bot
         ):
             if message.author.id not in self.notified_dm_log:
-                self.notified_dm_log.append(message.author.id)
+                self.notified_dm_log[message.author.id] = True
                 await message.author.send(
                     "All DMs sent to this bot are permanently logged and not "
                     "regularly checked. No responses will be given to any messages."
@@ -328,6 +497,92 @@ class TechSupportBot(commands.Bot):
 
         await self.process_commands(message)
 
+    async def on_raw_message_edit(
+        self: Self, payload: discord.RawMessageUpdateEvent
+    ) -> None:
+        """Keeps edited messages up to date in the recent message window
+
+        Args:
+            payload (discord.RawMessageUpdateEvent): The edit event, including the new message
+        """
+        message_window.recent_messages.edit_message(payload.message)
+
+    async def on_raw_message_delete(
+        self: Self, payload: discord.RawMessageDeleteEvent
+    ) -> None:
+        """Removes deleted messages from the recent message window
+
+        Args:
+            payload (discord.RawMessageDeleteEvent): The delete event
+        """
+        message_window.recent_messages.delete_messages(
+            payload.guild_id, payload.channel_id, [payload.message_id]
+        )
+
+    async def on_raw_bulk_message_delete(
+        self: Self, payload: discord.RawBulkMessageDeleteEvent
+    ) -> None:
+        """Removes purged messages from the recent message window
+
+        Args:
+            payload (discord.RawBulkMessageDeleteEvent): The bulk delete event
+        """
+        message_window.recent_messages.delete_messages(
+            payload.guild_id, payload.channel_id, payload.message_ids
+        )
+
+    async def on_member_update(
+        self: Self, before: discord.Member, after: discord.Member
+    ) -> None:
+        """Forgets the admin verdict of a member whose roles have changed
+
+        Args:
+            before (discord.Member): The member before the update
+            after (discord.Member): The member after the update
+        """
+        if before.roles != after.roles:
+            self.admin_role_verdicts.pop((after.guild.id, after.id), None)
+
+    async def on_member_join(self: Self, member: discord.Member) -> None:
+        """Forgets the admin verdict of a member who joined,
+        as leaving a guild removes every role
+
+        Args:
+            member (discord.Member): The member who joined
+        """
+        self.admin_role_verdicts.pop((member.guild.id, member.id), None)
+
+    async def on_member_remove(self: Self, member: discord.Member) -> None:
+        """Forgets the admin verdict of a member who left
+
+        Args:
+            member (discord.Member): The member who left
+        """
+        self.admin_role_verdicts.pop((member.guild.id, member.id), None)
+
+    async def on_guild_role_update(
+        self: Self, before: discord.Role, after: discord.Role
+    ) -> None:
+        """Forgets every admin verdict when a role is renamed,
+        as admin roles are configured by name
+
+        Args:
+            before (discord.Role): The role before the update
+            after (discord.Role): The role after the update
+        """
+        if before.name != after.name:
+            self.admin_role_verdicts.clear()
+
+    async def on_guild_role_delete(self: Self, role: discord.Role) -> None:
+        """Forgets every admin verdict when a role is deleted,
+        as deleting a role doesn't update the members that had it
+
+        Args:
+            role (discord.Role): The role that was deleted
+        """
+        if role.name in self.admin_role_names:
+            self.admin_role_verdicts.clear()
+
     # File config loading functions
 
     def load_file_config(self: Self, validate: bool = True) -> None:
@@ -345,6 +600,13 @@ class TechSupportBot(commands.Bot):
             self.file_config.bot_config.disabled_extensions or []
         )
 
+        # Admins are checked on every command, so build the lookups once
+        admins = self.file_config.bot_config.admins
+        self.admin_ids = frozenset(int(admin_id) for admin_id in admins.ids or [])
+        self.admin_role_names = frozenset(admins.roles or [])
+        self.admin_role_verdicts.clear()
+        self.owner_expires = None
+
         if not validate:
             return
 
@@ -389,6 +651,7 @@ class TechSupportBot(commands.Bot):
             interaction (discord.Interaction): The interaction where the error occured at
             error (app_commands.AppCommandError): The error object that occured
         """
+        self.observe_app_command(interaction, "error")
         error_message = await self.handle_error(
             exception=error, channel=interaction.channel, guild=interaction.guild
         )
@@ -530,6 +793,7 @@ class TechSupportBot(commands.Bot):
         )
 
         await db_ref.set_bind(db_url)
+        metrics.instrument_engine(db_ref.bind)
 
         db_ref.Model.__table_args__ = {"extend_existing": True}
 
@@ -583,24 +847,218 @@ class TechSupportBot(commands.Bot):
         """
 
         self.logger.console.debug("Retrieving commands")
+        extension_names = []
         for extension_name in await self.get_potential_extensions():
             if extension_name in self.file_config.bot_config.disabled_extensions:
                 self.logger.console.debug(
                     f"{extension_name} is disabled on startup - ignoring load"
                 )
                 continue
+            extension_names.append(extension_name)
 
-            try:
-                await self.load_extension(
-                    f"{self.EXTENSIONS_DIR_NAME}.{extension_name}"
+        # With lazy extensions, any extension with only prefix commands that
+        # hasn't changed since the manifest was written is registered as stubs
+        lazy_mode = bool(self.file_config.bot_config.get("lazy_extensions"))
+        manifest = (
+            lazy_extensions.load_manifest(self.MANIFEST_PATH) if lazy_mode else {}
+        )
+        fingerprints: dict[str, str] = {}
+        lazy_names: set[str] = set()
+        if lazy_mode:
+            for extension_name in extension_names:
+                fingerprints[extension_name] = lazy_extensions.get_fingerprint(
+                    self.get_extension_path(extension_name)
                 )
+                entry = manifest.get(extension_name)
+                if (
+                    entry
+                    and entry["lazy_eligible"]
+                    and entry["fingerprint"] == fingerprints[extension_name]
+                ):
+                    lazy_names.add(extension_name)
+
+        # Importing is the slow part of loading, and doesn't need the event loop
+        # So import every extension in worker threads first
+        import_times = await asyncio.to_thread(
+            startup.import_modules,
+            [
+                f"{self.EXTENSIONS_DIR_NAME}.{name}"
+                for name in extension_names
+                if name not in lazy_names
+            ],
+        )
+
+        for extension_name in extension_names:
+            full_name = f"{self.EXTENSIONS_DIR_NAME}.{extension_name}"
+            setup_start = time.perf_counter()
+            if extension_name in lazy_names:
+                self.register_lazy_extension(extension_name, manifest[extension_name])
+                self.extension_name_list.append(extension_name)
+                self.startup_timeline.record_extension(
+                    extension_name, "setup", time.perf_counter() - setup_start
+                )
+                continue
+
+            self.startup_timeline.record_extension(
+                extension_name, "import", import_times[full_name]
+            )
+            try:
+                with startup.reuse_imported_module(full_name):
+                    await self.load_extension(full_name)
                 self.extension_name_list.append(extension_name)
+                if lazy_mode:
+                    manifest[extension_name] = lazy_extensions.describe_extension(
+                        self, extension_name, fingerprints[extension_name]
+                    )
             except Exception as exception:
                 self.logger.console.error(
                     f"Failed to load extension {extension_name}: {exception}"
                 )
                 if not graceful:
                     raise exception
+            finally:
+                self.startup_timeline.record_extension(
+                    extension_name, "setup", time.perf_counter() - setup_start
+                )
+
+        if lazy_mode:
+            self.logger.console.debug(
+                f"Registered {len(lazy_names)} extensions lazily, writing manifest"
+            )
+            try:
+                lazy_extensions.save_manifest(self.MANIFEST_PATH, manifest)
+            except OSError as exception:
+                self.logger.console.error(
+                    f"Failed to write the extension manifest: {exception}"
+                )
+
+    def get_extension_path(self: Self, extension_name: str) -> str:
+        """Gets the path to the file of an extension
+
+        Args:
+            extension_name (str): The dotted extension name, without the modules prefix
+
+        Returns:
+            str: The path to the python file of the extension
+        """
+        return os.path.join(self.EXTENSIONS_DIR, *extension_name.split(".")) + ".py"
+
+    def register_lazy_extension(self: Self, extension_name: str, entry: dict) -> None:
+        """Registers stub commands for an extension, without importing it
+
+        Args:
+            extension_name (str): The dotted extension name, without the modules prefix
+            entry (dict): The manifest entry of the extension
+        """
+        stubs = lazy_extensions.build_stub_commands(
+            extension_name,
+            f"{self.EXTENSIONS_DIR_NAME}.{extension_name}",
+            entry,
+            self.load_lazy_extension,
+        )
+        for stub in stubs:
+            self.add_command(stub)
+        self.lazy_extensions[extension_name] = stubs
+
+    async def load_lazy_extension(
+        self: Self, ctx: commands.Context, extension_name: str
+    ) -> None:
+        """Loads the real extension behind a stub command, then runs the real command
+        The command isn't run until the preconfig of the new cogs has finished
+
+        Args:
+            ctx (commands.Context): The context the stub command was run in
+            extension_name (str): The dotted extension name, without the modules prefix
+        """
+        full_name = f"{self.EXTENSIONS_DIR_NAME}.{extension_name}"
+        lock = self.lazy_extension_locks.setdefault(extension_name, asyncio.Lock())
+        async with lock:
+            if extension_name in self.lazy_extensions:
+                # Another extension may have imported it already
+                with startup.reuse_imported_module(full_name):
+                    await self.load_extension(full_name)
+                await asyncio.gather(
+                    *(
+                        cog.preconfig_task
+                        for cog in self.cogs.values()
+                        if cog.__module__ == full_name
+                        and hasattr(cog, "preconfig_task")
+                    )
+                )
+
+        # The stub already fired on_command and passed the global checks, so the
+        # real command is run directly, to not log or rate limit it twice
+        new_ctx = await self.get_context(ctx.message)
+        if new_ctx.command is None:
+            return
+        try:
+            await new_ctx.command.invoke(new_ctx)
+        except commands.CommandError as exception:
+            await new_ctx.command.dispatch_error(new_ctx, exception)
+
+    async def load_extension(self: Self, name: str, *, package: str = None) -> None:
+        """Loads an extension, and lets cogs know the commands have changed
+        See: https://discordpy.readthedocs.io/en/latest/ext/commands/api.html
+
+        Args:
+            name (str): The dotted path of the extension to load
+            package (str, optional): The package to resolve relative imports with.
+                Defaults to None.
+
+        Raises:
+            exception: Any exception raised while loading the extension
+        """
+        # A lazy extension has stub commands that the real commands replace
+        extension_name = name.removeprefix(f"{self.EXTENSIONS_DIR_NAME}.")
+        stubs = self.lazy_extensions.pop(extension_name, [])
+        for stub in stubs:
+            self.remove_command(stub.name)
+
+        try:
+            await super().load_extension(name, package=package)
+        except Exception as exception:
+            if stubs:
+                for stub in stubs:
+                    self.add_command(stub)
+                self.lazy_extensions[extension_name] = stubs
+            raise exception
+        self.dispatch("commands_changed")
+
+    async def unload_extension(self: Self, name: str, *, package: str = None) -> None:
+        """Unloads an extension, and lets cogs know the commands have changed
+        See: https://discordpy.readthedocs.io/en/latest/ext/commands/api.html
+
+        Args:
+            name (str): The dotted path of the extension to unload
+            package (str, optional): The package to resolve relative imports with.
+                Defaults to None.
+        """
+        # A lazy extension was never imported, so only its stubs are removed
+        stubs = self.lazy_extensions.pop(
+            name.removeprefix(f"{self.EXTENSIONS_DIR_NAME}."), None
+        )
+        if stubs is not None:
+            for stub in stubs:
+                self.remove_command(stub.name)
+        else:
+            await super().unload_extension(name, package=package)
+        self.dispatch("commands_changed")
+
+    async def reload_extension(self: Self, name: str, *, package: str = None) -> None:
+        """Reloads an extension, and lets cogs know the commands have changed
+        See: https://discordpy.readthedocs.io/en/latest/ext/commands/api.html
+
+        Args:
+            name (str): The dotted path of the extension to reload
+            package (str, optional): The package to resolve relative imports with.
+                Defaults to None.
+        """
+        # A lazy extension was never imported, so it is loaded for the first time
+        if name.removeprefix(f"{self.EXTENSIONS_DIR_NAME}.") in self.lazy_extensions:
+            await self.load_extension(name, package=package)
+            return
+        await super().reload_extension(name, package=package)
+        self.dispatch("commands_changed")
 
     def get_command_extension_name(self: Self, command: commands.Command) -> str:
         """Gets the subname of an module from a command.
@@ -664,32 +1122,38 @@ class TechSupportBot(commands.Bot):
         if getattr(owner, "id", None) == member.id:
             return True
 
-        if member.id in [int(id) for id in self.file_config.bot_config.admins.ids]:
+        if member.id in self.admin_ids:
             return True
 
-        role_is_admin = False
-        for role in getattr(member, "roles", []):
-            if role.name in self.file_config.bot_config.admins.roles:
-                role_is_admin = True
-                break
-        if role_is_admin:
-            return True
+        guild_id = getattr(getattr(member, "guild", None), "id", None)
+        role_is_admin = self.admin_role_verdicts.get((guild_id, member.id))
+        if role_is_admin is None:
+            role_is_admin = any(
+                role.name in self.admin_role_names
+                for role in getattr(member, "roles", [])
+            )
+            self.admin_role_verdicts[(guild_id, member.id)] = role_is_admin
 
-        return False
+        return role_is_admin
 
     async def get_owner(self: Self) -> discord.User | None:
         """Gets the owner object from the bot application.
+        The owner is cached, and only looked up again every OWNER_REFRESH_SECONDS
 
         Returns:
             discord.User | None: The User object of the owner of the application on discords side
         """
-        if self.file_config.bot_config.override_owner:
-            self.owner = await self.fetch_user(
-                int(self.file_config.bot_config.override_owner)
-            )
+        now = datetime.datetime.utcnow()
+        if self.owner and self.owner_expires and now < self.owner_expires:
             return self.owner
 
-        if not self.owner:
+        if self.file_config.bot_config.override_owner:
+            owner_id = int(self.file_config.bot_config.override_owner)
+            try:
+                self.owner = self.get_user(owner_id) or await self.fetch_user(owner_id)
+            except discord.errors.HTTPException:
+                self.owner = None
+        else:
             try:
                 # If this isn't console only, it is a forever recursion
                 await self.logger.send_log(
@@ -702,6 +1166,9 @@ class TechSupportBot(commands.Bot):
             except discord.errors.HTTPException:
                 self.owner = None
 
+        self.owner_expires = now + datetime.timedelta(
+            seconds=self.OWNER_REFRESH_SECONDS
+        )
         return self.owner
 
     async def get_prefix(self: Self, message: discord.Message) -> str:
@@ -745,25 +1212,15 @@ class TechSupportBot(commands.Bot):
         """
         # Assume this is only run if rate limit is enabled
         identifier = f"{member.id}-{guild.id}"
-
-        # If this person hasn't run a command in the rate_limit.time
-        # We will need to add them to the execute history
-        if identifier not in self.command_execute_history:
-            self.command_execute_history[identifier] = expiringdict.ExpiringDict(
-                max_len=20,
-                max_age_seconds=configuration.get_config_entry(
-                    guild.id, "rate_limit_time"
-                ),
-            )
-
-        # Ensure that a single command is only ever counted once
-        if command_id not in self.command_execute_history[identifier]:
-            self.command_execute_history[identifier][command_id] = True
+        guild_config = self.check_planner.get_guild_config(guild.id)
 
         # Ban the person if they are over the rate limit
-        if len(
-            self.command_execute_history[identifier]
-        ) > configuration.get_config_entry(guild.id, "rate_limit_commands"):
+        if not self.command_rate_limiter.check(
+            (guild.id, member.id),
+            command_id,
+            limit=guild_config.rate_limit_commands,
+            period=guild_config.rate_limit_time,
+        ):
             self.command_rate_limit_bans[identifier] = True
 
         # If this person is banned, raise an error
@@ -789,11 +1246,8 @@ class TechSupportBot(commands.Bot):
         Returns:
             bool: False if disabled, True if enabled
         """
-        if extension_name not in configuration.get_config_entry(
-            guild.id, "core_enabled_extensions"
-        ):
-            return False
-        return True
+        guild_config = self.check_planner.get_guild_config(guild.id)
+        return extension_name in guild_config.enabled_extensions
 
     # Logging and checking if commands can run
 
@@ -814,8 +1268,14 @@ class TechSupportBot(commands.Bot):
             bool: True if the command should be run, false if it shouldn't be run
         """
 
+        # The command is timed from here, until it completes or errors
+        interaction.extras["started_at"] = time.perf_counter()
+
+        plan = self.check_planner.get_plan(interaction.command)
+        guild_config = self.check_planner.get_guild_config(interaction.guild.id)
+
         # Since we can't do it anywhere else, log slash command here
-        asyncio.create_task(self.slash_command_log(interaction))
+        self.slash_command_log(interaction, plan, guild_config)
 
         await self.logger.send_log(
             message="Checking if slash command can run",
@@ -824,67 +1284,64 @@ class TechSupportBot(commands.Bot):
             console_only=True,
         )
         # Check 1 - Ensure extension is enabled
-        # removes "modules."
-        extension_name = interaction.command.callback.__module__[8:]
-        always_enable_command = interaction.command.extras.get("always_enabled", False)
-        extension_enabled = self.command_run_extension_disabled_check(
-            interaction.guild, extension_name
-        )
         # If the extension is disabled, raise an error to show it and block execution
-        if not always_enable_command and not extension_enabled:
+        if (
+            not plan.always_enabled
+            and plan.extension_name not in guild_config.enabled_extensions
+        ):
             raise custom_errors.AppCommandExtensionDisabled
 
+        # Admins are only treated differently by the rate limiter,
+        # so without it every command that got this far can run
+        if not guild_config.rate_limit_enabled:
+            return True
+
         # Check 2 - Approve if invoker is bot admin
         result = await self.command_run_admin_check(interaction.user)
         if result:
             return result
 
-        # Check 3 - If rate limiter is enabled, run through the rate limiter
+        # Check 3 - Run through the rate limiter
         # If the user is under a rate limit, raise an error to show it and block execution
-        if configuration.get_config_entry(interaction.guild.id, "rate_limit_enabled"):
-            if not self.command_run_rate_limit_check(
-                member=interaction.user,
-                guild=interaction.guild,
-                command_id=interaction.id,
-            ):
-                raise custom_errors.AppCommandRateLimit
+        if not self.command_run_rate_limit_check(
+            member=interaction.user,
+            guild=interaction.guild,
+            command_id=interaction.id,
+        ):
+            raise custom_errors.AppCommandRateLimit
 
         # Finally, return the default check, which is always True
         return True
 
-    async def slash_command_log(self: Self, interaction: discord.Interaction) -> None:
-        """A command to log the call of a slash command
+    def slash_command_log(
+        self: Self,
+        interaction: discord.Interaction,
+        plan: command_checks.CheckPlan,
+        guild_config: command_checks.GuildCheckConfig,
+    ) -> None:
+        """Adds the call of a slash command to the command audit log
 
         Args:
             interaction (discord.Interaction): The interaction the slash command generated
+            plan (command_checks.CheckPlan): The check plan of the command
+            guild_config (command_checks.GuildCheckConfig): The config of the guild
         """
         if interaction.type != discord.InteractionType.application_command:
             return
-        embed = discord.Embed()
-        embed.add_field(name="User", value=interaction.user)
-        embed.add_field(
-            name="Channel", value=getattr(interaction.channel, "name", "DM")
-        )
-        embed.add_field(name="Server", value=getattr(interaction.guild, "name", "None"))
         parameters = []
         for parameter in interaction.namespace:
             parameters.append(f"{parameter[0]}: {parameter[1]}")
 
-        log_channel = configuration.get_config_entry(
-            interaction.guild.id, "core_logging_channel"
-        )
-
         sliced_content = interaction.command.qualified_name[:100]
         command = f"/{sliced_content} {', '.join(parameters)}".strip()
-        message = f"Command detected: `{command}`"
 
-        await self.logger.send_log(
-            message=message.strip()[:6000],
-            level=LogLevel.INFO,
-            context=LogContext(guild=interaction.guild, channel=interaction.channel),
-            channel=log_channel,
-            embed=embed,
-            console_only=interaction.command.extras.get("suppress_logs", False),
+        self.command_audit_log.add(
+            guild=interaction.guild,
+            channel=interaction.channel,
+            user=interaction.user,
+            command=command,
+            log_channel=guild_config.logging_channel,
+            console_only=plan.suppress_logs,
         )
 
     async def can_run(
@@ -914,12 +1371,16 @@ class TechSupportBot(commands.Bot):
             context=LogContext(guild=ctx.guild, channel=ctx.channel),
             console_only=True,
         )
+        plan = self.check_planner.get_plan(ctx.command)
+        guild_config = self.check_planner.get_guild_config(ctx.guild.id)
+
         # Check 1 - Ensure extension is enabled
-        extension_name = self.get_command_extension_name(ctx.command)
-        if extension_name:
-            # If the extension is disabled, raise an error to show it and block execution
-            if not self.command_run_extension_disabled_check(ctx.guild, extension_name):
-                raise custom_errors.ExtensionDisabled
+        # If the extension is disabled, raise an error to show it and block execution
+        if (
+            plan.extension_name
+            and plan.extension_name not in guild_config.enabled_extensions
+        ):
+            raise custom_errors.ExtensionDisabled
 
         # Check 2 - Approve if invoker is bot admin
         result = await self.command_run_admin_check(ctx.author)
@@ -927,7 +1388,7 @@ class TechSupportBot(commands.Bot):
             return result
 
         # Check 3 - If rate limiter is enabled, run through the rate limiter
-        if configuration.get_config_entry(ctx.guild.id, "rate_limit_enabled"):
+        if guild_config.rate_limit_enabled:
             # If the user is under a rate limit, raise an error to show it and block execution
             if not self.command_run_rate_limit_check(
                 member=ctx.author, guild=ctx.guild, command_id=ctx.message.id
@@ -937,6 +1398,100 @@ class TechSupportBot(commands.Bot):
         # Finally, return the default check
         return await super().can_run(ctx, call_once=call_once)
 
+    async def on_commands_changed(self: Self) -> None:
+        """Builds the check plan of every command, once the commands have changed"""
+        self.check_planner.rebuild([*self.walk_commands(), *self.tree.walk_commands()])
+
+    # Metrics hooks
+
+    def add_listener(
+        self: Self,
+        func: Callable[..., Awaitable[None]],
+        /,
+        name: str = discord.utils.MISSING,
+    ) -> None:
+        """Adds a listener that is timed every time it runs
+        Cogs add their listeners with this, so every cog listener is timed
+        See: https://discordpy.readthedocs.io/en/latest/ext/commands/api.html
+
+        Args:
+            func (Callable[..., Awaitable[None]]): The listener to add
+            name (str, optional): The event to listen for.
+                Defaults to the name of the function.
+        """
+        name = func.__name__ if name is discord.utils.MISSING else name
+        timed_listener = metrics.time_listener(func, name)
+        self.timed_listeners[(name, func)] = timed_listener
+        super().add_listener(timed_listener, name)
+
+    def remove_listener(
+        self: Self,
+        func: Callable[..., Awaitable[None]],
+        /,
+        name: str = discord.utils.MISSING,
+    ) -> None:
+        """Removes a listener that was added with add_listener
+        See: https://discordpy.readthedocs.io/en/latest/ext/commands/api.html
+
+        Args:
+            func (Callable[..., Awaitable[None]]): The listener to remove
+            name (str, optional): The event it listens for.
+                Defaults to the name of the function.
+        """
+        name = func.__name__ if name is discord.utils.MISSING else name
+        timed_listener = self.timed_listeners.pop((name, func), func)
+        super().remove_listener(timed_listener, name)
+
+    async def invoke(self: Self, ctx: commands.Context) -> None:
+        """Invokes a prefix command, and times it
+        See: https://discordpy.readthedocs.io/en/latest/ext/commands/api.html
+
+        Args:
+            ctx (commands.Context): The context of the command
+        """
+        start = time.perf_counter()
+        await super().invoke(ctx)
+        if ctx.command:
+            metrics.command_seconds.observe(
+                time.perf_counter() - start,
+                command=ctx.command.qualified_name,
+                kind="prefix",
+                outcome="error" if ctx.command_failed else "success",
+            )
+
+    async def on_app_command_completion(
+        self: Self,
+        interaction: discord.Interaction,
+        _command: app_commands.Command | app_commands.ContextMenu,
+    ) -> None:
+        """Records how long a slash command took, once it completes
+        See: https://discordpy.readthedocs.io/en/latest/api.html#discord.on_app_command_completion
+
+        Args:
+            interaction (discord.Interaction): The interaction of the command
+            _command (app_commands.Command | app_commands.ContextMenu): The command that ran
+        """
+        self.observe_app_command(interaction, "success")
+
+    def observe_app_command(
+        self: Self, interaction: discord.Interaction, outcome: str
+    ) -> None:
+        """Records how long a slash command took, since it passed interaction_check
+
+        Args:
+            interaction (discord.Interaction): The interaction of the command
+            outcome (str): Whether the command was a "success" or an "error"
+        """
+        started_at = interaction.extras.get("started_at")
+        if started_at is None or not interaction.command:
+            return
+        metrics.command_seconds.observe(
+            time.perf_counter() - started_at,
+            command=interaction.command.qualified_name,
+            kind="slash",
+            outcome=outcome,
+        )
+
     # IRC Stuff
 
     async def start_irc(self: Self) -> None:
@@ -0,0 +1,109 @@
+"""
+Syncs the slash command tree only where it has changed
+Every scope of the tree, global and per guild, is hashed from its canonical
+form, and the hash of the last sync is kept in postgres
+Discord limits how often commands can be updated, so unchanged scopes are skipped
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+from typing import TYPE_CHECKING
+
+import discord
+from discord import app_commands
+
+if TYPE_CHECKING:
+    import bot
+
+GLOBAL_SCOPE: str = "global"
+
+
+def get_tree_hash(tree: app_commands.CommandTree, guild: discord.Object = None) -> str:
+    """Hashes the commands of one scope of the local command tree
+    Commands are sorted and serialized with sorted keys, so the hash only
+    changes when the commands themselves change
+
+    Args:
+        tree (app_commands.CommandTree): The command tree to hash
+        guild (discord.Object, optional): The guild to hash the commands of,
+            or None for the global commands. Defaults to None.
+
+    Returns:
+        str: The sha256 hash of the commands, as a string
+    """
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command.get("type", 1), command["name"]),
+    )
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+async def sync_changed_scopes(
+    discord_bot: bot.TechSupportBot, force: bool = False
+) -> dict[str, list[app_commands.AppCommand]]:
+    """Syncs every scope of the command tree that changed since it was last synced
+    A guild scope is only checked if it was synced before, or if the bot
+    has guild specific commands for it
+
+    Args:
+        discord_bot (bot.TechSupportBot): The bot to sync the commands of
+        force (bool, optional): Sync every scope, even if it hasn't changed.
+            Defaults to False.
+
+    Returns:
+        dict[str, list[app_commands.AppCommand]]: The commands returned by
+            discord for each scope that was synced
+    """
+    stored_hashes = {
+        row.scope: row.tree_hash
+        for row in await discord_bot.models.AppCommandTree.query.gino.all()
+    }
+    scopes = (
+        {GLOBAL_SCOPE}
+        | set(stored_hashes)
+        | {str(guild.id) for guild in discord_bot.guilds}
+    )
+
+    synced: dict[str, list[app_commands.AppCommand]] = {}
+    for scope in sorted(scopes):
+        guild = None if scope == GLOBAL_SCOPE else discord.Object(id=int(scope))
+        if (
+            guild
+            and scope not in stored_hashes
+            and not discord_bot.tree.get_commands(guild=guild)
+        ):
+            continue
+
+        tree_hash = get_tree_hash(discord_bot.tree, guild)
+        if not force and stored_hashes.get(scope) == tree_hash:
+            continue
+
+        synced[scope] = await discord_bot.tree.sync(guild=guild)
+        await save_tree_hash(discord_bot, scope, tree_hash)
+
+    return synced
+
+
+async def save_tree_hash(
+    discord_bot: bot.TechSupportBot, scope: str, tree_hash: str
+) -> None:
+    """Stores the hash of a scope that was just synced
+
+    Args:
+        discord_bot (bot.TechSupportBot): The bot the commands were synced for
+        scope (str): "global", or the ID of the guild that was synced
+        tree_hash (str): The hash of the synced commands
+    """
+    row = await discord_bot.models.AppCommandTree.get(scope)
+    if row:
+        await row.update(
+            tree_hash=tree_hash, synced_at=datetime.datetime.utcnow()
+        ).apply()
+    else:
+        await discord_bot.models.AppCommandTree(
+            scope=scope, tree_hash=tree_hash
+        ).create()
@@ -5,21 +5,40 @@ This replaces duplicate or similar code across many extensions
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import io
 import json
 from functools import wraps
 from typing import TYPE_CHECKING, Any
 
+import aiohttp
 import discord
+import expiringdict
 import munch
 from discord import app_commands
 from discord.ext import commands
 
+from core import message_window
+
 if TYPE_CHECKING:
     import cogs
 
 default_color = discord.Color.blurple()
 
+# Attachment hashes by attachment ID, so every cog shares a single download
+_attachment_hashes: expiringdict.ExpiringDict[int, asyncio.Task] = (
+    expiringdict.ExpiringDict(max_len=1000, max_age_seconds=600)
+)
+HASH_CHUNK_SIZE: int = 64 * 1024
+# A single session for attachment downloads, made the first time it is needed
+_download_session: aiohttp.ClientSession = None
+
+# Attachment downloads in progress by attachment ID, so a message that is
+# reposted by several cogs at once is only downloaded once
+# Downloads are removed as soon as they finish, so no contents are kept
+_attachment_bytes: dict[int, asyncio.Task] = {}
+
 
 def generate_basic_embed(
     title: str = "",
@@ -55,8 +74,11 @@ async def search_channel_for_message(
     content_to_match: str = "",
     allow_bot: bool = True,
     skip_messages: list[int] = None,
+    limit: int = 50,
 ) -> discord.Message:
-    """Searches the last 50 messages in a channel based on given conditions
+    """Searches the most recent messages in a channel based on given conditions
+    The search is served from the recent message window when it can be,
+    and only reads the channel history from discord when it can't
 
     Args:
         channel (discord.abc.Messageable): The channel to search in. This is required
@@ -67,23 +89,44 @@ async def search_channel_for_message(
         allow_bot (bool, optional): If you want to allow messages to
             be authored by a bot. Defaults to True
         skip_messages (list[int], optional): Message IDs to be ignored by the search
+        limit (int, optional): How many recent messages to search. Defaults to 50.
 
     Returns:
         discord.Message: The message object that meets the given critera.
             If none could be found, None is returned
     """
 
-    SEARCH_LIMIT = 50
+    def matches(message: discord.Message) -> bool:
+        """Checks a single message against the search conditions
 
-    async for message in channel.history(limit=SEARCH_LIMIT):
-        if skip_messages and message.id in skip_messages:
-            continue
-        if (
-            (member_to_match is None or message.author == member_to_match)
+        Args:
+            message (discord.Message): The message to check
+
+        Returns:
+            bool: True if the message meets every condition
+        """
+        return (
+            not (skip_messages and message.id in skip_messages)
+            and (member_to_match is None or message.author == member_to_match)
             and (content_to_match == "" or content_to_match in message.content)
             and (prefix == "" or not message.content.startswith(prefix))
             and (allow_bot is True or not message.author.bot)
-        ):
+        )
+
+    window = message_window.recent_messages
+    # Channels without an ID can't be tracked, so always read their history
+    tracked = getattr(channel, "id", None) is not None
+    if tracked:
+        found, message = window.search(channel, matches, limit)
+        if found:
+            return message
+
+    history = [message async for message in channel.history(limit=limit)]
+    if tracked:
+        window.fill(channel, history, limit)
+
+    for message in history:
+        if matches(message):
             return message
     return None
 
@@ -534,12 +577,130 @@ async def bot_admin_check_interaction(interaction: discord.Interaction) -> bool:
 
 async def get_attachment_hash(attachment: discord.Attachment) -> str:
     """Computes a sha256 file hash for a given discord attachment
+    The file is streamed rather than read into memory, and each attachment
+    is only downloaded once, even if many cogs ask for its hash at the same time
 
     Args:
         attachment (discord.Attachment): The attachment to generate the hash of
 
+    Raises:
+        exception: Any exception raised while downloading the attachment
+
     Returns:
         str: The hash, as a string
     """
-    file_bytes = await attachment.read()
-    return hashlib.sha256(file_bytes).hexdigest()
+    hash_task = _attachment_hashes.get(attachment.id)
+    if hash_task is None:
+        hash_task = asyncio.create_task(stream_file_hash(attachment.url))
+        _attachment_hashes[attachment.id] = hash_task
+
+    try:
+        return await asyncio.shield(hash_task)
+    except Exception as exception:
+        # Don't keep failed downloads, so the next call can try again
+        if _attachment_hashes.get(attachment.id) is hash_task:
+            del _attachment_hashes[attachment.id]
+        raise exception
+
+
+async def get_attachment_bytes(attachment: discord.Attachment) -> bytes:
+    """Downloads the contents of an attachment
+    The download is shared between every cog that asks for the same
+    attachment while it is being downloaded
+
+    Args:
+        attachment (discord.Attachment): The attachment to download
+
+    Returns:
+        bytes: The contents of the attachment
+    """
+    read_task = _attachment_bytes.get(attachment.id)
+    if read_task is None:
+        read_task = asyncio.create_task(attachment.read())
+        _attachment_bytes[attachment.id] = read_task
+        read_task.add_done_callback(lambda task: _forget_download(attachment.id, task))
+
+    return await asyncio.shield(read_task)
+
+
+def _forget_download(attachment_id: int, read_task: asyncio.Task) -> None:
+    """Removes a finished download, so its contents can be freed once every
+    cog waiting on it has them, and a failed download can be tried again
+
+    Args:
+        attachment_id (int): The ID of the attachment that was downloaded
+        read_task (asyncio.Task): The finished download
+    """
+    if _attachment_bytes.get(attachment_id) is read_task:
+        del _attachment_bytes[attachment_id]
+
+
+async def build_attachment_files(
+    attachments: list[discord.Attachment], size_limit: int
+) -> list[discord.File]:
+    """Downloads attachments in parallel, to be reuploaded in a new message
+    Attachments are taken in order until their total size passes the limit
+
+    Args:
+        attachments (list[discord.Attachment]): The attachments to download
+        size_limit (int): The most bytes to download in total
+
+    Returns:
+        list[discord.File]: The files that fit in the size limit, in the same order
+    """
+    to_download: list[discord.Attachment] = []
+    total_size = 0
+    for attachment in attachments:
+        if (total_size := total_size + attachment.size) <= size_limit:
+            to_download.append(attachment)
+
+    downloads = await asyncio.gather(
+        *(get_attachment_bytes(attachment) for attachment in to_download)
+    )
+    return [
+        discord.File(
+            io.BytesIO(file_bytes),
+            filename=attachment.filename,
+            spoiler=attachment.is_spoiler(),
+            description=attachment.description,
+        )
+        for attachment, file_bytes in zip(to_download, downloads)
+    ]
+
+
+async def stream_file_hash(url: str) -> str:
+    """Computes a sha256 file hash of a file, downloading it in chunks
+
+    Args:
+        url (str): The URL of the file to hash
+
+    Returns:
+        str: The hash, as a string
+    """
+    file_hash = hashlib.sha256()
+    async with get_download_session().get(url) as response:
+        response.raise_for_status()
+        async for chunk in response.content.iter_chunked(HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_download_session() -> aiohttp.ClientSession:
+    """Gets the session used to download attachments, making it if needed
+    Sharing one session reuses its connections, instead of opening new ones
+    for every attachment
+
+    Returns:
+        aiohttp.ClientSession: The open download session
+    """
+    # pylint: disable=W0603
+    global _download_session
+    if _download_session is None or _download_session.closed:
+        _download_session = aiohttp.ClientSession()
+    return _download_session
+
+
+async def close_download_session() -> None:
+    """Closes the session used to download attachments, if it was made"""
+    if _download_session is not None and not _download_session.closed:
+        await _download_session.close()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Self
 
@@ -11,6 +12,7 @@ from discord.ext import commands
 
 import configuration
 from botlogging import LogContext, LogLevel
+from core import metrics
 
 if TYPE_CHECKING:
     import bot
@@ -40,7 +42,7 @@ class BaseCog(commands.Cog):
         self.no_guild = no_guild
         self.extension_name = self.get_extension_name()
 
-        asyncio.create_task(self._preconfig())
+        self.preconfig_task = asyncio.create_task(self._preconfig())
 
     async def _handle_preconfig(
         self: Self, handler: Callable[..., Awaitable[None]]
@@ -54,6 +56,7 @@ class BaseCog(commands.Cog):
         """
         await self.bot.wait_until_ready()
 
+        start = time.perf_counter()
         try:
             await handler()
         except Exception as exception:
@@ -64,6 +67,11 @@ class BaseCog(commands.Cog):
             )
             if not self.KEEP_COG_ON_FAILURE:
                 await self.bot.remove_cog(self)
+        finally:
+            if self.extension_name:
+                self.bot.startup_timeline.record_extension(
+                    self.extension_name, "preconfig", time.perf_counter() - start
+                )
 
     async def _preconfig(self: Self) -> None:
         """Blocks the preconfig until the bot is ready."""
@@ -137,12 +145,15 @@ class MatchCog(BaseCog):
         ):
             message.content = message.message_snapshots[0].content
 
-        result = await self.match(ctx, message.content)
+        cog_name = self.__class__.__name__
+        with metrics.match_seconds.measure(cog=cog_name, stage="match"):
+            result = await self.match(ctx, message.content)
         if not result:
             return
 
         try:
-            await self.response(ctx, message.content, result)
+            with metrics.match_seconds.measure(cog=cog_name, stage="response"):
+                await self.response(ctx, message.content, result)
         except Exception as exception:
             await self.bot.logger.send_log(
                 message="Checking config for log channel",
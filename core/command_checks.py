@@ -0,0 +1,307 @@
+"""
+Check plans that hold what the command checks need to know about a command,
+worked out once when the command is registered, and snapshots of the guild
+config the checks read, which are only read again when the config file changes
+This also has the command audit log, which logs the commands that ran in batches
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import os
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Self
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import configuration
+from botlogging import LogContext, LogLevel
+
+if TYPE_CHECKING:
+    import bot
+
+
+@dataclasses.dataclass(frozen=True)
+class CheckPlan:
+    """What the command checks need to know about a single command
+
+    Attributes:
+        extension_name (str | None): The extension the command belongs to,
+            without the modules prefix, or None if it isn't part of an extension
+        always_enabled (bool): If the command runs even when its extension is disabled
+        suppress_logs (bool): If the command is only logged to the console
+    """
+
+    extension_name: str | None
+    always_enabled: bool
+    suppress_logs: bool
+
+
+@dataclasses.dataclass(frozen=True)
+class GuildCheckConfig:
+    """The guild config entries read by the command checks
+
+    Attributes:
+        enabled_extensions (frozenset[str]): The extensions enabled in the guild
+        rate_limit_enabled (bool): If commands are rate limited in the guild
+        rate_limit_commands (int): How many commands are allowed in a period
+        rate_limit_time (int): The length of the rate limit period, in seconds
+        logging_channel (str): The ID of the channel commands are logged to
+    """
+
+    enabled_extensions: frozenset[str]
+    rate_limit_enabled: bool
+    rate_limit_commands: int
+    rate_limit_time: int
+    logging_channel: str
+
+
+def get_guild_config_version(guild_id: int) -> tuple[int, int] | None:
+    """Gets a version of a guild config file that changes whenever it is written
+
+    Args:
+        guild_id (int): The ID of the guild
+
+    Returns:
+        tuple[int, int] | None: The modification time and size of the file,
+            or None if the guild has no config file
+    """
+    try:
+        stat = os.stat(f"{configuration.config.BASE_PATH}guild_configs/{guild_id}.json")
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class CheckPlanner:
+    """Holds the check plan of every command, and a config snapshot of every guild
+
+    Args:
+        extensions_dir_name (str): The package that extensions are loaded from
+    """
+
+    def __init__(self: Self, extensions_dir_name: str) -> None:
+        self.extensions_dir_name = extensions_dir_name
+        self.plans: dict[
+            commands.Command | app_commands.Command | app_commands.ContextMenu,
+            CheckPlan,
+        ] = {}
+        # The version of the config file each snapshot was read from
+        self.guild_configs: dict[
+            int, tuple[tuple[int, int] | None, GuildCheckConfig]
+        ] = {}
+
+    def build_plan(
+        self: Self,
+        command: commands.Command | app_commands.Command | app_commands.ContextMenu,
+    ) -> CheckPlan:
+        """Works out the check plan of a command
+
+        Args:
+            command (commands.Command | app_commands.Command | app_commands.ContextMenu):
+                The prefix or slash command
+
+        Returns:
+            CheckPlan: The check plan of the command
+        """
+        module = command.module or ""
+        extension_name = None
+        if module.startswith(f"{self.extensions_dir_name}."):
+            extension_name = module.removeprefix(f"{self.extensions_dir_name}.")
+        extras = getattr(command, "extras", None) or {}
+        return CheckPlan(
+            extension_name=extension_name,
+            always_enabled=extras.get("always_enabled", False),
+            suppress_logs=extras.get("suppress_logs", False),
+        )
+
+    def get_plan(
+        self: Self,
+        command: commands.Command | app_commands.Command | app_commands.ContextMenu,
+    ) -> CheckPlan:
+        """Gets the check plan of a command, working it out if it wasn't registered
+
+        Args:
+            command (commands.Command | app_commands.Command | app_commands.ContextMenu):
+                The prefix or slash command
+
+        Returns:
+            CheckPlan: The check plan of the command
+        """
+        plan = self.plans.get(command)
+        if plan is None:
+            plan = self.build_plan(command)
+            self.plans[command] = plan
+        return plan
+
+    def rebuild(
+        self: Self,
+        all_commands: Iterable[
+            commands.Command | app_commands.Command | app_commands.ContextMenu
+        ],
+    ) -> None:
+        """Replaces every check plan, so removed commands are dropped
+
+        Args:
+            all_commands (Iterable[commands.Command | app_commands.Command |
+                app_commands.ContextMenu]): Every registered command
+        """
+        self.plans = {command: self.build_plan(command) for command in all_commands}
+
+    def get_guild_config(self: Self, guild_id: int) -> GuildCheckConfig:
+        """Gets the config snapshot of a guild, reading the config again if it changed
+
+        Args:
+            guild_id (int): The ID of the guild
+
+        Returns:
+            GuildCheckConfig: The config entries read by the command checks
+        """
+        version = get_guild_config_version(guild_id)
+        cached = self.guild_configs.get(guild_id)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        snapshot = GuildCheckConfig(
+            enabled_extensions=frozenset(
+                configuration.get_config_entry(guild_id, "core_enabled_extensions")
+            ),
+            rate_limit_enabled=configuration.get_config_entry(
+                guild_id, "rate_limit_enabled"
+            ),
+            rate_limit_commands=configuration.get_config_entry(
+                guild_id, "rate_limit_commands"
+            ),
+            rate_limit_time=configuration.get_config_entry(guild_id, "rate_limit_time"),
+            logging_channel=configuration.get_config_entry(
+                guild_id, "core_logging_channel"
+            ),
+        )
+        self.guild_configs[guild_id] = (version, snapshot)
+        return snapshot
+
+
+@dataclasses.dataclass
+class AuditEntry:
+    """A single command that ran, waiting to be logged
+
+    Attributes:
+        channel (discord.abc.Messageable): The channel the command was run in
+        user (discord.abc.User): The user who ran the command
+        command (str): The command as it was run, with its parameters
+    """
+
+    channel: discord.abc.Messageable
+    user: discord.abc.User
+    command: str
+
+
+class CommandAuditLog:
+    """Collects the commands that ran, and logs them together every few seconds
+    Commands are grouped by guild and log channel, so a busy guild gets a single
+    log for many commands, instead of one embed for every command
+
+    Args:
+        discord_bot (bot.TechSupportBot): The bot, whose logger is used
+
+    Attributes:
+        FLUSH_SECONDS (float): How long commands are collected before they are logged
+        MAX_ENTRIES (int): The most commands in a single log
+        MAX_LINE_LENGTH (int): The longest a single command is shown in a log
+    """
+
+    FLUSH_SECONDS: float = 5
+    MAX_ENTRIES: int = 20
+    MAX_LINE_LENGTH: int = 180
+
+    def __init__(self: Self, discord_bot: bot.TechSupportBot) -> None:
+        self.bot = discord_bot
+        # The waiting commands, by guild ID, log channel and if they are console only
+        self.pending: dict[tuple[int, str, bool], list[AuditEntry]] = (
+            collections.defaultdict(list)
+        )
+        self.guilds: dict[int, discord.Guild] = {}
+
+    def add(
+        self: Self,
+        guild: discord.Guild,
+        channel: discord.abc.Messageable,
+        user: discord.abc.User,
+        command: str,
+        log_channel: str,
+        console_only: bool = False,
+    ) -> None:
+        """Adds a command to be logged with the next batch
+
+        Args:
+            guild (discord.Guild): The guild the command was run in
+            channel (discord.abc.Messageable): The channel the command was run in
+            user (discord.abc.User): The user who ran the command
+            command (str): The command as it was run, with its parameters
+            log_channel (str): The ID of the channel to log the command to
+            console_only (bool, optional): If the command should only be logged
+                to the console. Defaults to False.
+        """
+        self.guilds[guild.id] = guild
+        self.pending[(guild.id, log_channel, console_only)].append(
+            AuditEntry(channel=channel, user=user, command=command)
+        )
+
+    def format_entry(self: Self, entry: AuditEntry) -> str:
+        """Formats a single command as a line of the log
+
+        Args:
+            entry (AuditEntry): The command to format
+
+        Returns:
+            str: The line of the log
+        """
+        channel_name = getattr(entry.channel, "name", "DM")
+        command = entry.command.replace("`", "'")
+        line = f"{entry.user} in #{channel_name}: `{command}`"
+        if len(line) > self.MAX_LINE_LENGTH:
+            line = f"{line[: self.MAX_LINE_LENGTH - 4]}...`"
+        return line
+
+    async def flush(self: Self) -> None:
+        """Logs every waiting command, a batch at a time"""
+        pending, self.pending = self.pending, collections.defaultdict(list)
+        guilds, self.guilds = self.guilds, {}
+        for (guild_id, log_channel, console_only), entries in pending.items():
+            guild = guilds.get(guild_id)
+            private_channels = configuration.get_config_entry(
+                guild_id, "core_private_channels"
+            )
+            entries = [
+                entry
+                for entry in entries
+                if str(getattr(entry.channel, "id", "")) not in private_channels
+            ]
+            for start in range(0, len(entries), self.MAX_ENTRIES):
+                batch = entries[start : start + self.MAX_ENTRIES]
+                lines = "\n".join(self.format_entry(entry) for entry in batch)
+                await self.bot.logger.send_log(
+                    message=f"Commands detected:\n{lines}",
+                    level=LogLevel.INFO,
+                    context=LogContext(guild=guild),
+                    channel=log_channel,
+                    console_only=console_only,
+                )
+
+    async def run(self: Self) -> None:
+        """A forever loop that logs the waiting commands every FLUSH_SECONDS"""
+        while True:
+            await asyncio.sleep(self.FLUSH_SECONDS)
+            try:
+                await self.flush()
+            except Exception as exception:
+                await self.bot.logger.send_log(
+                    message="Could not log the commands that ran",
+                    level=LogLevel.ERROR,
+                    console_only=True,
+                    exception=exception,
+                )
@@ -7,6 +7,8 @@ from __future__ import annotations
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy.schema import CreateIndex
+
 if TYPE_CHECKING:
     import bot
 
@@ -63,6 +65,24 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         guild_id: str = bot.db.Column(bot.db.String)
         applicant_id: str = bot.db.Column(bot.db.String)
 
+    class AppCommandTree(bot.db.Model):
+        """The postgres table for the last synced slash command trees
+        Currently used in app_command_sync.py
+
+        Attributes:
+            scope (str): "global", or the ID of the guild the commands are synced to
+            tree_hash (str): The hash of the command tree when it was last synced
+            synced_at (datetime.datetime): When the tree was last synced
+        """
+
+        __tablename__ = "app_command_trees"
+
+        scope: str = bot.db.Column(bot.db.String, primary_key=True)
+        tree_hash: str = bot.db.Column(bot.db.String, nullable=False)
+        synced_at: datetime.datetime = bot.db.Column(
+            bot.db.DateTime, default=datetime.datetime.utcnow
+        )
+
     class ModLog(bot.db.Model):
         """The postgres table for banlogs
         Currently used in modlog.py
@@ -82,7 +102,13 @@ def setup_models(bot: bot.TechSupportBot) -> None:
         """
 
         __tablename__ = "modlog"
-        __table_args__ = (bot.db.UniqueConstraint("guild_id", "guild_case_id"),)
+        __table_args__ = (
+            bot.db.UniqueConstraint("guild_id", "guild_case_id"),
+            bot.db.Index(
+                "ix_modlog_guild_member_action", "guild_id", "member_id", "action"
+            ),
+            bot.db.Index("ix_modlog_guild_moderator", "guild_id", "moderator_id"),
+        )
 
         pk = bot.db.Column(bot.db.Integer, primary_key=True, autoincrement=True)
         guild_id = bot.db.Column(bot.db.String)
@@ -101,6 +127,20 @@ def setup_models(bot: bot.TechSupportBot) -> None:
             nullable=True,
         )
 
+    class ModLogCaseCounter(bot.db.Model):
+        """The postgres table for the last modlog case number in each guild
+        Currently used in modlog.py
+
+        Attributes:
+            guild_id (str): The string of the guild ID the counter belongs to
+            last_case_id (int): The last case number given out in the guild
+        """
+
+        __tablename__ = "modlog_case_counters"
+
+        guild_id: str = bot.db.Column(bot.db.String, primary_key=True)
+        last_case_id: int = bot.db.Column(bot.db.Integer, default=0)
+
     class DuckUser(bot.db.Model):
         """The postgres table for ducks
         Currently used in duck.py
@@ -239,6 +279,21 @@ def setup_models(bot: bot.TechSupportBot) -> None:
 
         user_id: str = bot.db.Column(bot.db.String, default=None, primary_key=True)
 
+    class ModmailThread(bot.db.Model):
+        """The postgres table for open modmail threads
+        Currently used in modmail.py
+
+        Attributes:
+            thread_id (str): The ID of the open thread in the modmail forum
+            user_id (str): The ID of the user the thread is with
+        """
+
+        __tablename__ = "modmail_threads"
+        __table_args__ = (bot.db.Index("ix_modmail_threads_user_id", "user_id"),)
+
+        thread_id: str = bot.db.Column(bot.db.String, primary_key=True)
+        user_id: str = bot.db.Column(bot.db.String, nullable=False)
+
     class UserNote(bot.db.Model):
         """The postgres table for notes
         Currently used in who.py
@@ -385,16 +440,39 @@ def setup_models(bot: bot.TechSupportBot) -> None:
 
     bot.models.Applications = Applications
     bot.models.AppBans = ApplicationBans
+    bot.models.AppCommandTree = AppCommandTree
     bot.models.ModLog = ModLog
+    bot.models.ModLogCaseCounter = ModLogCaseCounter
     bot.models.DuckUser = DuckUser
     bot.models.Factoid = Factoid
     bot.models.FactoidJob = FactoidJob
     bot.models.Grab = Grab
     bot.models.IRCChannelMapping = IRCChannelMapping
     bot.models.ModmailBan = ModmailBan
+    bot.models.ModmailThread = ModmailThread
     bot.models.UserNote = UserNote
     bot.models.Warning = Warning
     bot.models.Listener = Listener
     bot.models.Rule = Rule
     bot.models.Votes = Votes
     bot.models.XP = XP
+
+
+async def create_missing_indexes(bot: bot.TechSupportBot) -> None:
+    """Creates any declared index that doesn't exist in postgres yet
+    create_all only makes indexes alongside new tables, so indexes added to
+    existing tables have to be created here
+
+    Args:
+        bot (bot.TechSupportBot): The bot object with the database and models registered
+    """
+    existing_indexes = {
+        row[0]
+        for row in await bot.db.all(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"
+        )
+    }
+    for table in bot.db.sorted_tables:
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                await bot.db.status(CreateIndex(index))
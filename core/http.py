@@ -17,7 +17,7 @@ import expiringdict
 import munch
 
 from botlogging import LogLevel
-from core import custom_errors
+from core import custom_errors, metrics
 
 if TYPE_CHECKING:
     import bot
@@ -160,9 +160,12 @@ class HTTPCalls:
             params = urllib.parse.urlencode(kwargs.get("params"))
             cache_key = f"{cache_key}?{params}"
 
-        cached_response = (
-            self.http_cache.get(cache_key) if (use_cache and method == "get") else None
-        )
+        cached_response = None
+        if use_cache and method == "get":
+            cached_response = self.http_cache.get(cache_key)
+            metrics.cache_requests.inc(
+                cache="http", result="hit" if cached_response else "miss"
+            )
 
         client = None
         if cached_response:
@@ -171,19 +174,20 @@ class HTTPCalls:
             return await self.process_http_response(
                 response_object, method, cache_key, get_raw_response, log_message
             )
-        async with aiohttp.ClientSession() as client:
-            method_fn = getattr(client, method.lower())
-            async with method_fn(url, *args, **kwargs) as response_object:
-                log_message = (
-                    f"Making HTTP {method.upper()} request to URL: {cache_key}"
-                )
-                return await self.process_http_response(
-                    response_object,
-                    method,
-                    cache_key,
-                    get_raw_response,
-                    log_message,
-                )
+        with metrics.http_seconds.measure(host=root_url, method=method):
+            async with aiohttp.ClientSession() as client:
+                method_fn = getattr(client, method.lower())
+                async with method_fn(url, *args, **kwargs) as response_object:
+                    log_message = (
+                        f"Making HTTP {method.upper()} request to URL: {cache_key}"
+                    )
+                    return await self.process_http_response(
+                        response_object,
+                        method,
+                        cache_key,
+                        get_raw_response,
+                        log_message,
+                    )
 
     async def process_http_response(
         self: Self,
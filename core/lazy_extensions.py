@@ -0,0 +1,164 @@
+"""
+Lazy loading for extensions that are rarely used
+A manifest records the prefix commands of every extension, so extensions
+that only have prefix commands can be registered as stubs at startup
+The real extension is only imported the first time one of its commands is run
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from discord.ext import commands
+
+from core import cogs
+
+if TYPE_CHECKING:
+    import bot
+
+
+def get_fingerprint(file_path: str) -> str:
+    """Gets a fingerprint of an extension file, which changes when the file does
+
+    Args:
+        file_path (str): The path to the extension file
+
+    Returns:
+        str: The sha256 hash of the file contents
+    """
+    with open(file_path, "rb") as extension_file:
+        return hashlib.sha256(extension_file.read()).hexdigest()
+
+
+def load_manifest(manifest_path: str) -> dict[str, dict]:
+    """Reads the extension manifest from disk
+
+    Args:
+        manifest_path (str): The path to the manifest file
+
+    Returns:
+        dict[str, dict]: The manifest entry for every extension, by extension name.
+            Empty if the manifest doesn't exist or can't be read
+    """
+    if not os.path.isfile(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, encoding="utf8") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest_path: str, manifest: dict[str, dict]) -> None:
+    """Writes the extension manifest to disk
+
+    Args:
+        manifest_path (str): The path to the manifest file
+        manifest (dict[str, dict]): The manifest entry for every extension
+    """
+    with open(manifest_path, "w", encoding="utf8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+
+def describe_extension(
+    discord_bot: bot.TechSupportBot, extension_name: str, fingerprint: str
+) -> dict:
+    """Builds the manifest entry of an extension that has been loaded
+    An extension can only be loaded lazily if all it has are plain prefix
+    commands, as listeners, loops, matches and slash commands must all be
+    registered before they are used
+
+    Args:
+        discord_bot (bot.TechSupportBot): The bot the extension is loaded on
+        extension_name (str): The name of the extension, without the modules prefix
+        fingerprint (str): The fingerprint of the extension file
+
+    Returns:
+        dict: The manifest entry of the extension
+    """
+    module_name = f"{discord_bot.EXTENSIONS_DIR_NAME}.{extension_name}"
+    extension_cogs = [
+        cog for cog in discord_bot.cogs.values() if cog.__module__ == module_name
+    ]
+    extension_commands = [
+        command
+        for command in discord_bot.walk_commands()
+        if command.module == module_name
+    ]
+
+    lazy_eligible = (
+        bool(extension_cogs)
+        and all(
+            cog.COG_TYPE == cogs.BaseCog.COG_TYPE
+            and not cog.get_listeners()
+            and not cog.get_app_commands()
+            for cog in extension_cogs
+        )
+        and not any(
+            isinstance(command, commands.Group) or command.parent
+            for command in extension_commands
+        )
+    )
+
+    return {
+        "fingerprint": fingerprint,
+        "lazy_eligible": lazy_eligible,
+        "commands": [
+            {
+                "name": command.name,
+                "aliases": list(command.aliases),
+                "usage": command.usage,
+                "brief": command.brief,
+                "description": command.description,
+            }
+            for command in extension_commands
+        ],
+    }
+
+
+def build_stub_commands(
+    extension_name: str,
+    module_name: str,
+    entry: dict,
+    load_and_invoke: Callable[[commands.Context, str], Awaitable[None]],
+) -> list[commands.Command]:
+    """Builds stand in commands for an extension that hasn't been imported
+    The stubs have the same names and help text as the real commands
+
+    Args:
+        extension_name (str): The name of the extension, without the modules prefix
+        module_name (str): The full dotted name of the extension module
+        entry (dict): The manifest entry of the extension
+        load_and_invoke (Callable[[commands.Context, str], Awaitable[None]]):
+            Loads the real extension and runs the real command
+
+    Returns:
+        list[commands.Command]: The stub commands, ready to be added to the bot
+    """
+
+    async def lazy_command(ctx: commands.Context) -> None:
+        """Loads the real extension, and runs the real command
+
+        Args:
+            ctx (commands.Context): The context the command was run in
+        """
+        await load_and_invoke(ctx, extension_name)
+
+    # discord.py and the extension checks find the owning extension by module
+    lazy_command.__module__ = module_name
+
+    return [
+        commands.Command(
+            lazy_command,
+            name=command["name"],
+            aliases=command["aliases"],
+            usage=command["usage"],
+            brief=command["brief"],
+            description=command["description"],
+        )
+        for command in entry["commands"]
+    ]
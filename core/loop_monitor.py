@@ -0,0 +1,232 @@
+"""
+A watchdog that measures how late the event loop runs, and finds the code
+that blocks it
+A timer on the loop measures the lag continuously, while a sampling thread
+captures the stack of the loop thread whenever the timer is overdue
+The worst offenders are reported to the logging channel every few minutes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING, Self
+
+from botlogging import LogLevel
+from core import metrics
+
+if TYPE_CHECKING:
+    import bot
+
+# Stacks are attributed to the innermost frame of the bot's own code
+PROJECT_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclasses.dataclass
+class Offender:
+    """Code that blocked the event loop, and how long it blocked it for
+
+    Attributes:
+        location (str): The innermost line of the bot's own code in the stack
+        stack (str): The stack of the loop thread the first time it was caught
+        count (int): How many times it blocked the loop past the threshold
+        total_seconds (float): How long it blocked the loop for, in total
+        max_seconds (float): The longest it blocked the loop for at once
+    """
+
+    location: str
+    stack: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+def get_location(stack: traceback.StackSummary) -> str:
+    """Finds the line of the bot's own code that a stack is running
+
+    Args:
+        stack (traceback.StackSummary): The stack of the loop thread, outermost first
+
+    Returns:
+        str: The file, line and function of the innermost project frame,
+            or of the innermost frame if no project code is in the stack
+    """
+    chosen = stack[-1]
+    for frame in reversed(stack):
+        if frame.filename.startswith(PROJECT_ROOT) and (
+            "site-packages" not in frame.filename
+        ):
+            chosen = frame
+            break
+    filename = os.path.relpath(chosen.filename, PROJECT_ROOT)
+    return f"{filename}:{chosen.lineno} in {chosen.name}"
+
+
+class LoopWatchdog:
+    """Measures event loop lag, and records the stacks that cause it
+
+    Args:
+        discord_bot (bot.TechSupportBot): The bot, whose logger gets the reports
+        threshold (float): How late the loop can be, in seconds, before
+            the code running on it is captured
+
+    Attributes:
+        INTERVAL (float): How often the loop timer and the sampling thread run
+        REPORT_SECONDS (float): How often the offenders are reported
+        TOP_OFFENDERS (int): How many offenders are in a report
+        STACK_FRAMES (int): How many of the innermost frames are kept of a stack
+    """
+
+    INTERVAL: float = 0.05
+    REPORT_SECONDS: float = 300
+    TOP_OFFENDERS: int = 5
+    STACK_FRAMES: int = 12
+
+    def __init__(self: Self, discord_bot: bot.TechSupportBot, threshold: float) -> None:
+        self.bot = discord_bot
+        self.threshold = threshold
+        self.last_tick: float = time.monotonic()
+        # The lag of the most recent tick, in seconds
+        self.lag: float = 0.0
+        self.loop_thread_id: int = None
+        self.offenders: dict[str, Offender] = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.tasks: list[asyncio.Task] = []
+        # The tick the current block started after, and where it was caught
+        self.blocked_tick: float = None
+        self.blocked_location: str = None
+
+    def start(self: Self) -> None:
+        """Starts the loop timer, the sampling thread and the reports
+        This must be called from the event loop being watched
+        """
+        self.loop_thread_id = threading.get_ident()
+        self.last_tick = time.monotonic()
+        self.tasks = [
+            asyncio.create_task(self.measure_lag()),
+            asyncio.create_task(self.run_reports()),
+        ]
+        threading.Thread(target=self.sample, name="loop-watchdog", daemon=True).start()
+
+    def stop(self: Self) -> None:
+        """Stops the sampling thread, the loop timer and the reports"""
+        self.stopped.set()
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+
+    async def measure_lag(self: Self) -> None:
+        """A forever loop that measures how late a timer on the event loop fires"""
+        while not self.stopped.is_set():
+            self.last_tick = time.monotonic()
+            await asyncio.sleep(self.INTERVAL)
+            self.lag = max(time.monotonic() - self.last_tick - self.INTERVAL, 0)
+            metrics.loop_lag_seconds.observe(self.lag)
+
+    def sample(self: Self) -> None:
+        """Checks the loop timer from another thread, and captures the stack of
+        the loop thread the first time the timer is overdue in a block
+        """
+        while not self.stopped.wait(self.INTERVAL):
+            tick = self.last_tick
+            if self.blocked_tick is not None and tick != self.blocked_tick:
+                self.finish_block(tick)
+
+            overdue = time.monotonic() - tick - self.INTERVAL
+            if overdue < self.threshold or self.blocked_tick == tick:
+                continue
+
+            # This is the only way to see the stack of another thread
+            # pylint: disable=W0212
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            with self.lock:
+                self.blocked_tick = tick
+                self.blocked_location = get_location(stack)
+                if self.blocked_location not in self.offenders:
+                    self.offenders[self.blocked_location] = Offender(
+                        location=self.blocked_location,
+                        stack="".join(
+                            traceback.format_list(stack[-self.STACK_FRAMES :])
+                        ),
+                    )
+
+    def finish_block(self: Self, resumed_tick: float) -> None:
+        """Records how long the loop was blocked, once it runs the timer again
+
+        Args:
+            resumed_tick (float): The time of the first tick after the block
+        """
+        blocked_seconds = resumed_tick - self.blocked_tick - self.INTERVAL
+        with self.lock:
+            offender = self.offenders.get(self.blocked_location)
+            if offender:
+                offender.count += 1
+                offender.total_seconds += blocked_seconds
+                offender.max_seconds = max(offender.max_seconds, blocked_seconds)
+            metrics.loop_blocks.inc(location=self.blocked_location)
+            self.blocked_tick = None
+            self.blocked_location = None
+
+    def take_offenders(self: Self) -> list[Offender]:
+        """Takes the offenders recorded since the last report, worst first
+
+        Returns:
+            list[Offender]: The offenders that blocked the loop at least once
+        """
+        with self.lock:
+            offenders, self.offenders = self.offenders, {}
+            # A block that is still going is recorded in the next report
+            if self.blocked_location in offenders:
+                self.offenders[self.blocked_location] = offenders.pop(
+                    self.blocked_location
+                )
+        return sorted(
+            (offender for offender in offenders.values() if offender.count),
+            key=lambda offender: offender.total_seconds,
+            reverse=True,
+        )
+
+    def format_report(self: Self, offenders: list[Offender]) -> str:
+        """Formats the worst offenders into a report
+
+        Args:
+            offenders (list[Offender]): The offenders, worst first
+
+        Returns:
+            str: The report, with the stack of the worst offender
+        """
+        blocks = sum(offender.count for offender in offenders)
+        lines = [
+            f"The event loop was blocked for over {self.threshold * 1000:.0f}ms "
+            f"{blocks} time(s) in the last {self.REPORT_SECONDS / 60:.0f} minutes"
+        ]
+        for offender in offenders[: self.TOP_OFFENDERS]:
+            lines.append(
+                f"`{offender.location}`: {offender.count} time(s), "
+                f"{offender.total_seconds * 1000:.0f}ms total, "
+                f"{offender.max_seconds * 1000:.0f}ms max"
+            )
+        stack = offenders[0].stack.replace("```", "'''")
+        lines.append(f"Stack of the worst offender:\n```py\n{stack}```")
+        return "\n".join(lines)
+
+    async def run_reports(self: Self) -> None:
+        """A forever loop that reports the worst offenders every REPORT_SECONDS"""
+        while not self.stopped.is_set():
+            await asyncio.sleep(self.REPORT_SECONDS)
+            offenders = self.take_offenders()
+            if not offenders:
+                continue
+            await self.bot.logger.send_log(
+                message=self.format_report(offenders),
+                level=LogLevel.WARNING,
+            )
@@ -0,0 +1,269 @@
+"""
+A shared window of the most recent messages in every channel
+The window is kept up to date from gateway events, so searching recent
+messages doesn't need a call to the discord API
+"""
+
+from __future__ import annotations
+
+import collections
+from collections.abc import Callable, Iterable
+from typing import Self
+
+import discord
+
+
+class ChannelWindow:
+    """The most recent messages in a single channel, oldest first
+    The messages are contiguous, there is never a gap between two of them
+
+    Args:
+        max_messages (int): The most messages to hold for the channel
+    """
+
+    def __init__(self: Self, max_messages: int) -> None:
+        self.messages: collections.deque[discord.Message] = collections.deque(
+            maxlen=max_messages
+        )
+        # True only while the window holds every message in the channel
+        self.complete: bool = False
+
+    def can_answer(self: Self, limit: int) -> bool:
+        """Checks if a search of the last messages can be answered from this window
+
+        Args:
+            limit (int): How many messages the search looks through
+
+        Returns:
+            bool: True if the window holds the last limit messages of the channel
+        """
+        return self.complete or len(self.messages) >= limit
+
+    def add(self: Self, message: discord.Message) -> None:
+        """Adds a newly sent message to the end of the window
+
+        Args:
+            message (discord.Message): The message that was sent
+        """
+        # A full window drops its oldest message, so no longer holds them all
+        if len(self.messages) == self.messages.maxlen:
+            self.complete = False
+        self.messages.append(message)
+
+    def replace(self: Self, message: discord.Message) -> None:
+        """Replaces a message in the window with an edited version
+
+        Args:
+            message (discord.Message): The edited message
+        """
+        for index in range(len(self.messages) - 1, -1, -1):
+            if self.messages[index].id == message.id:
+                self.messages[index] = message
+                return
+
+    def remove(self: Self, message_ids: set[int]) -> None:
+        """Removes deleted messages from the window
+
+        Args:
+            message_ids (set[int]): The IDs of the deleted messages
+        """
+        kept = [message for message in self.messages if message.id not in message_ids]
+        if len(kept) != len(self.messages):
+            self.messages.clear()
+            self.messages.extend(kept)
+
+
+class MessageWindow:
+    """Holds a ChannelWindow for every active channel, grouped by guild
+    Each guild has a cap on the messages it can hold, past which the
+    channels that have been idle the longest are dropped
+
+    Attributes:
+        CHANNEL_MESSAGES (int): The most messages held for a single channel
+        GUILD_MESSAGES (int): The most messages held across all channels in a guild
+    """
+
+    CHANNEL_MESSAGES: int = 50
+    GUILD_MESSAGES: int = 2000
+
+    def __init__(self: Self) -> None:
+        self.guilds: dict[int, collections.OrderedDict[int, ChannelWindow]] = {}
+        self.hits: int = 0
+        self.fallbacks: int = 0
+
+    def get_window(self: Self, channel: discord.abc.Messageable) -> ChannelWindow:
+        """Gets the window for a channel, and marks the channel as recently used
+
+        Args:
+            channel (discord.abc.Messageable): The channel to get the window for
+
+        Returns:
+            ChannelWindow: The window of the channel, or None if it isn't tracked
+        """
+        channels = self.guilds.get(get_guild_id(channel))
+        if not channels or channel.id not in channels:
+            return None
+        channels.move_to_end(channel.id)
+        return channels[channel.id]
+
+    def make_window(self: Self, channel: discord.abc.Messageable) -> ChannelWindow:
+        """Gets the window for a channel, creating it if it doesn't exist
+        Creating a window may drop the idle channels of the guild
+
+        Args:
+            channel (discord.abc.Messageable): The channel to get the window for
+
+        Returns:
+            ChannelWindow: The window of the channel
+        """
+        window = self.get_window(channel)
+        if window:
+            return window
+
+        channels = self.guilds.setdefault(
+            get_guild_id(channel), collections.OrderedDict()
+        )
+        window = ChannelWindow(self.CHANNEL_MESSAGES)
+        channels[channel.id] = window
+        while len(channels) > self.GUILD_MESSAGES // self.CHANNEL_MESSAGES:
+            channels.popitem(last=False)
+        return window
+
+    def add_message(self: Self, message: discord.Message) -> None:
+        """Adds a newly sent message to the window of its channel
+
+        Args:
+            message (discord.Message): The message that was sent
+        """
+        self.make_window(message.channel).add(message)
+
+    def edit_message(self: Self, message: discord.Message) -> None:
+        """Updates an edited message, if it is in the window
+
+        Args:
+            message (discord.Message): The message after the edit
+        """
+        window = self.get_window(message.channel)
+        if window:
+            window.replace(message)
+
+    def delete_messages(
+        self: Self, guild_id: int, channel_id: int, message_ids: Iterable[int]
+    ) -> None:
+        """Removes deleted messages from the window
+        This doesn't mark the channel as recently used
+
+        Args:
+            guild_id (int): The ID of the guild the channel is in, or None for DMs
+            channel_id (int): The ID of the channel the messages were deleted from
+            message_ids (Iterable[int]): The IDs of the deleted messages
+        """
+        window = self.guilds.get(guild_id, {}).get(channel_id)
+        if window:
+            window.remove(set(message_ids))
+
+    def remove_guild(self: Self, guild_id: int) -> None:
+        """Drops every window in a guild
+
+        Args:
+            guild_id (int): The ID of the guild to drop
+        """
+        self.guilds.pop(guild_id, None)
+
+    def clear(self: Self) -> None:
+        """Drops every window
+        This has to be called whenever events may have been missed
+        """
+        self.guilds.clear()
+
+    def fill(
+        self: Self,
+        channel: discord.abc.Messageable,
+        history: list[discord.Message],
+        limit: int,
+    ) -> None:
+        """Fills the window of a channel from its message history
+        Messages already in the window are kept, as they may be newer
+
+        Args:
+            channel (discord.abc.Messageable): The channel the history is from
+            history (list[discord.Message]): The messages, newest first
+            limit (int): How many messages were requested for the history
+        """
+        window = self.make_window(channel)
+        messages = {message.id: message for message in history}
+        messages.update({message.id: message for message in window.messages})
+        window.messages.clear()
+        window.messages.extend(messages[key] for key in sorted(messages))
+        # The history is the whole channel if it came back short, but a
+        # search past CHANNEL_MESSAGES may have read more than the window holds
+        if len(history) < limit and len(messages) <= window.messages.maxlen:
+            window.complete = True
+
+    def search(
+        self: Self,
+        channel: discord.abc.Messageable,
+        predicate: Callable[[discord.Message], bool],
+        limit: int,
+    ) -> tuple[bool, discord.Message]:
+        """Finds the most recent message in a channel that matches a predicate
+
+        Args:
+            channel (discord.abc.Messageable): The channel to search in
+            predicate (Callable[[discord.Message], bool]): The check a message must pass
+            limit (int): How many of the most recent messages to look through
+
+        Returns:
+            tuple[bool, discord.Message]: If the window could answer the search,
+                and the message found, or None if no message matched
+        """
+        window = self.get_window(channel)
+        if not window:
+            self.fallbacks += 1
+            return False, None
+
+        for index, message in enumerate(reversed(window.messages)):
+            if index >= limit:
+                break
+            if predicate(message):
+                self.hits += 1
+                return True, message
+
+        if not window.can_answer(limit):
+            self.fallbacks += 1
+            return False, None
+
+        self.hits += 1
+        return True, None
+
+    def get_stats(self: Self) -> dict[str, int]:
+        """Gets the usage statistics of the window
+
+        Returns:
+            dict[str, int]: The hit, fallback, channel and message counts
+        """
+        windows = [
+            window for channels in self.guilds.values() for window in channels.values()
+        ]
+        return {
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "channels": len(windows),
+            "messages": sum(len(window.messages) for window in windows),
+        }
+
+
+def get_guild_id(channel: discord.abc.Messageable) -> int:
+    """Gets the ID of the guild a channel belongs to
+
+    Args:
+        channel (discord.abc.Messageable): The channel to get the guild of
+
+    Returns:
+        int: The ID of the guild, or None if the channel isn't in a guild
+    """
+    guild = getattr(channel, "guild", None)
+    return guild.id if guild else None
+
+
+recent_messages = MessageWindow()
@@ -0,0 +1,581 @@
+"""
+Counters, gauges and latency histograms for the work the bot does,
+served over HTTP in the prometheus text format
+Commands, match cogs, listeners, HTTP calls and database queries are timed
+from hooks in the core, so extensions are measured without any changes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from typing import TYPE_CHECKING, Any, Self
+
+import aiohttp
+from aiohttp import web
+
+from core import message_window
+
+if TYPE_CHECKING:
+    import gino
+
+    import bot
+
+# Latency buckets in seconds, from a cached lookup up to a slow API call
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+# The gino query methods that are timed
+QUERY_METHODS: tuple[str, ...] = (
+    "all",
+    "first",
+    "one",
+    "one_or_none",
+    "scalar",
+    "status",
+)
+
+
+def escape_label(value: str) -> str:
+    """Escapes a label value for the prometheus text format
+
+    Args:
+        value (str): The label value
+
+    Returns:
+        str: The value with backslashes, quotes and newlines escaped
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """Formats a set of labels for a sample line
+
+    Args:
+        names (tuple[str, ...]): The names of the labels
+        values (tuple[str, ...]): The values of the labels, in the same order
+
+    Returns:
+        str: The labels in braces, or an empty string if there are none
+    """
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+class Counter:
+    """A value per set of labels that only goes up
+
+    Args:
+        name (str): The name of the metric
+        documentation (str): The help text of the metric
+        label_names (tuple[str, ...]): The names of the labels of every sample
+
+    Attributes:
+        TYPE (str): The prometheus type of the metric
+    """
+
+    TYPE: str = "counter"
+
+    def __init__(
+        self: Self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def get_key(self: Self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Gets the values of the labels, in the order of the label names
+
+        Args:
+            labels (dict[str, str]): The labels of a sample
+
+        Returns:
+            tuple[str, ...]: The label values
+        """
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def inc(self: Self, amount: float = 1, **labels: str) -> None:
+        """Adds to the value of a sample
+
+        Args:
+            amount (float, optional): How much to add. Defaults to 1.
+            **labels (str): The labels of the sample
+        """
+        key = self.get_key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def set(self: Self, value: float, **labels: str) -> None:
+        """Sets the value of a sample, for totals that are kept somewhere else
+
+        Args:
+            value (float): The new value
+            **labels (str): The labels of the sample
+        """
+        self.values[self.get_key(labels)] = value
+
+    def render(self: Self) -> list[str]:
+        """Renders the metric in the prometheus text format
+
+        Returns:
+            list[str]: The lines of the metric
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        for key, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{format_labels(self.label_names, key)} {value}")
+        return lines
+
+
+class Gauge(Counter):
+    """A value per set of labels that can go up and down
+
+    Attributes:
+        TYPE (str): The prometheus type of the metric
+    """
+
+    TYPE: str = "gauge"
+
+
+class Histogram:
+    """Counts observations per set of labels into cumulative buckets
+
+    Args:
+        name (str): The name of the metric
+        documentation (str): The help text of the metric
+        label_names (tuple[str, ...]): The names of the labels of every sample
+        buckets (tuple[float, ...]): The upper bounds of the buckets, in order
+    """
+
+    def __init__(
+        self: Self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        # The count in each bucket, not cumulative, with the overflow bucket last
+        self.counts: dict[tuple[str, ...], list[int]] = {}
+        self.sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self: Self, value: float, **labels: str) -> None:
+        """Counts a single observation
+
+        Args:
+            value (float): The observed value, in seconds for latencies
+            **labels (str): The labels of the sample
+        """
+        key = tuple(str(labels[name]) for name in self.label_names)
+        if key not in self.counts:
+            self.counts[key] = [0] * (len(self.buckets) + 1)
+            self.sums[key] = 0.0
+        index = len(self.buckets)
+        for bucket_index, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = bucket_index
+                break
+        self.counts[key][index] += 1
+        self.sums[key] += value
+
+    @contextlib.contextmanager
+    def measure(self: Self, **labels: str) -> Iterator[None]:
+        """Times the body of a with statement, even if it raises
+
+        Args:
+            **labels (str): The labels of the sample
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self: Self) -> list[str]:
+        """Renders the metric in the prometheus text format
+
+        Returns:
+            list[str]: The lines of the metric
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        bucket_labels = self.label_names + ("le",)
+        for key, counts in sorted(self.counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                labels = format_labels(bucket_labels, key + (str(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {self.sums[key]}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds every metric, and renders them all for a scrape
+    Collectors are called before every scrape, to update values
+    that are cheaper to read than to keep up to date
+    """
+
+    def __init__(self: Self) -> None:
+        self.metrics: list[Counter | Histogram] = []
+        self.collectors: list[Callable[[], None]] = []
+
+    def counter(
+        self: Self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Counter:
+        """Makes and registers a counter
+
+        Args:
+            name (str): The name of the metric
+            documentation (str): The help text of the metric
+            label_names (tuple[str, ...], optional): The label names. Defaults to ().
+
+        Returns:
+            Counter: The new counter
+        """
+        metric = Counter(name, documentation, label_names)
+        self.metrics.append(metric)
+        return metric
+
+    def gauge(
+        self: Self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Gauge:
+        """Makes and registers a gauge
+
+        Args:
+            name (str): The name of the metric
+            documentation (str): The help text of the metric
+            label_names (tuple[str, ...], optional): The label names. Defaults to ().
+
+        Returns:
+            Gauge: The new gauge
+        """
+        metric = Gauge(name, documentation, label_names)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(
+        self: Self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Histogram:
+        """Makes and registers a histogram with the default latency buckets
+
+        Args:
+            name (str): The name of the metric
+            documentation (str): The help text of the metric
+            label_names (tuple[str, ...], optional): The label names. Defaults to ().
+
+        Returns:
+            Histogram: The new histogram
+        """
+        metric = Histogram(name, documentation, label_names)
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self: Self, collector: Callable[[], None]) -> None:
+        """Registers a function to call before every scrape
+
+        Adding the same function again does nothing
+
+        Args:
+            collector (Callable[[], None]): The function, which sets metric values
+        """
+        if collector not in self.collectors:
+            self.collectors.append(collector)
+
+    def remove_collector(self: Self, collector: Callable[[], None]) -> None:
+        """Stops calling a function before every scrape
+
+        Args:
+            collector (Callable[[], None]): The function that was registered
+        """
+        if collector in self.collectors:
+            self.collectors.remove(collector)
+
+    def render(self: Self) -> str:
+        """Runs the collectors, and renders every metric
+
+        Returns:
+            str: The metrics in the prometheus text format
+        """
+        for collector in self.collectors:
+            collector()
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+command_seconds = registry.histogram(
+    "bot_command_duration_seconds",
+    "Time taken to run a command",
+    ("command", "kind", "outcome"),
+)
+match_seconds = registry.histogram(
+    "bot_match_cog_duration_seconds",
+    "Time taken by the match and response of a match cog",
+    ("cog", "stage"),
+)
+listener_seconds = registry.histogram(
+    "bot_listener_duration_seconds",
+    "Time taken by an event listener",
+    ("event", "cog"),
+)
+http_seconds = registry.histogram(
+    "bot_http_request_duration_seconds",
+    "Time taken by an HTTP call to an outside API",
+    ("host", "method"),
+)
+query_seconds = registry.histogram(
+    "bot_database_query_duration_seconds",
+    "Time taken by a database query",
+    ("operation", "table"),
+)
+cache_requests = registry.counter(
+    "bot_cache_requests_total",
+    "Lookups in a cache, by whether they were served from it",
+    ("cache", "result"),
+)
+discord_requests = registry.counter(
+    "bot_discord_requests_total",
+    "Requests made to the discord REST API",
+    ("method", "status"),
+)
+discord_rate_limits = registry.counter(
+    "bot_discord_rate_limited_total",
+    "Requests to the discord REST API that were rate limited",
+    ("scope",),
+)
+loop_lag_seconds = registry.histogram(
+    "bot_event_loop_lag_seconds",
+    "How late the event loop ran a timer",
+)
+loop_blocks = registry.counter(
+    "bot_event_loop_blocked_total",
+    "Times the event loop was blocked past the lag threshold, by the code blocking it",
+    ("location",),
+)
+queue_depth = registry.gauge(
+    "bot_queue_depth",
+    "Items waiting in a queue",
+    ("queue",),
+)
+
+
+def time_listener(
+    func: Callable[..., Awaitable[None]], event: str
+) -> Callable[..., Awaitable[None]]:
+    """Wraps an event listener so every call is timed
+
+    Args:
+        func (Callable[..., Awaitable[None]]): The listener
+        event (str): The name of the event it listens for
+
+    Returns:
+        Callable[..., Awaitable[None]]: The timed listener
+    """
+    owner = getattr(func, "__self__", None)
+    cog = type(owner).__name__ if owner is not None else "bot"
+
+    @functools.wraps(func)
+    async def timed_listener(*args: tuple, **kwargs: dict[str, Any]) -> None:
+        """Runs and times the listener
+
+        Args:
+            *args (tuple): The arguments of the event
+            **kwargs (dict[str, Any]): The keyword arguments of the event
+        """
+        with listener_seconds.measure(event=event, cog=cog):
+            await func(*args, **kwargs)
+
+    return timed_listener
+
+
+def get_query_table(clause: object) -> str:
+    """Gets the name of the table a query runs against
+
+    Args:
+        clause (object): The query, as a sqlalchemy clause or raw SQL
+
+    Returns:
+        str: The name of the table, or "raw" for SQL strings
+    """
+    if isinstance(clause, str):
+        return "raw"
+    table = getattr(clause, "table", None)
+    if table is None:
+        froms = getattr(clause, "froms", None)
+        table = froms[0] if froms else None
+    return getattr(table, "name", "unknown")
+
+
+def time_query(
+    method: Callable[..., Awaitable[Any]], operation: str
+) -> Callable[..., Awaitable[Any]]:
+    """Wraps a gino query method so every query is timed
+
+    Args:
+        method (Callable[..., Awaitable[Any]]): The bound query method of the engine
+        operation (str): The name of the method
+
+    Returns:
+        Callable[..., Awaitable[Any]]: The timed query method
+    """
+
+    @functools.wraps(method)
+    async def timed_query(
+        clause: object, *multiparams: tuple, **params: dict[str, Any]
+    ) -> object:
+        """Runs and times the query
+
+        Args:
+            clause (object): The query to run
+            *multiparams (tuple): The parameters of the query
+            **params (dict[str, Any]): The named parameters of the query
+
+        Returns:
+            object: The result of the query
+        """
+        with query_seconds.measure(operation=operation, table=get_query_table(clause)):
+            return await method(clause, *multiparams, **params)
+
+    return timed_query
+
+
+def instrument_engine(engine: gino.GinoEngine) -> None:
+    """Times every query run through a gino engine
+    Model queries, such as query.gino.first() and row.create(), run through
+    the engine the models are bound to, so they are all timed
+
+    Args:
+        engine (gino.GinoEngine): The engine to time the queries of
+    """
+    for operation in QUERY_METHODS:
+        setattr(engine, operation, time_query(getattr(engine, operation), operation))
+
+
+async def on_discord_request_end(
+    _session: aiohttp.ClientSession,
+    _context: object,
+    params: aiohttp.TraceRequestEndParams,
+) -> None:
+    """Counts a finished request to discord, from the discord.py HTTP session
+
+    Args:
+        _session (aiohttp.ClientSession): The session that made the request
+        _context (object): The trace context of the request
+        params (aiohttp.TraceRequestEndParams): The request and its response
+    """
+    status = params.response.status
+    discord_requests.inc(method=params.method, status=status)
+    if status == 429:
+        discord_rate_limits.inc(
+            scope=params.response.headers.get("X-RateLimit-Scope", "unknown")
+        )
+
+
+def create_discord_trace() -> aiohttp.TraceConfig:
+    """Makes the trace config to give to discord.py, to count its REST calls
+
+    Returns:
+        aiohttp.TraceConfig: The trace config
+    """
+    trace = aiohttp.TraceConfig()
+    trace.on_request_end.append(on_discord_request_end)
+    return trace
+
+
+def get_queues(owner: object) -> dict[str, asyncio.Queue]:
+    """Finds the asyncio queues stored on an object
+
+    Args:
+        owner (object): The object to look through, such as a cog
+
+    Returns:
+        dict[str, asyncio.Queue]: The queues, by the class and attribute name
+    """
+    queues = {}
+    for attribute, value in vars(owner).items():
+        if isinstance(value, asyncio.Queue):
+            # Private attributes have the class name mangled into them
+            name = attribute.split("__")[-1].lstrip("_")
+            queues[f"{type(owner).__name__}.{name}"] = value
+    return queues
+
+
+def collect_bot_metrics(discord_bot: bot.TechSupportBot) -> None:
+    """Reads the queue depths and cache statistics kept by the bot and its cogs
+
+    Args:
+        discord_bot (bot.TechSupportBot): The bot to read from
+    """
+    owners = [discord_bot.logger, *discord_bot.cogs.values()]
+    for owner in owners:
+        for name, queue in get_queues(owner).items():
+            queue_depth.set(queue.qsize(), queue=name)
+
+    window_stats = message_window.recent_messages.get_stats()
+    cache_requests.set(window_stats["hits"], cache="message_window", result="hit")
+    cache_requests.set(window_stats["fallbacks"], cache="message_window", result="miss")
+
+
+async def handle_scrape(_request: web.Request) -> web.Response:
+    """Serves every metric for a prometheus scrape
+
+    Args:
+        _request (web.Request): The scrape request
+
+    Returns:
+        web.Response: The metrics in the prometheus text format
+    """
+    return web.Response(
+        text=registry.render(),
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
+
+
+async def start_server(host: str, port: int) -> web.AppRunner:
+    """Starts serving the metrics at /metrics
+
+    Args:
+        host (str): The address to listen on
+        port (int): The port to listen on
+
+    Returns:
+        web.AppRunner: The runner of the server, which stops it with cleanup()
+    """
+    app = web.Application()
+    app.router.add_get("/metrics", handle_scrape)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
@@ -0,0 +1,104 @@
+"""
+A command rate limiter with a fixed memory cost per member
+Each member is tracked with a single timestamp, using the generic cell rate
+algorithm, so checking a command never looks at the commands before it
+"""
+
+from __future__ import annotations
+
+import collections
+import sys
+import time
+from typing import Self
+
+
+class RateLimiter:
+    """Counts commands per key, allowing a burst of commands in every period
+    Keys that have been idle for a whole period hold no information, and are
+    dropped as new commands come in
+
+    Args:
+        max_keys (int): The most keys to track at once, past which the keys
+            that have been idle the longest are dropped
+
+    Attributes:
+        TOLERANCE (float): Slack for float rounding, so a full burst is always allowed
+    """
+
+    TOLERANCE: float = 1e-6
+
+    def __init__(self: Self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        # The time the key is fully idle again, the last command and its result
+        self.entries: collections.OrderedDict[
+            tuple[int, int], tuple[float, int, bool]
+        ] = collections.OrderedDict()
+
+    def check(
+        self: Self,
+        key: tuple[int, int],
+        command_id: int,
+        limit: int,
+        period: float,
+        now: float = None,
+    ) -> bool:
+        """Counts a command, and checks if the key is still under the limit
+        A single command is only counted once, no matter how often it is checked
+
+        Args:
+            key (tuple[int, int]): The key to count the command for
+            command_id (int): The ID of the message or interaction
+            limit (int): How many commands are allowed in a period
+            period (float): The length of the period, in seconds
+            now (float, optional): The current monotonic time. Defaults to None.
+
+        Returns:
+            bool: True if the key is within the limit, False if it went over
+        """
+        if now is None:
+            now = time.monotonic()
+        self.evict_idle(now)
+
+        idle_at, last_command_id, allowed = self.entries.get(key, (now, None, True))
+        if command_id == last_command_id:
+            return allowed
+
+        # Every command pushes the idle time back by an equal share of the period
+        # Commands over the limit aren't counted, so the key recovers on time
+        new_idle_at = max(idle_at, now) + period / max(limit, 1)
+        allowed = new_idle_at - now <= period + self.TOLERANCE
+        if allowed:
+            idle_at = new_idle_at
+
+        self.entries[key] = (idle_at, command_id, allowed)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_keys:
+            self.entries.popitem(last=False)
+
+        return allowed
+
+    def evict_idle(self: Self, now: float) -> None:
+        """Drops keys that are fully idle, oldest first
+        This stops at the first key that is still active, so it costs
+        nothing when there is nothing to drop
+
+        Args:
+            now (float): The current monotonic time
+        """
+        while self.entries:
+            key, (idle_at, _, _) = next(iter(self.entries.items()))
+            if idle_at > now:
+                return
+            del self.entries[key]
+
+    def get_stats(self: Self) -> dict[str, int]:
+        """Gets the size of the rate limiter
+
+        Returns:
+            dict[str, int]: The number of tracked keys, and the approximate bytes used
+        """
+        size = sys.getsizeof(self.entries) + sum(
+            sys.getsizeof(key) + sys.getsizeof(entry)
+            for key, entry in self.entries.items()
+        )
+        return {"keys": len(self.entries), "bytes": size}
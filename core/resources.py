@@ -0,0 +1,167 @@
+"""
+A small registry for the static files stored in the resources directory
+Files are read once, cached as immutable objects, and only re-read when
+the file on disk has been modified
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import IO, Any, Self
+
+import munch
+
+RESOURCES_DIR: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources"
+)
+
+
+@dataclass
+class CachedResource:
+    """A single parsed resource, and the file state it was parsed from
+
+    Attributes:
+        modified_time (int): The st_mtime_ns of the file when it was read
+        value (Any): The parsed contents of the file
+    """
+
+    modified_time: int
+    value: Any
+
+
+_resource_cache: dict[tuple[str, Callable[[IO[str]], Any]], CachedResource] = {}
+
+
+def get_resource(
+    file_name: str, parser: Callable[[IO[str]], Any]
+) -> Any:  # noqa: ANN401
+    """Gets a parsed resource file, reading it from disk only when needed
+    The parser must be a module level function, as it is part of the cache key
+
+    Args:
+        file_name (str): The name of the file inside the resources directory
+        parser (Callable[[IO[str]], Any]): The function that turns the open file
+            into the object to cache
+
+    Returns:
+        Any: The parsed resource. This is shared, and must not be modified
+    """
+    path = os.path.join(RESOURCES_DIR, file_name)
+    modified_time = os.stat(path).st_mtime_ns
+    cache_key = (path, parser)
+
+    cached = _resource_cache.get(cache_key)
+    if cached and cached.modified_time == modified_time:
+        return cached.value
+
+    with open(path, "r", encoding="utf-8") as resource_file:
+        value = parser(resource_file)
+    _resource_cache[cache_key] = CachedResource(modified_time, value)
+    return value
+
+
+def parse_lines(resource_file: IO[str]) -> tuple[str, ...]:
+    """Parses a text file into a tuple of its non empty, stripped lines
+
+    Args:
+        resource_file (IO[str]): The open text file
+
+    Returns:
+        tuple[str, ...]: Every line in the file
+    """
+    return tuple(
+        line.strip() for line in resource_file.read().splitlines() if line.strip()
+    )
+
+
+def parse_json(resource_file: IO[str]) -> Any:  # noqa: ANN401
+    """Parses a json file
+
+    Args:
+        resource_file (IO[str]): The open json file
+
+    Returns:
+        Any: The decoded json
+    """
+    return json.load(resource_file)
+
+
+def parse_munch(resource_file: IO[str]) -> munch.Munch:
+    """Parses a json file into a munch object
+
+    Args:
+        resource_file (IO[str]): The open json file
+
+    Returns:
+        munch.Munch: The decoded json, as a munch
+    """
+    return munch.munchify(json.load(resource_file))
+
+
+def get_lines(file_name: str) -> tuple[str, ...]:
+    """Gets every line of a text resource
+
+    Args:
+        file_name (str): The name of the file inside the resources directory
+
+    Returns:
+        tuple[str, ...]: Every non empty line of the file
+    """
+    return get_resource(file_name, parse_lines)
+
+
+def get_json(file_name: str, as_munch: bool = False) -> Any:  # noqa: ANN401
+    """Gets a decoded json resource
+
+    Args:
+        file_name (str): The name of the file inside the resources directory
+        as_munch (bool, optional): True if the json should be munchified. Defaults to False.
+
+    Returns:
+        Any: The decoded json. This is shared, and must not be modified
+    """
+    return get_resource(file_name, parse_munch if as_munch else parse_json)
+
+
+class ShuffledCursor:
+    """Picks items from a sequence in a random order without repeats
+    Every item is returned once before any item is returned again,
+    and an item is never returned twice in a row
+    """
+
+    def __init__(self: Self) -> None:
+        self.items: tuple = ()
+        self.order: list = []
+        self.position: int = 0
+        self.last: Any = None
+
+    def pick(self: Self, items: tuple) -> Any:  # noqa: ANN401
+        """Gets the next item, starting over if the items have changed
+
+        Args:
+            items (tuple): The items to pick from
+
+        Returns:
+            Any: The next item in the shuffled order
+        """
+        if items is not self.items:
+            self.items = items
+            self.order = []
+            self.position = 0
+
+        if self.position >= len(self.order):
+            self.order = list(items)
+            random.shuffle(self.order)
+            # Avoid repeating the last item across the reshuffle boundary
+            if len(self.order) > 1 and self.order[0] == self.last:
+                self.order[0], self.order[-1] = self.order[-1], self.order[0]
+            self.position = 0
+
+        selection = self.order[self.position]
+        self.position += 1
+        self.last = selection
+        return selection
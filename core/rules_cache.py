@@ -0,0 +1,53 @@
+"""
+A shared cache of the parsed rules of every guild
+It lives in core, rather than in the rules extension, so that reloading
+rules doesn't leave modmail reading an old copy of the cache
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+
+class RulesCache:
+    """Holds the parsed rules of every guild that has asked for them
+    The rules are only read from the database again once they are written
+    """
+
+    def __init__(self: Self) -> None:
+        self.rules: dict[int, object] = {}
+
+    def get(self: Self, guild_id: int) -> object:
+        """Gets the parsed rules of a guild
+
+        Args:
+            guild_id (int): The ID of the guild
+
+        Returns:
+            object: The parsed rules, or None if they aren't cached
+        """
+        return self.rules.get(guild_id)
+
+    def set(self: Self, guild_id: int, guild_rules: object) -> None:
+        """Caches the parsed rules of a guild
+
+        Args:
+            guild_id (int): The ID of the guild
+            guild_rules (object): The parsed rules
+        """
+        self.rules[guild_id] = guild_rules
+
+    def drop(self: Self, guild_id: int) -> None:
+        """Forgets the rules of a guild, so they are read again
+
+        Args:
+            guild_id (int): The ID of the guild
+        """
+        self.rules.pop(guild_id, None)
+
+    def clear(self: Self) -> None:
+        """Forgets the rules of every guild"""
+        self.rules.clear()
+
+
+parsed_rules = RulesCache()
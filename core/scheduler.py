@@ -12,6 +12,7 @@ import random
 import uuid
 from typing import TYPE_CHECKING, Self
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
@@ -57,6 +58,7 @@ class SchedulerService:
         task_name: str,
         run_at: datetime.datetime,
         payload: dict,
+        run_if_late: bool = False,
     ) -> str:
         """This schedules a task at a particular date in the future
 
@@ -65,6 +67,9 @@ class SchedulerService:
             run_at (datetime.datetime): The time to run this task
             payload (dict): The data needed to run this task.
                 May include channels, guilds, strings, members, etc
+            run_if_late (bool, optional): True if the task should still run when
+                it is late, such as when the scheduler starts after run_at.
+                Otherwise a task over a second late is skipped. Defaults to False.
 
         Raises:
             AttributeError: Raised if the job being scheduled hasn't been registered
@@ -85,6 +90,7 @@ class SchedulerService:
             args=[payload],
             id=job_id,
             replace_existing=True,
+            **({"misfire_grace_time": None} if run_if_late else {}),
         )
 
         return job_id
@@ -167,6 +173,18 @@ class SchedulerService:
 
         return await self.schedule_date(task_name, run_at, payload)
 
+    async def cancel_task(self: Self, job_id: str) -> None:
+        """This cancels a scheduled task before it runs
+        Nothing happens if the task has already run
+
+        Args:
+            job_id (str): The job ID returned when the task was scheduled
+        """
+        try:
+            self.scheduler.remove_job(job_id)
+        except JobLookupError:
+            pass
+
     # Getting tasks and other internal functions
 
     async def get_upcoming_tasks(self: Self) -> list[dict]:
@@ -0,0 +1,200 @@
+"""
+Tools to make startup faster, and to find out what makes it slow
+Extensions are imported ahead of time in worker threads, and every startup
+stage and extension is timed in a timeline that can be reported later
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import importlib.abc
+import importlib.machinery
+import sys
+import time
+import types
+from collections.abc import Iterator
+from concurrent import futures
+from typing import Self
+
+
+class StartupTimeline:
+    """Records how long each startup stage and extension took
+
+    Attributes:
+        PHASES (tuple[str, ...]): The phases timed for every extension
+    """
+
+    PHASES: tuple[str, ...] = ("import", "setup", "preconfig")
+
+    def __init__(self: Self) -> None:
+        self.started_at: float = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        self.extensions: dict[str, dict[str, float]] = {}
+
+    @contextlib.contextmanager
+    def time_stage(self: Self, stage: str) -> Iterator[None]:
+        """Times a startup stage, for use in a with statement
+
+        Args:
+            stage (str): The name of the stage
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[stage] = time.perf_counter() - start
+
+    def mark(self: Self, stage: str) -> None:
+        """Records a point in startup, as the time since the timeline began
+
+        Args:
+            stage (str): The name of the point in startup
+        """
+        self.stages[stage] = time.perf_counter() - self.started_at
+
+    def record_extension(
+        self: Self, extension: str, phase: str, seconds: float
+    ) -> None:
+        """Records how long a phase of loading an extension took
+        Phases recorded more than once, such as preconfig for extensions
+        with many cogs, are added together
+
+        Args:
+            extension (str): The name of the extension, without the modules prefix
+            phase (str): One of PHASES
+            seconds (float): How long the phase took
+        """
+        times = self.extensions.setdefault(extension, {})
+        times[phase] = times.get(phase, 0) + seconds
+
+    def build_report(self: Self, limit: int = 10) -> str:
+        """Builds a plain text report of the startup timeline
+
+        Args:
+            limit (int, optional): How many of the slowest extensions to list.
+                Defaults to 10.
+
+        Returns:
+            str: The report, one line per stage or extension
+        """
+        lines = ["Stages:"]
+        lines.extend(
+            f"  {stage:<24} {seconds * 1000:>9.1f} ms"
+            for stage, seconds in self.stages.items()
+        )
+
+        totals = {
+            phase: sum(times.get(phase, 0) for times in self.extensions.values())
+            for phase in self.PHASES
+        }
+        lines.append(
+            f"Extensions ({len(self.extensions)}): "
+            + ", ".join(
+                f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in totals.items()
+            )
+        )
+
+        slowest = sorted(
+            self.extensions.items(),
+            key=lambda item: sum(item[1].values()),
+            reverse=True,
+        )[:limit]
+        for extension, times in slowest:
+            phases = " ".join(
+                f"{phase} {times[phase] * 1000:.1f}"
+                for phase in self.PHASES
+                if phase in times
+            )
+            lines.append(f"  {extension:<24} {phases} ms")
+
+        return "\n".join(lines)
+
+
+class ImportedModuleLoader(importlib.abc.Loader):
+    """A loader that hands back a module that has already been imported
+    This lets discord.py load an extension that was imported in a worker
+    thread, without running the module a second time
+
+    Args:
+        module (types.ModuleType): The already imported module
+    """
+
+    def __init__(self: Self, module: types.ModuleType) -> None:
+        self.module = module
+
+    def create_module(
+        self: Self, spec: importlib.machinery.ModuleSpec
+    ) -> types.ModuleType:
+        """Gives the imported module in place of a new one
+
+        Args:
+            spec (importlib.machinery.ModuleSpec): The spec being loaded
+
+        Returns:
+            types.ModuleType: The already imported module
+        """
+        return self.module
+
+    def exec_module(self: Self, module: types.ModuleType) -> None:
+        """Does nothing, as the module has already been run
+
+        Args:
+            module (types.ModuleType): The already imported module
+        """
+
+
+@contextlib.contextmanager
+def reuse_imported_module(name: str) -> Iterator[None]:
+    """Makes the next load of a module reuse the copy in sys.modules
+    The original spec is put back afterwards, so reloading works as normal
+
+    Args:
+        name (str): The full dotted name of the module
+    """
+    module = sys.modules.get(name)
+    original_spec = getattr(module, "__spec__", None)
+    if original_spec is not None:
+        module.__spec__ = importlib.machinery.ModuleSpec(
+            name, ImportedModuleLoader(module), origin=original_spec.origin
+        )
+    try:
+        yield
+    finally:
+        if original_spec is not None:
+            module.__spec__ = original_spec
+
+
+def import_module_timed(name: str) -> float:
+    """Imports a module, and times how long it took
+    Import errors are left for the real load to report
+
+    Args:
+        name (str): The full dotted name of the module
+
+    Returns:
+        float: How long the import took, in seconds
+    """
+    start = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except Exception:
+        pass
+    return time.perf_counter() - start
+
+
+def import_modules(names: list[str], max_workers: int = 4) -> dict[str, float]:
+    """Imports many modules at once in a pool of worker threads
+    This blocks, and should itself be run in a worker thread
+
+    Args:
+        names (list[str]): The full dotted names of the modules
+        max_workers (int, optional): How many modules to import at once. Defaults to 4.
+
+    Returns:
+        dict[str, float]: How long each import took, in seconds
+    """
+    with futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="extension-import"
+    ) as executor:
+        return dict(zip(names, executor.map(import_module_timed, names)))
@@ -0,0 +1,63 @@
+"""
+A shared cache of automod verdicts
+It lives in core, rather than in the automod extension, so that reloading
+automod doesn't leave paste, relay or /bot holding an old copy of the cache
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Self
+
+import expiringdict
+
+
+class VerdictCache:
+    """Holds the automod verdicts of recently checked content
+    Every cog that checks the same content gets the same verdict, and a check
+    that is still running is awaited instead of being started again
+    """
+
+    def __init__(self: Self) -> None:
+        self.verdicts: expiringdict.ExpiringDict[tuple, asyncio.Task] = (
+            expiringdict.ExpiringDict(max_len=1000, max_age_seconds=300)
+        )
+        self.duplicates_avoided: int = 0
+
+    async def get(
+        self: Self, key: tuple, evaluate: Callable[[], Awaitable[object]]
+    ) -> object:
+        """Gets the verdict for a key, evaluating it if it isn't cached
+
+        Args:
+            key (tuple): What was checked, including a hash of the content
+            evaluate (Callable[[], Awaitable[object]]): Runs the checks
+
+        Raises:
+            exception: Any exception raised while running the checks
+
+        Returns:
+            object: The verdict. This is shared, and must not be modified
+        """
+        verdict_task = self.verdicts.get(key)
+        if verdict_task is None:
+            verdict_task = asyncio.create_task(evaluate())
+            self.verdicts[key] = verdict_task
+        else:
+            self.duplicates_avoided += 1
+
+        try:
+            return await asyncio.shield(verdict_task)
+        except Exception as exception:
+            # Don't keep failed checks, so the next call can try again
+            if self.verdicts.get(key) is verdict_task:
+                del self.verdicts[key]
+            raise exception
+
+    def clear(self: Self) -> None:
+        """Forgets every verdict, so content is checked again with new rules"""
+        self.verdicts.clear()
+
+
+verdict_cache = VerdictCache()
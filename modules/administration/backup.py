@@ -1,11 +1,17 @@
-"""The channel slowmode modification extension
+"""The data backup extension
 Holds only a single slash command"""
 
 from __future__ import annotations
 
+import asyncio
 import csv
+import enum
+import io
+import json
+import os
+import tempfile
 import zipfile
-from typing import TYPE_CHECKING, Self
+from typing import IO, TYPE_CHECKING, Self
 
 import discord
 import yaml
@@ -18,7 +24,7 @@ if TYPE_CHECKING:
 
 
 async def setup(bot: bot.TechSupportBot) -> None:
-    """Registers the slowmode cog
+    """Registers the backup cog
 
     Args:
         bot (bot.TechSupportBot): The bot to register the cog to
@@ -26,8 +32,71 @@ async def setup(bot: bot.TechSupportBot) -> None:
     await bot.add_cog(BackupCommand(bot=bot))
 
 
+class BackupFormat(enum.Enum):
+    """The file formats a table can be exported as
+
+    Attributes:
+        CSV (str): Comma separated values, with a header row
+        JSONL (str): One json object per line, which is faster to reload
+    """
+
+    CSV: str = "csv"
+    JSONL: str = "jsonl"
+
+
+class TableWriter:
+    """Writes rows of a single table into an entry of the backup zip file
+    Every method here blocks, and should be run in a worker thread
+
+    Args:
+        zip_file (zipfile.ZipFile): The open backup zip file
+        table_name (str): The name of the table being written
+        columns (list[str]): The column names of the table
+        data_format (BackupFormat): The format to write the rows in
+    """
+
+    def __init__(
+        self: Self,
+        zip_file: zipfile.ZipFile,
+        table_name: str,
+        columns: list[str],
+        data_format: BackupFormat,
+    ) -> None:
+        self.data_format = data_format
+        self.entry: IO[bytes] = zip_file.open(
+            f"{table_name}.{data_format.value}", "w", force_zip64=True
+        )
+        self.stream = io.TextIOWrapper(self.entry, encoding="utf-8", newline="")
+        self.csv_writer = None
+        if data_format is BackupFormat.CSV:
+            self.csv_writer = csv.DictWriter(self.stream, fieldnames=columns)
+            self.csv_writer.writeheader()
+
+    def write_rows(self: Self, rows: list[dict]) -> None:
+        """Compresses and writes a batch of rows to the zip file
+
+        Args:
+            rows (list[dict]): The rows to write, as dicts of column name to value
+        """
+        if self.csv_writer:
+            self.csv_writer.writerows(rows)
+        else:
+            for row in rows:
+                self.stream.write(json.dumps(row, default=str) + "\n")
+
+    def close(self: Self) -> None:
+        """Flushes the remaining data and closes the zip entry"""
+        self.stream.close()
+
+
 class BackupCommand(cogs.BaseCog):
-    """The cog that holds the slowmode commands and helper functions"""
+    """The cog that holds the backup command and helper functions
+
+    Attributes:
+        BATCH_SIZE (int): How many rows to read from postgres before writing them
+    """
+
+    BATCH_SIZE: int = 1000
 
     @app_commands.check(auxiliary.bot_admin_check_interaction)
     @app_commands.command(
@@ -35,60 +104,106 @@ class BackupCommand(cogs.BaseCog):
         description="Backs up data into a zip file",
     )
     async def backup(
-        self: Self, interaction: discord.Interaction, config_file: bool = False
+        self: Self,
+        interaction: discord.Interaction,
+        config_file: bool = False,
+        data_format: BackupFormat = BackupFormat.CSV,
     ) -> None:
         """Gets a data backup of everything
+        Tables are streamed from postgres and compressed in a worker thread,
+        so large tables don't block the bot or have to fit in memory
 
         Args:
             interaction (discord.Interaction): The interaction that called this command
             config_file (bool): Sets whether to include the yaml config file in the zip or not
+            data_format (BackupFormat): The file format to export each table as
         """
-        # Databases
-        csv_files = []
-        for table_name, table in self.bot.models.items():
-            # Query all data from the table
-            data = await table.query.gino.all()
-
-            # Save data to a CSV file
-            csv_file = f"{table_name}.csv"
-            with open(csv_file, "w", newline="", encoding="utf-8") as csvfile:
-                if data:
-                    fieldnames = (
-                        data[0].to_dict().keys()
-                    )  # Convert the first row to a dict to get the field names
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for row in data:
-                        writer.writerow(row.to_dict())
-            csv_files.append(csv_file)
-
-        # Config file
-        if config_file:
-            yaml_file = "loaded_config.yaml"
-            with open(yaml_file, "w", encoding="utf8") as outfile:
-                yaml.dump(
-                    self.bot.file_config,
-                    outfile,
-                    default_flow_style=False,
-                    allow_unicode=True,
+        await interaction.response.defer(ephemeral=True)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_path = os.path.join(temp_dir, "data_backup.zip")
+            zip_file = await asyncio.to_thread(
+                zipfile.ZipFile, zip_path, "w", zipfile.ZIP_DEFLATED
+            )
+            try:
+                # Databases
+                tables = list(self.bot.models.items())
+                for index, (table_name, table) in enumerate(tables, start=1):
+                    row_count = await self.export_table(
+                        zip_file, table_name, table, data_format
+                    )
+                    await interaction.edit_original_response(
+                        content=(
+                            f"Exported {index}/{len(tables)} tables"
+                            f" (`{table_name}`: {row_count} rows)"
+                        )
+                    )
+
+                # Config file
+                if config_file:
+                    config_yaml = await asyncio.to_thread(
+                        yaml.dump,
+                        self.bot.file_config,
+                        default_flow_style=False,
+                        allow_unicode=True,
+                    )
+                    await asyncio.to_thread(
+                        zip_file.writestr, "loaded_config.yaml", config_yaml
+                    )
+
+                # Guilds
+                guilds_text = "".join(
+                    f"{guild.name} (ID: {guild.id})\n" for guild in self.bot.guilds
                 )
+                await asyncio.to_thread(zip_file.writestr, "guilds.txt", guilds_text)
+            finally:
+                await asyncio.to_thread(zip_file.close)
 
-        # Guilds
-        guilds_file = "guilds.txt"
-        with open(guilds_file, "w", encoding="utf-8") as file:
-            for guild in self.bot.guilds:
-                file.write(f"{guild.name} (ID: {guild.id})\n")
-
-        temp_zip = "temp_data.zip"
-        with zipfile.ZipFile(temp_zip, "w") as zipf:
-            for csv_file in csv_files:
-                zipf.write(csv_file)
-            if config_file:
-                zipf.write(yaml_file)
-            zipf.write(guilds_file)
-
-        # Upload the ZIP file in a message
-        with open(temp_zip, "rb") as fp:
-            await interaction.response.send_message(
-                file=discord.File(fp, "data_backup.zip"), ephemeral=True
+            # Upload the ZIP file in a message
+            await interaction.followup.send(
+                file=discord.File(zip_path, "data_backup.zip"), ephemeral=True
             )
+
+    async def export_table(
+        self: Self,
+        zip_file: zipfile.ZipFile,
+        table_name: str,
+        table: bot.db.Model,
+        data_format: BackupFormat,
+    ) -> int:
+        """Streams every row of a table into the zip file
+        Rows are read with a server side cursor and written in batches
+
+        Args:
+            zip_file (zipfile.ZipFile): The open backup zip file
+            table_name (str): The name to give the exported file
+            table (bot.db.Model): The model of the table to export
+            data_format (BackupFormat): The file format to export the table as
+
+        Returns:
+            int: The number of rows exported
+        """
+        columns = list(table.__table__.columns.keys())
+        writer = await asyncio.to_thread(
+            TableWriter, zip_file, table_name, columns, data_format
+        )
+
+        row_count = 0
+        batch = []
+        try:
+            # Gino can only iterate with a cursor inside a transaction
+            async with self.bot.db.transaction():
+                async for row in table.query.gino.iterate():
+                    batch.append(row.to_dict())
+                    if len(batch) >= self.BATCH_SIZE:
+                        await asyncio.to_thread(writer.write_rows, batch)
+                        row_count += len(batch)
+                        batch = []
+
+            if batch:
+                await asyncio.to_thread(writer.write_rows, batch)
+                row_count += len(batch)
+        finally:
+            await asyncio.to_thread(writer.close)
+
+        return row_count
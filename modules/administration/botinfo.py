@@ -9,14 +9,17 @@ This file contains 1 command:
 
 from __future__ import annotations
 
+import asyncio
 import re
+import resource
 from typing import TYPE_CHECKING, Self
 
 import discord
 import git
 from discord import app_commands
+from discord.ext import commands
 
-from core import auxiliary, cogs
+from core import auxiliary, cogs, message_window, verdicts
 
 if TYPE_CHECKING:
     import bot
@@ -34,8 +37,104 @@ async def setup(bot: bot.TechSupportBot) -> None:
 class BotInfo(cogs.BaseCog):
     """
     The class that holds the bot command
+
+    Attributes:
+        VERSION_REFRESH_SECONDS (int): How often the version info is collected again
+        MAX_LISTED_SERVERS (int): The most servers to list by name
     """
 
+    VERSION_REFRESH_SECONDS: int = 600
+    MAX_LISTED_SERVERS: int = 20
+
+    async def preconfig(self: Self) -> None:
+        """Collects the version info, and schedules it to be refreshed"""
+        self.version_info: str = None
+        self.server_list: str = None
+        self.version_refresh_job: str = None
+        self.version_refresh_stopped: bool = False
+        self.bot.scheduler.register_task(
+            "botinfo_version_refresh", self.refresh_version_info
+        )
+        await self.refresh_version_info({})
+
+    async def refresh_version_info(self: Self, _: dict) -> None:
+        """Collects the version info in a worker thread, as git is slow and blocking
+        Then schedules the next refresh
+        """
+        try:
+            self.version_info = await asyncio.to_thread(get_version_info)
+        except Exception as exc:
+            self.version_info = f"There was an error getting version info: {exc}"
+
+        # The cog may have been unloaded while git was running, and the reloaded
+        # cog starts its own refresh
+        if self.version_refresh_stopped:
+            return
+        self.version_refresh_job = await self.bot.scheduler.schedule_delay(
+            task_name="botinfo_version_refresh",
+            seconds=self.VERSION_REFRESH_SECONDS,
+            payload={},
+        )
+
+    async def cog_unload(self: Self) -> None:
+        """Cancels the next version refresh, so a reload doesn't start a second chain"""
+        self.version_refresh_stopped = True
+        if getattr(self, "version_refresh_job", None):
+            await self.bot.scheduler.cancel_task(self.version_refresh_job)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self: Self, _: discord.Guild) -> None:
+        """Rebuilds the server list when the bot joins a server"""
+        self.server_list = None
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self: Self, _: discord.Guild) -> None:
+        """Rebuilds the server list when the bot leaves a server"""
+        self.server_list = None
+
+    def get_server_list(self: Self) -> str:
+        """Gets the list of servers the bot is in, building it only when it has changed
+
+        Returns:
+            str: The servers by name and ID, with a count of any not listed
+        """
+        if self.server_list is None:
+            guilds = self.bot.guilds
+            listed = ", ".join(
+                f"{guild.name} ({guild.id})"
+                for guild in guilds[: self.MAX_LISTED_SERVERS]
+            )
+            if len(guilds) > self.MAX_LISTED_SERVERS:
+                listed += f" and {len(guilds) - self.MAX_LISTED_SERVERS} more"
+            self.server_list = listed[:1024] or "None"
+        return self.server_list
+
+    def get_runtime_stats(self: Self) -> str:
+        """Gets the health of the running bot
+
+        Returns:
+            str: The event loop lag, task count, memory, cache sizes and database pool use
+        """
+        stats = [
+            f"Tasks: `{len(asyncio.all_tasks())}`",
+            f"Memory: `{get_memory_usage() / 1024 / 1024:.1f} MiB`",
+            f"HTTP cache: `{len(self.bot.http_functions.http_cache)}`",
+            f"Cached messages: `{len(self.bot.cached_messages)}`",
+        ]
+        # The lag is only measured while the loop watchdog is running
+        if self.bot.loop_watchdog:
+            stats.insert(
+                0, f"Event loop lag: `{self.bot.loop_watchdog.lag * 1000:.1f} ms`"
+            )
+
+        pool = getattr(getattr(self.bot.db, "bind", None), "raw_pool", None)
+        if pool:
+            stats.append(
+                f"DB pool: `{pool.get_size() - pool.get_idle_size()}"
+                f"/{pool.get_max_size()}` in use"
+            )
+        return "\n".join(stats)
+
     @app_commands.check(auxiliary.bot_admin_check_interaction)
     @app_commands.command(
         name="bot",
@@ -70,7 +169,40 @@ class BotInfo(cogs.BaseCog):
         )
         embed.add_field(
             name="Servers",
-            value=", ".join(f"{guild.name} ({guild.id})" for guild in self.bot.guilds),
+            value=self.get_server_list(),
+            inline=True,
+        )
+        embed.add_field(
+            name="Runtime",
+            value=self.get_runtime_stats(),
+            inline=True,
+        )
+        window_stats = message_window.recent_messages.get_stats()
+        embed.add_field(
+            name="Message window",
+            value=(
+                f"Searches served: `{window_stats['hits']}`\n"
+                f"History fallbacks: `{window_stats['fallbacks']}`\n"
+                f"Channels: `{window_stats['channels']}`\n"
+                f"Messages: `{window_stats['messages']}`"
+            ),
+            inline=True,
+        )
+        embed.add_field(
+            name="Automod",
+            value=(
+                f"Duplicate checks avoided: `{verdicts.verdict_cache.duplicates_avoided}`"
+            ),
+            inline=True,
+        )
+        limiter_stats = self.bot.command_rate_limiter.get_stats()
+        embed.add_field(
+            name="Rate limiter",
+            value=(
+                f"Members tracked: `{limiter_stats['keys']}`\n"
+                f"Memory used: `{limiter_stats['bytes'] / 1024:.1f} KiB`\n"
+                f"Members banned: `{len(self.bot.command_rate_limit_bans)}`"
+            ),
             inline=True,
         )
         irc_config = self.bot.file_config.api.irc
@@ -89,40 +221,55 @@ class BotInfo(cogs.BaseCog):
                 + f"Channels: `{irc_status['channels']}`",
                 inline=True,
             )
-        try:
-            repo = git.Repo(search_parent_directories=True)
-            commit = repo.head.commit
-            commit_hash = commit.hexsha[:7]
-            commit_message = commit.message.splitlines()[0].strip()
-            branch_name = repo.active_branch.name
-            match = re.search(
-                r"github.com[:/](.*?)/(.*?)(?:.git)?$", repo.remotes.origin.url
-            )
-            if match:
-                repo_owner = match.group(1)
-                repo_name = match.group(2)
-            else:
-                repo_owner = ""
-                repo_name = ""
-
-            has_differences = repo.is_dirty()
-
-            embed.add_field(
-                name="Version Info",
-                value=(
-                    f"Upstream: `{repo_owner}/{repo_name}/{branch_name}`\n"
-                    f"Commit: `{commit_hash} - {commit_message}`\n"
-                    f"Local changes made: `{has_differences}`"
-                ),
-                inline=False,
-            )
-        except Exception as exc:
-            embed.add_field(
-                name="Version Info",
-                value=f"There was an error getting version info: {exc}",
-                inline=False,
-            )
+        embed.add_field(
+            name="Version Info",
+            value=self.version_info or "Version info hasn't been collected yet",
+            inline=False,
+        )
 
         embed.set_thumbnail(url=self.bot.user.display_avatar.url)
 
         await interaction.response.send_message(embed=embed)
+
+
+def get_version_info() -> str:
+    """Gets the branch, commit and state of the git repo the bot is running from
+    This blocks on git, and should be run in a worker thread
+
+    Returns:
+        str: The version info, formatted for an embed field
+    """
+    repo = git.Repo(search_parent_directories=True)
+    commit = repo.head.commit
+    commit_hash = commit.hexsha[:7]
+    commit_message = commit.message.splitlines()[0].strip()
+    branch_name = repo.active_branch.name
+    match = re.search(r"github.com[:/](.*?)/(.*?)(?:.git)?$", repo.remotes.origin.url)
+    if match:
+        repo_owner = match.group(1)
+        repo_name = match.group(2)
+    else:
+        repo_owner = ""
+        repo_name = ""
+
+    has_differences = repo.is_dirty()
+
+    return (
+        f"Upstream: `{repo_owner}/{repo_name}/{branch_name}`\n"
+        f"Commit: `{commit_hash} - {commit_message}`\n"
+        f"Local changes made: `{has_differences}`"
+    )
+
+
+def get_memory_usage() -> int:
+    """Gets the resident memory of the bot process
+    This reads /proc where it is available, and falls back to the peak usage
+
+    Returns:
+        int: The resident memory, in bytes
+    """
+    try:
+        with open("/proc/self/statm", encoding="utf8") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
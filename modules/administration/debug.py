@@ -2,6 +2,7 @@
 This is a development and issue tracking command designed to dump all attributes
 of a given object type.
 Current supported is message, member and channel
+It can also show how long each stage of startup took
 """
 
 from __future__ import annotations
@@ -101,6 +102,25 @@ class Debugger(cogs.BaseCog):
         view = ui.PaginateView()
         await view.send(interaction.channel, interaction.user, embeds, interaction)
 
+    @app_commands.check(auxiliary.bot_admin_check_interaction)
+    @debug_group.command(
+        name="startup",
+        description="Shows how long each stage of startup and each extension took",
+    )
+    async def debug_startup(self: Self, interaction: discord.Interaction) -> None:
+        """Displays the startup timeline, with the slowest extensions
+
+        Args:
+            interaction (discord.Interaction): The interaction that called this command
+        """
+        report = self.bot.startup_timeline.build_report(limit=25)
+        embed = discord.Embed(
+            title="Startup timeline",
+            description=f"```\n{report[:4000]}\n```",
+            color=discord.Color.blurple(),
+        )
+        await interaction.response.send_message(embed=embed)
+
 
 def build_debug_embed(discord_object: object) -> list[discord.Embed]:
     """Builds a list of embeds, with each one at a max of 4000 characters
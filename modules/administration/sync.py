@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Self
 
 from discord.ext import commands
 
-from core import auxiliary, cogs
+from core import app_command_sync, auxiliary, cogs
 
 if TYPE_CHECKING:
     import bot
@@ -37,20 +37,50 @@ class AppCommandSync(cogs.BaseCog):
     @auxiliary.with_typing
     @commands.command(
         name="sync",
-        description="Syncs slash commands",
-        usage="",
+        description=(
+            "Syncs slash commands that changed since the last sync,"
+            " or every command if forced"
+        ),
+        usage="[force]",
     )
-    async def sync_slash_commands(self: Self, ctx: commands.Context) -> None:
+    async def sync_slash_commands(
+        self: Self, ctx: commands.Context, option: str = ""
+    ) -> None:
         """A simple command to manually sync slash commands
+        Only the scopes of the tree that have changed are uploaded
 
         Args:
             ctx (commands.Context): The context in which the command was run
+            option (str, optional): "force" to sync every scope, even if it
+                hasn't changed. Defaults to "".
         """
-        synced = await self.bot.tree.sync()
+        if option and option.lower() != "force":
+            await auxiliary.send_deny_embed(
+                message=f"Unknown option `{option}`, the only option is `force`",
+                channel=ctx.channel,
+            )
+            return
+
+        synced = await app_command_sync.sync_changed_scopes(
+            self.bot, force=bool(option)
+        )
+
+        if not synced:
+            await auxiliary.send_confirm_embed(
+                message="The slash command tree is already up to date",
+                channel=ctx.channel,
+            )
+            return
+
+        if app_command_sync.GLOBAL_SCOPE in synced:
+            self.bot.dispatch(
+                "app_commands_synced", synced[app_command_sync.GLOBAL_SCOPE]
+            )
         await auxiliary.send_confirm_embed(
             message=(
-                "Successfully updated the slash command tree. Currently there are"
-                f" {len(synced)} commands in the tree"
+                f"Successfully updated the slash command tree in {len(synced)}"
+                f" scope(s). Currently there are {sum(map(len, synced.values()))}"
+                " commands in the updated scopes"
             ),
             channel=ctx.channel,
         )
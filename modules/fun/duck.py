@@ -6,6 +6,7 @@ import asyncio
 import datetime
 import functools
 import random
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import TYPE_CHECKING, Self
 
@@ -17,7 +18,7 @@ from discord.ext import commands
 import configuration
 import ui
 from botlogging import LogContext, LogLevel
-from core import auxiliary, cogs, moderation
+from core import auxiliary, cogs, moderation, resources
 
 if TYPE_CHECKING:
     import bot
@@ -32,6 +33,121 @@ async def setup(bot: bot.TechSupportBot) -> None:
     await bot.add_cog(DuckHunt(bot=bot))
 
 
+@dataclass
+class DuckScore:
+    """The scores of one duck hunter, as stored in the leaderboard cache
+
+    Attributes:
+        author_id (str): The string representation of the ID of the user
+        befriend_count (int): The amount of ducks the user has befriended
+        kill_count (int): The amount of ducks the user has killed
+        speed_record (float): The fastest this user has killed or friended a duck
+    """
+
+    author_id: str
+    befriend_count: int
+    kill_count: int
+    speed_record: float
+
+
+class DuckLeaderboard:
+    """The scores of every duck hunter in one guild
+    This is loaded from the database once, and then kept up to date as scores change
+
+    Attributes:
+        global_record (float | None): The fastest speed record in the guild
+
+    Args:
+        duck_users (list[bot.models.DuckUser]): Every DuckUser entry in the guild
+    """
+
+    def __init__(self: Self, duck_users: list[bot.models.DuckUser]) -> None:
+        self.scores: dict[str, DuckScore] = {}
+        self.record_holder: DuckScore | None = None
+        for duck_user in duck_users:
+            self.update(duck_user)
+
+    def update(self: Self, duck_user: bot.models.DuckUser) -> None:
+        """Stores the current scores of a DuckUser entry
+
+        Args:
+            duck_user (bot.models.DuckUser): The database entry that changed
+        """
+        score = DuckScore(
+            author_id=duck_user.author_id,
+            befriend_count=duck_user.befriend_count,
+            kill_count=duck_user.kill_count,
+            speed_record=duck_user.speed_record,
+        )
+        previous = self.scores.get(score.author_id)
+        self.scores[score.author_id] = score
+
+        if previous is self.record_holder and previous is not None:
+            # The holder's record can only get faster, except for manual edits
+            if score.speed_record <= 0 or score.speed_record > previous.speed_record:
+                self.find_record_holder()
+                return
+            self.record_holder = score
+
+        if score.speed_record > 0 and (
+            self.record_holder is None
+            or score.speed_record < self.record_holder.speed_record
+        ):
+            self.record_holder = score
+
+    def remove(self: Self, author_id: str) -> None:
+        """Removes a user from the leaderboard, after their entry is deleted
+
+        Args:
+            author_id (str): The string representation of the ID of the user
+        """
+        score = self.scores.pop(author_id, None)
+        if score is not None and score is self.record_holder:
+            self.find_record_holder()
+
+    def find_record_holder(self: Self) -> None:
+        """Searches every score for the fastest speed record"""
+        records = [score for score in self.scores.values() if score.speed_record > 0]
+        self.record_holder = (
+            min(records, key=lambda score: score.speed_record) if records else None
+        )
+
+    @property
+    def global_record(self: Self) -> float | None:
+        """The fastest speed record in the guild
+
+        Returns:
+            float | None: The fastest speed record, or None if nobody has a record
+        """
+        if self.record_holder is None:
+            return None
+        return float(self.record_holder.speed_record)
+
+    def top_friends(self: Self) -> list[DuckScore]:
+        """Gets every user who has befriended a duck, most friends first
+
+        Returns:
+            list[DuckScore]: The sorted scores
+        """
+        return sorted(
+            (score for score in self.scores.values() if score.befriend_count > 0),
+            key=lambda score: score.befriend_count,
+            reverse=True,
+        )
+
+    def top_killers(self: Self) -> list[DuckScore]:
+        """Gets every user who has killed a duck, most kills first
+
+        Returns:
+            list[DuckScore]: The sorted scores
+        """
+        return sorted(
+            (score for score in self.scores.values() if score.kill_count > 0),
+            key=lambda score: score.kill_count,
+            reverse=True,
+        )
+
+
 class DuckHunt(cogs.BaseCog):
     """Class for the actual duck commands
 
@@ -65,6 +181,8 @@ class DuckHunt(cogs.BaseCog):
     async def preconfig(self: Self) -> None:
         """Preconfig for cooldowns"""
         self.cooldowns = {}
+        self.quote_cursor = resources.ShuffledCursor()
+        self.leaderboards: dict[int, DuckLeaderboard] = {}
 
         # Scheduled task stuff
         self.bot.scheduler.register_task(
@@ -300,13 +418,15 @@ class DuckHunt(cogs.BaseCog):
         footer_string = ""
         if duration_exact < duck_user.speed_record or duck_user.speed_record == -1:
             footer_string += f"New personal record: {duration_exact} seconds."
-            if duration_exact < global_record:
+            if global_record is None or duration_exact < global_record:
                 footer_string += "\nNew global record!"
-                footer_string += f" Previous global record: {global_record} seconds"
+                if global_record is not None:
+                    footer_string += f" Previous global record: {global_record} seconds"
             await duck_user.update(speed_record=duration_exact).apply()
         else:
             footer_string += f"Exact time: {duration_exact} seconds."
         embed.set_footer(text=footer_string)
+        await self.update_leaderboard(duck_user)
 
         await channel.send(embed=embed)
 
@@ -315,11 +435,8 @@ class DuckHunt(cogs.BaseCog):
 
         Returns:
             str: The quote picked randomly from the file, ready to use"""
-        QUOTES_FILE = "resources/duckQuotes.txt"
-        with open(QUOTES_FILE, "r", encoding="utf-8") as file:
-            lines = file.readlines()
-            random_line = random.choice(lines)
-            return random_line.strip()
+        quotes = resources.get_lines("duckQuotes.txt")
+        return self.quote_cursor.pick(quotes)
 
     def message_check(
         self: Self,
@@ -449,28 +566,56 @@ class DuckHunt(cogs.BaseCog):
 
         return duck_user
 
-    async def get_global_record(self: Self, guild_id: int) -> float:
-        """This is a function to get the current global speed record in a given guild
+    async def get_leaderboard(self: Self, guild_id: int) -> DuckLeaderboard:
+        """Gets the cached leaderboard for a guild, loading it on first use
 
         Args:
             guild_id (int): The ID of the guild in question
 
         Returns:
-            float: The exact decimal representation for the fastest speed record
+            DuckLeaderboard: The scores of every duck hunter in the guild
         """
+        if guild_id not in self.leaderboards:
+            duck_users = await self.bot.models.DuckUser.query.where(
+                self.bot.models.DuckUser.guild_id == str(guild_id)
+            ).gino.all()
+            # Another command may have loaded the guild while we were waiting
+            self.leaderboards.setdefault(guild_id, DuckLeaderboard(duck_users))
 
-        query = await self.bot.models.DuckUser.query.where(
-            self.bot.models.DuckUser.guild_id == str(guild_id)
-        ).gino.all()
+        return self.leaderboards[guild_id]
 
-        speed_records = [
-            record.speed_record for record in query if record.speed_record > 0
-        ]
+    async def update_leaderboard(self: Self, duck_user: bot.models.DuckUser) -> None:
+        """Updates the cached leaderboard after a DuckUser entry has changed
 
-        if not speed_records:
-            return None
+        Args:
+            duck_user (bot.models.DuckUser): The database entry that changed
+        """
+        leaderboard = await self.get_leaderboard(int(duck_user.guild_id))
+        leaderboard.update(duck_user)
 
-        return float(min(speed_records, key=float))
+    @commands.Cog.listener()
+    async def on_user_data_deleted(self: Self, user: discord.abc.User) -> None:
+        """Removes a user from every cached leaderboard, after /datadelete
+        deleted their DuckUser entries
+
+        Args:
+            user (discord.abc.User): The user whose data was deleted
+        """
+        for leaderboard in self.leaderboards.values():
+            leaderboard.remove(str(user.id))
+
+    async def get_global_record(self: Self, guild_id: int) -> float | None:
+        """This is a function to get the current global speed record in a given guild
+
+        Args:
+            guild_id (int): The ID of the guild in question
+
+        Returns:
+            float | None: The exact decimal representation for the fastest speed record,
+                or None if nobody has a record
+        """
+        leaderboard = await self.get_leaderboard(guild_id)
+        return leaderboard.global_record
 
     @app_commands.checks.has_permissions(administrator=True)
     @duck_group.command(
@@ -602,14 +747,8 @@ class DuckHunt(cogs.BaseCog):
         Args:
             ctx (commands.Context): The context in which the command was run
         """
-        duck_users = (
-            await self.bot.models.DuckUser.query.order_by(
-                -self.bot.models.DuckUser.befriend_count
-            )
-            .where(self.bot.models.DuckUser.befriend_count > 0)
-            .where(self.bot.models.DuckUser.guild_id == str(ctx.guild.id))
-            .gino.all()
-        )
+        leaderboard = await self.get_leaderboard(ctx.guild.id)
+        duck_users = leaderboard.top_friends()
 
         if not duck_users:
             await auxiliary.send_deny_embed(
@@ -626,7 +765,7 @@ class DuckHunt(cogs.BaseCog):
                     title="Duck Friendships",
                     description=(
                         "Global speed record: "
-                        f" {str(await self.get_global_record(ctx.guild.id))} seconds"
+                        f" {str(leaderboard.global_record)} seconds"
                     ),
                 )
                 if field_counter == 1
@@ -663,20 +802,15 @@ class DuckHunt(cogs.BaseCog):
             ctx (commands.Context): The context in which the command was run
         """
 
-        record_time = await self.get_global_record(ctx.guild.id)
+        leaderboard = await self.get_leaderboard(ctx.guild.id)
+        record_time = leaderboard.global_record
         if record_time is None:
             await auxiliary.send_deny_embed(
                 message="It appears nobody has partcipated in the duck hunt",
                 channel=ctx.channel,
             )
             return
-        record_user_entry = (
-            await self.bot.models.DuckUser.query.where(
-                self.bot.models.DuckUser.speed_record == record_time
-            )
-            .where(self.bot.models.DuckUser.guild_id == str(ctx.guild.id))
-            .gino.first()
-        )
+        record_user_entry = leaderboard.record_holder
         embed = discord.Embed(title="Duck Speed Record")
         embed.color = embed_colors.green()
         embed.add_field(name="Time", value=f"{str(record_time)} seconds")
@@ -700,14 +834,8 @@ class DuckHunt(cogs.BaseCog):
         Args:
             ctx (commands.Context): The context in which the command was run
         """
-        duck_users = (
-            await self.bot.models.DuckUser.query.order_by(
-                -self.bot.models.DuckUser.kill_count
-            )
-            .where(self.bot.models.DuckUser.kill_count > 0)
-            .where(self.bot.models.DuckUser.guild_id == str(ctx.guild.id))
-            .gino.all()
-        )
+        leaderboard = await self.get_leaderboard(ctx.guild.id)
+        duck_users = leaderboard.top_killers()
 
         if not duck_users:
             await auxiliary.send_deny_embed(
@@ -723,7 +851,7 @@ class DuckHunt(cogs.BaseCog):
                     title="Duck Kills",
                     description=(
                         "Global speed record: "
-                        f" {str(await self.get_global_record(ctx.guild.id))} seconds"
+                        f" {str(leaderboard.global_record)} seconds"
                     ),
                 )
                 if field_counter == 1
@@ -747,12 +875,12 @@ class DuckHunt(cogs.BaseCog):
         await ui.PaginateView().send(ctx.channel, ctx.author, embeds)
 
     async def get_user_text(
-        self: Self, duck_user: bot.models.DuckUser, guild: discord.Guild
+        self: Self, duck_user: bot.models.DuckUser | DuckScore, guild: discord.Guild
     ) -> str:
         """Gets the name of a user formatted to be displayed across the extension
 
         Args:
-            duck_user (bot.models.DuckUser): The database entry of the user to format
+            duck_user (bot.models.DuckUser | DuckScore): The entry of the user to format
             guild (discord.Guild): The guild to fetch duck records from
 
         Returns:
@@ -817,6 +945,7 @@ class DuckHunt(cogs.BaseCog):
             return
 
         await duck_user.update(befriend_count=duck_user.befriend_count - 1).apply()
+        await self.update_leaderboard(duck_user)
         await auxiliary.send_confirm_embed(
             message=f"Fly safe! You have {duck_user.befriend_count} ducks left.",
             channel=ctx.channel,
@@ -862,6 +991,7 @@ class DuckHunt(cogs.BaseCog):
             return
 
         await duck_user.update(befriend_count=duck_user.befriend_count - 1).apply()
+        await self.update_leaderboard(duck_user)
 
         passed = self.random_choice(ctx.guild)
         if not passed:
@@ -872,6 +1002,7 @@ class DuckHunt(cogs.BaseCog):
             return
 
         await duck_user.update(kill_count=duck_user.kill_count + 1).apply()
+        await self.update_leaderboard(duck_user)
         await auxiliary.send_confirm_embed(
             message=f"You monster! You have {duck_user.befriend_count} ducks "
             + f"left and {duck_user.kill_count} kills to your name.",
@@ -934,6 +1065,7 @@ class DuckHunt(cogs.BaseCog):
             return
 
         await duck_user.update(befriend_count=duck_user.befriend_count - 1).apply()
+        await self.update_leaderboard(duck_user)
 
         passed = self.random_choice(ctx.guild)
         if not passed:
@@ -944,6 +1076,7 @@ class DuckHunt(cogs.BaseCog):
             return
 
         await recipee.update(befriend_count=recipee.befriend_count + 1).apply()
+        await self.update_leaderboard(recipee)
         await auxiliary.send_confirm_embed(
             message=f"You gave a duck to {user.mention}. You now "
             + f"have {duck_user.befriend_count} ducks left.",
@@ -997,6 +1130,8 @@ class DuckHunt(cogs.BaseCog):
             return
 
         await duck_user.delete()
+        leaderboard = await self.get_leaderboard(ctx.guild.id)
+        leaderboard.remove(duck_user.author_id)
         await auxiliary.send_confirm_embed(
             message=f"Successfully reset {user.mention}s duck stats!",
             channel=ctx.channel,
@@ -1034,14 +1169,7 @@ class DuckHunt(cogs.BaseCog):
             bool: Whether the random choice should succeed or not
         """
 
-        weights = (
-            configuration.get_config_entry(guild.id, "duck_success_rate"),
-            100 - configuration.get_config_entry(guild.id, "duck_success_rate"),
-        )
-
-        # Check to see if random failure
-        choice_ = random.choice(
-            random.choices([True, False], weights=weights, k=100000)
-        )
+        success_rate = configuration.get_config_entry(guild.id, "duck_success_rate")
 
-        return choice_
+        # A single uniform draw in [0, 100) succeeds success_rate percent of the time
+        return random.random() * 100 < success_rate
@@ -95,12 +95,10 @@ class Grabber(cogs.BaseCog):
             )
             return
 
-        grab_message = None
-
-        async for message in ctx.channel.history(limit=self.SEARCH_LIMIT):
-            if message.author == user_to_grab:
-                grab_message = message.content
-                break
+        message = await auxiliary.search_channel_for_message(
+            channel=ctx.channel, member_to_match=user_to_grab, limit=self.SEARCH_LIMIT
+        )
+        grab_message = message.content if message else None
 
         if not grab_message:
             await auxiliary.send_deny_embed(
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING, Self
 
 import discord
 from discord.ext import commands
 
-from core import auxiliary, cogs
+from core import auxiliary, cogs, resources
 
 if TYPE_CHECKING:
     import bot
@@ -28,7 +27,7 @@ class WouldYouRather(cogs.BaseCog):
 
     async def preconfig(self: Self) -> None:
         """Method to preconfig the wyr scenario."""
-        self.last = None
+        self.question_cursor = resources.ShuffledCursor()
 
     @auxiliary.with_typing
     @commands.command(
@@ -64,15 +63,8 @@ class WouldYouRather(cogs.BaseCog):
         Returns:
             str: The question to print to the user
         """
-        with open(r"resources/wyrQuestions.txt", encoding="utf-8") as f:
-            questions = f.read().splitlines()
-            try:
-                questions.remove(self.last)
-            except ValueError:
-                pass
-            selection = random.choice(questions)
-            self.last = selection
-            return selection
+        questions = resources.get_lines("wyrQuestions.txt")
+        return self.question_cursor.pick(questions)
 
     @staticmethod
     def create_question_string(question: str) -> str:
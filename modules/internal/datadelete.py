@@ -105,6 +105,9 @@ class DataDeleter(cogs.BaseCog):
             await entry.delete()
             records_deleted += 1
 
+        # Cogs that cache this data, like the duck leaderboards, drop it here
+        self.bot.dispatch("user_data_deleted", interaction.user)
+
         embed = auxiliary.prepare_confirm_embed(
             f"Successfully deleted {records_deleted} entries from the database"
         )
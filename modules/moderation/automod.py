@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
 import datetime
+import os
 import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Self
@@ -12,7 +14,7 @@ from discord.ext import commands
 
 import configuration
 from botlogging import LogContext, LogLevel
-from core import auxiliary, cogs, moderation
+from core import auxiliary, cogs, moderation, verdicts
 from modules.moderation import moderator, modlog
 
 if TYPE_CHECKING:
@@ -100,6 +102,10 @@ class AutoMod(cogs.MatchCog):
     """Holds all of the discord message specific automod functions
     Most of the automod is a class function"""
 
+    async def cog_unload(self: Self) -> None:
+        """Forgets the cached verdicts, so a reload checks messages with the new rules"""
+        verdicts.verdict_cache.clear()
+
     async def match(self: Self, ctx: commands.Context, content: str) -> bool:
         """Checks to see if a message should be considered for automod violations
 
@@ -149,12 +155,12 @@ class AutoMod(cogs.MatchCog):
         if ctx.message.author.top_role >= ctx.channel.guild.me.top_role:
             return
 
-        all_punishments = await run_all_checks(ctx.message)
-
-        if len(all_punishments) == 0:
+        verdict = await get_message_verdict(ctx.message)
+        if not verdict:
             return
 
-        total_punishment = process_automod_violations(all_punishments=all_punishments)
+        # The verdict is shared with other cogs, so changes are made on a copy
+        total_punishment = dataclasses.replace(verdict)
 
         logged = False
 
@@ -438,6 +444,54 @@ def generate_automod_alert_embed(
 
 # Automod will only ever be a framework to say something needs to be done
 # Outside of running from the response function, NO ACTION will be taken
+
+
+async def get_message_verdict(message: discord.Message) -> AutoModAction:
+    """Gets the final automod action for a message, running all checks at most once
+    The verdict is cached by message ID and content, so edits are checked again
+
+    Args:
+        message (discord.Message): The message to check
+
+    Returns:
+        AutoModAction: The recommended action, or None if there were no violations
+    """
+
+    async def evaluate() -> AutoModAction:
+        """Runs every check on the message
+
+        Returns:
+            AutoModAction: The recommended action, or None if there were no violations
+        """
+        return process_automod_violations(await run_all_checks(message))
+
+    key = ("message", message.id, hash(message.clean_content))
+    return await verdicts.verdict_cache.get(key, evaluate)
+
+
+async def get_string_verdict(guild: discord.Guild, content: str) -> AutoModAction:
+    """Gets the final automod action for plain text, running the string checks at most once
+
+    Args:
+        guild (discord.Guild): The guild whose rules to check with
+        content (str): The text to check
+
+    Returns:
+        AutoModAction: The recommended action, or None if there were no violations
+    """
+
+    async def evaluate() -> AutoModAction:
+        """Runs the string checks on the content
+
+        Returns:
+            AutoModAction: The recommended action, or None if there were no violations
+        """
+        return process_automod_violations(run_only_string_checks(guild, content))
+
+    key = ("string", guild.id, hash(content))
+    return await verdicts.verdict_cache.get(key, evaluate)
+
+
 # All checks will return a list of AutoModPunishment, which may be nothing
 
 
@@ -517,6 +571,8 @@ async def handle_file_hashes(
     guild: discord.Guild, attachments: list[discord.Attachment]
 ) -> list[AutoModPunishment]:
     """This checks a list of attachments for attachments that match the configured list of hashes
+    Nothing is downloaded if there are no banned hashes, and files over the
+    configured size limit or with a skipped extension are skipped
 
     Args:
         guild (discord.Guild): The guild to check with
@@ -527,11 +583,34 @@ async def handle_file_hashes(
     """
     violations = []
 
+    banned_hashes = {
+        banned_hash.lower()
+        for banned_hash in configuration.get_config_entry(
+            guild.id, "automod_banned_file_hashes"
+        )
+    }
+    if not banned_hashes:
+        return violations
+
+    max_size = (
+        configuration.get_config_entry(guild.id, "automod_max_hash_size_mb")
+        * 1024
+        * 1024
+    )
+
+    skip_extensions = {
+        extension.lower().lstrip(".")
+        for extension in configuration.get_config_entry(
+            guild.id, "automod_hash_skip_extensions"
+        )
+    }
+
     for attachment in attachments:
+        extension = os.path.splitext(attachment.filename)[1].lower().lstrip(".")
+        if attachment.size > max_size or extension in skip_extensions:
+            continue
         file_hash = await auxiliary.get_attachment_hash(attachment)
-        if file_hash in configuration.get_config_entry(
-            guild.id, "automod_banned_file_hashes"
-        ):
+        if file_hash in banned_hashes:
             violations.append(
                 AutoModPunishment(
                     f"{attachment.filename} matches a banned file hash",
@@ -2188,22 +2188,11 @@ class EventLogger(cogs.BaseCog):
         Args:
             ctx (commands.Context): The invocation context
         """
-        embed = discord.Embed()
-        embed.add_field(name="User", value=ctx.author)
-        embed.add_field(name="Channel", value=getattr(ctx.channel, "name", "DM"))
-        embed.add_field(name="Server", value=getattr(ctx.guild, "name", "None"))
-
-        log_channel = configuration.get_config_entry(
-            ctx.guild.id, "core_logging_channel"
-        )
-
-        sliced_content = ctx.message.content[:100]
-        message = f"Command detected: {sliced_content}"
-
-        await self.bot.logger.send_log(
-            message=message,
-            level=LogLevel.INFO,
-            context=LogContext(guild=ctx.guild, channel=ctx.channel),
-            channel=log_channel,
-            embed=embed,
+        guild_config = self.bot.check_planner.get_guild_config(ctx.guild.id)
+        self.bot.command_audit_log.add(
+            guild=ctx.guild,
+            channel=ctx.channel,
+            user=ctx.author,
+            command=ctx.message.content[:100],
+            log_channel=guild_config.logging_channel,
         )
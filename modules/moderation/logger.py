@@ -309,6 +309,7 @@ async def build_attachments(
     bot: bot.TechSupportBot, message: discord.Message
 ) -> list[discord.File]:
     """Reuploads and builds a list of attachments to send along side the embed
+    The downloads are shared with any other cog reposting the same message
 
     Args:
         bot (bot.TechSupportBot): the bot object
@@ -319,12 +320,9 @@ async def build_attachments(
     """
     attachments: list[discord.File] = []
     if message.attachments:
-        total_attachment_size = 0
-        for attch in message.attachments:
-            if (
-                total_attachment_size := total_attachment_size + attch.size
-            ) <= message.guild.filesize_limit:
-                attachments.append(await attch.to_file())
+        attachments = await auxiliary.build_attachment_files(
+            message.attachments, message.guild.filesize_limit
+        )
         if (lf := len(message.attachments) - len(attachments)) != 0:
             log_channel = configuration.get_config_entry(
                 message.guild.id, "logger_channel_map"
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import datetime
-from collections import Counter
 from typing import TYPE_CHECKING, Self
 
 import asyncpg
@@ -11,6 +10,7 @@ import discord
 import munch
 from discord import app_commands
 from discord.ext import commands
+from sqlalchemy.dialects.postgresql import insert
 
 import configuration
 import ui
@@ -52,26 +52,29 @@ class ModLogger(cogs.BaseCog):
             interaction (discord.Interaction): The interaction that started this command
         """
         await interaction.response.defer()
-        all_actions = await self.bot.models.ModLog.query.where(
-            self.bot.models.ModLog.guild_id == str(interaction.guild.id)
-        ).gino.all()
-        frequency_counter = Counter(
-            action.moderator_id
-            for action in all_actions
-            if action.moderator_id is not None
-        )
-
-        sorted_frequency = sorted(
-            frequency_counter.items(), key=lambda x: x[1], reverse=True
+        action_count = self.bot.db.func.count(self.bot.models.ModLog.pk)
+        sorted_frequency = (
+            await self.bot.db.select(
+                [self.bot.models.ModLog.moderator_id, action_count]
+            )
+            .where(self.bot.models.ModLog.guild_id == str(interaction.guild.id))
+            .where(self.bot.models.ModLog.moderator_id.isnot(None))
+            .group_by(self.bot.models.ModLog.moderator_id)
+            .order_by(action_count.desc())
+            .limit(10)
+            .gino.all()
         )
         embed = discord.Embed(title="Most active moderators")
 
         final_string = ""
-        for index, (moderator_id, count) in enumerate(sorted_frequency[:10]):
-            try:
-                moderator = await interaction.guild.fetch_member(int(moderator_id))
-            except discord.NotFound:
-                moderator = None
+        for index, (moderator_id, count) in enumerate(sorted_frequency):
+            # Members are usually in the gateway cache, so only go to the API if not
+            moderator = interaction.guild.get_member(int(moderator_id))
+            if moderator is None:
+                try:
+                    moderator = await interaction.guild.fetch_member(int(moderator_id))
+                except discord.NotFound:
+                    moderator = None
             if moderator:
                 final_string += (
                     f"{index + 1}. {moderator.display_name} "
@@ -442,43 +445,23 @@ class ModLogger(cogs.BaseCog):
         if not self.extension_enabled(member.guild):
             return
 
-        most_recent_kick = (
+        most_recent_kick_or_unkick = (
             await self.bot.models.ModLog.query.where(
                 self.bot.models.ModLog.guild_id == str(member.guild.id)
             )
             .where(self.bot.models.ModLog.member_id == str(member.id))
-            .where(self.bot.models.ModLog.action == "kick")
+            .where(self.bot.models.ModLog.action.in_(["kick", "unkick"]))
             .order_by(self.bot.models.ModLog.guild_case_id.desc())
             .gino.first()
         )
 
         # No kick on record, nothing to do
-        if most_recent_kick is None:
+        if most_recent_kick_or_unkick is None:
             return
 
-        most_recent_unkick = (
-            await self.bot.models.ModLog.query.where(
-                self.bot.models.ModLog.guild_id == str(member.guild.id)
-            )
-            .where(self.bot.models.ModLog.member_id == str(member.id))
-            .where(self.bot.models.ModLog.action == "unkick")
-            .order_by(self.bot.models.ModLog.guild_case_id.desc())
-            .gino.first()
-        )
-
-        # If they've never been marked as unkicked, this join is an unkick
-        if most_recent_unkick is None:
-            await log_action(
-                bot=self.bot,
-                action_type="unkick",
-                guild=member.guild,
-                member=member,
-            )
-            return
-
-        # If the latest kick is newer than the latest unkick,
+        # If the latest kick is newer than any unkick,
         # this join corresponds to that kick
-        if most_recent_kick.guild_case_id > most_recent_unkick.guild_case_id:
+        if most_recent_kick_or_unkick.action == "kick":
             await log_action(
                 bot=self.bot,
                 action_type="unkick",
@@ -556,8 +539,9 @@ async def get_next_case_number(
     bot: bot.TechSupportBot,
     guild: discord.Guild,
 ) -> int:
-    """This searches the database for all cases in the given guild
-    This will return the next case number to use for a given guild, or 1 if no cases exist
+    """This atomically takes the next case number from the guild's case counter
+    The first time a guild is seen, its counter starts after its highest existing case.
+    Every call returns a different number, even when called concurrently
 
     Args:
         bot (bot.TechSupportBot): The bot object, used to fetch information from the database
@@ -566,16 +550,24 @@ async def get_next_case_number(
     Returns:
         int: The next case number to use
     """
-    latest_case = (
-        await bot.models.ModLog.query.where(bot.models.ModLog.guild_id == str(guild.id))
-        .order_by(bot.models.ModLog.guild_case_id.desc())
-        .gino.first()
+    counter = bot.models.ModLogCaseCounter
+    highest_case = (
+        bot.db.select(
+            [bot.db.func.coalesce(bot.db.func.max(bot.models.ModLog.guild_case_id), 0)]
+        )
+        .where(bot.models.ModLog.guild_id == str(guild.id))
+        .as_scalar()
     )
-
-    if latest_case is None:
-        return 1
-
-    return latest_case.guild_case_id + 1
+    statement = (
+        insert(counter.__table__)
+        .values(guild_id=str(guild.id), last_case_id=highest_case + 1)
+        .on_conflict_do_update(
+            index_elements=[counter.guild_id],
+            set_={"last_case_id": counter.last_case_id + 1},
+        )
+        .returning(counter.last_case_id)
+    )
+    return await bot.db.scalar(statement)
 
 
 async def log_action(
@@ -614,9 +606,8 @@ async def log_action(
     if moderator:
         moderator_id = str(moderator.id)
 
-    # This is done to prevent race conditions where two actions get the same case number
-    # We can detect the unique error and just try again. If so, this means
-    # A new database entry was created after we got the case number
+    # Case numbers come from an atomic counter, so this should only retry if
+    # a case was added to the database without going through the counter
     while True:
         try:
             # We need to calculate the case ID number for this action
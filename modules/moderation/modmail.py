@@ -7,7 +7,7 @@ Config:
     Command: aliases, automatic_responses, modmail_roles, roles_to_ping, thread_creation_message
 API: None
 Postgresql: True
-Models: ModmailBan
+Models: ModmailBan, ModmailThread
 Commands: contact, modmail commands, modmail ban, modmail unban
 """
 
@@ -108,9 +108,7 @@ class Modmail_bot(discord.Client):
             )
 
             # User is banned from creating modmail threads
-            if await Ts_client.models.ModmailBan.query.where(
-                Ts_client.models.ModmailBan.user_id == str(message.author.id)
-            ).gino.first():
+            if await is_modmail_banned(message.author.id):
                 await message.add_reaction("❌")
                 return
 
@@ -165,9 +163,7 @@ class Modmail_bot(discord.Client):
             isinstance(before.channel, discord.DMChannel)
             and before.author.id in active_threads
         ):
-            if await Ts_client.models.ModmailBan.query.where(
-                Ts_client.models.ModmailBan.user_id == str(before.author.id)
-            ).gino.first():
+            if await is_modmail_banned(before.author.id):
                 return
 
             thread = self.get_channel(active_threads[before.author.id])
@@ -218,7 +214,9 @@ class Modmail_bot(discord.Client):
 # This is so we can use the data from the main bot in the modmail bot instance
 Ts_client = None
 
-active_threads = {}  # User id: Thread id
+active_threads = {}  # User id: Thread id, stored in the modmail_threads table
+# User ids banned from modmail, None until they are loaded from the database
+banned_users: set[int] = None
 closure_jobs = {}  # Used in timed closes
 # Is a dict because expiringDict only has dictionaries... go figure
 delayed_people = expiringdict.ExpiringDict(
@@ -239,6 +237,50 @@ Modmail_client = Modmail_bot()
 message_id_map = {}
 
 
+async def is_modmail_banned(user_id: int) -> bool:
+    """Checks if a user is banned from creating modmail threads
+
+    Args:
+        user_id (int): The ID of the user to check
+
+    Returns:
+        bool: True if the user is banned
+    """
+    # DMs can arrive before the bans are loaded
+    if banned_users is None:
+        return bool(
+            await Ts_client.models.ModmailBan.query.where(
+                Ts_client.models.ModmailBan.user_id == str(user_id)
+            ).gino.first()
+        )
+    return user_id in banned_users
+
+
+async def add_active_thread(user_id: int, thread_id: int) -> None:
+    """Records a newly opened thread, both in memory and in the database
+
+    Args:
+        user_id (int): The ID of the user the thread is with
+        thread_id (int): The ID of the thread
+    """
+    active_threads[user_id] = thread_id
+    await Ts_client.models.ModmailThread(
+        thread_id=str(thread_id), user_id=str(user_id)
+    ).create()
+
+
+async def remove_active_thread(user_id: int) -> None:
+    """Forgets the open thread of a user, both in memory and in the database
+
+    Args:
+        user_id (int): The ID of the user whose thread was closed
+    """
+    del active_threads[user_id]
+    await Ts_client.models.ModmailThread.delete.where(
+        Ts_client.models.ModmailThread.user_id == str(user_id)
+    ).gino.status()
+
+
 async def build_attachments(
     thread: discord.Thread, attachments: list[discord.Attachment]
 ) -> list[discord.File]:
@@ -514,7 +556,7 @@ async def create_thread(
         content=role_string.rstrip()[:2000],
         allowed_mentions=discord.AllowedMentions(roles=True),
     )
-    active_threads[user.id] = thread[0].id
+    await add_active_thread(user.id, thread[0].id)
 
     # The thread creation was invoked from an incoming message
     if message:
@@ -759,14 +801,14 @@ async def close_thread(
 
     # User has left the guild
     if not user:
-        del active_threads[user_id]
+        await remove_active_thread(user_id)
 
         # No value needed, just has to exist in the dictionary
         delayed_people[user_id] = ""
         return
 
     # User can't be None anymore
-    del active_threads[user.id]
+    await remove_active_thread(user.id)
 
     # No value needed, just has to exist in the dictionary
     delayed_people[user.id] = ""
@@ -892,16 +934,31 @@ class Modmail(cogs.BaseCog):
         await Modmail_client.close()
 
     async def preconfig(self: Self) -> None:
-        """Fetches modmail threads once ready"""
+        """Loads modmail bans and open threads once ready"""
+        # pylint: disable=W0603
+        global banned_users
+        bans = await self.bot.models.ModmailBan.query.gino.all()
+        banned_users = {int(ban.user_id) for ban in bans}
+
         self.modmail_forum = await self.bot.fetch_channel(
             int(self.bot.file_config.modmail_config.modmail_forum_channel)
         )
 
         # Populates the currently active threads
-        for thread in self.modmail_forum.threads:
-            if thread.name.startswith("[OPEN]"):
-                # [status, username, date, id]
-                active_threads[int(thread.name.split(" | ")[3])] = thread.id
+        open_threads = await self.bot.models.ModmailThread.query.gino.all()
+        for open_thread in open_threads:
+            # Threads that were archived or deleted outside of modmail can't be used
+            if not self.modmail_forum.get_thread(int(open_thread.thread_id)):
+                await open_thread.delete()
+                continue
+            active_threads[int(open_thread.user_id)] = int(open_thread.thread_id)
+
+        # Threads opened before they were stored in the database are only named
+        # [status, username, date, id]
+        if not open_threads:
+            for thread in self.modmail_forum.threads:
+                if thread.name.startswith("[OPEN]"):
+                    await add_active_thread(int(thread.name.split(" | ")[3]), thread.id)
 
     @app_commands.check(has_modmail_management_role)
     @modmail_commands.command(
@@ -948,9 +1005,7 @@ class Modmail(cogs.BaseCog):
             interaction (discord.Interaction): The interaction that called this command
             user (discord.User): The user to ban
         """
-        if await self.bot.models.ModmailBan.query.where(
-            self.bot.models.ModmailBan.user_id == str(user.id)
-        ).gino.first():
+        if await is_modmail_banned(user.id):
             embed = auxiliary.prepare_deny_embed(
                 message=f"{user.mention} is already banned!"
             )
@@ -1006,6 +1061,8 @@ class Modmail(cogs.BaseCog):
 
             case ui.ConfirmResponse.CONFIRMED:
                 await self.bot.models.ModmailBan(user_id=str(user.id)).create()
+                if banned_users is not None:
+                    banned_users.add(user.id)
                 await modlog.log_action(
                     bot=self.bot,
                     action_type="modmail ban",
@@ -1243,6 +1300,8 @@ class Modmail(cogs.BaseCog):
             return
 
         await ban_entry.delete()
+        if banned_users is not None:
+            banned_users.discard(user.id)
         await modlog.log_action(
             bot=self.bot,
             action_type="modmail unban",
@@ -1705,12 +1764,9 @@ class Modmail(cogs.BaseCog):
             await interaction.response.send_message(embed=embed)
             return
 
-        raw_rules = await rules.get_guild_rules(self.bot, interaction.guild)
-        guild_rules = raw_rules.get("rules")
-
-        try:
-            rule = guild_rules[rule_to_send - 1]
-        except IndexError:
+        guild_rules = await rules.get_parsed_rules(self.bot, interaction.guild)
+        rule = guild_rules.get_rule(rule_to_send)
+        if not rule:
             embed = auxiliary.prepare_deny_embed(
                 message=f"Couldn't find the rule `{rule_to_send}`",
             )
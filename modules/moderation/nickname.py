@@ -8,12 +8,14 @@ This file does not contain any commands
 
 from __future__ import annotations
 
-import random
+import functools
+import hashlib
 import re
 import string
 from typing import TYPE_CHECKING, Self
 
 import discord
+import expiringdict
 from discord import app_commands
 from discord.ext import commands
 from unidecode import unidecode
@@ -35,8 +37,32 @@ async def setup(bot: bot.TechSupportBot) -> None:
     await bot.add_cog(AutoNickName(bot=bot))
 
 
+MARKDOWN_PATTERN: re.Pattern = re.compile(r"(\*\*|__|\*|_|\~\~|`|#+|-{3,}|\|{3,}|>)")
+WHITESPACE_PATTERN: re.Pattern = re.compile(r"\s+")
+SPACED_LETTER_PATTERN: re.Pattern = re.compile(r"(\b\w) ")
+LETTER_PATTERN: re.Pattern = re.compile(r"[A-Za-z]")
+
+
+def get_suffix(username: str) -> str:
+    """Makes a string of 10 letters to pad out a name that is too short
+    The same username always gets the same suffix
+
+    Args:
+        username (str): The original users username
+
+    Returns:
+        str: The suffix to add to the new username
+    """
+    digest = hashlib.sha256(username.encode("utf-8")).digest()
+    return "".join(
+        string.ascii_letters[byte % len(string.ascii_letters)] for byte in digest[:10]
+    )
+
+
+@functools.lru_cache(maxsize=4096)
 def format_username(username: str) -> str:
     """Formats a username to be all ascii and easily readable and pingable
+    Results are cached, as the same names are checked on every message
 
     Args:
         username (str): The original users username
@@ -44,26 +70,23 @@ def format_username(username: str) -> str:
     Returns:
         str: The new username with all formatting applied
     """
-
-    # Prepare a random string, just in case
-    random_string = "".join(random.choice(string.ascii_letters) for _ in range(10))
+    original_username = username
 
     # Step 1 - Force all ascii
     username = unidecode(username)
 
     # Step 2 - Remove all markdown
-    markdown_pattern = r"(\*\*|__|\*|_|\~\~|`|#+|-{3,}|\|{3,}|>)"
-    username = re.sub(markdown_pattern, "", username)
+    username = MARKDOWN_PATTERN.sub("", username)
 
     # Step 3 - Strip
     username = username.strip()
 
     # Step 4 - Fix dumb spaces
-    username = re.sub(r"\s+", " ", username)
-    username = re.sub(r"(\b\w) ", r"\1", username)
+    username = WHITESPACE_PATTERN.sub(" ", username)
+    username = SPACED_LETTER_PATTERN.sub(r"\1", username)
 
     # Step 5 - Start with letter
-    match = re.search(r"[A-Za-z]", username)
+    match = LETTER_PATTERN.search(username)
     if match:
         username = username[match.start() :]
     else:
@@ -71,9 +94,9 @@ def format_username(username: str) -> str:
 
     # Step 6 - Length check
     if len(username) < 3 and len(username) > 0:
-        username = f"{username}-USER-{random_string}"
+        username = f"{username}-USER-{get_suffix(original_username)}"
     elif len(username) == 0:
-        username = f"USER-{random_string}"
+        username = f"USER-{get_suffix(original_username)}"
     username = username[:32]
 
     return username
@@ -84,6 +107,13 @@ class AutoNickName(cogs.MatchCog):
     The class that holds the listener and functions to auto change peoples nicknames
     """
 
+    async def preconfig(self: Self) -> None:
+        """Sets up the cache of members that have been checked"""
+        self.needs_new_nickname = expiringdict.ExpiringDict(
+            max_len=10000,
+            max_age_seconds=86400,
+        )
+
     async def match(self: Self, ctx: commands.Context, content: str) -> bool:
         """On every message, check if the authors nickname should be changed
 
@@ -98,12 +128,16 @@ class AutoNickName(cogs.MatchCog):
             ctx.guild.id, "nickname_enable_on_message"
         ):
             return False
-        modified_name = format_username(ctx.author.display_name)
 
-        # If the name didn't change for the user, do nothing
-        if modified_name == ctx.author.display_name:
-            return False
-        return True
+        # Members are only checked again once their name changes
+        member_key = (ctx.guild.id, ctx.author.id)
+        needs_new_nickname = self.needs_new_nickname.get(member_key)
+        if needs_new_nickname is None:
+            needs_new_nickname = (
+                format_username(ctx.author.display_name) != ctx.author.display_name
+            )
+            self.needs_new_nickname[member_key] = needs_new_nickname
+        return needs_new_nickname
 
     async def response(
         self: Self,
@@ -213,3 +247,33 @@ class AutoNickName(cogs.MatchCog):
                 channel=channel,
                 context=LogContext(guild=member.guild),
             )
+
+    @commands.Cog.listener()
+    async def on_member_update(
+        self: Self, before: discord.Member, after: discord.Member
+    ) -> None:
+        """Forgets the cached nickname check for a member when their name changes
+        See: https://discordpy.readthedocs.io/en/latest/api.html#discord.on_member_update
+
+        Args:
+            before (discord.Member): The member before the update
+            after (discord.Member): The member after the update
+        """
+        if before.display_name != after.display_name:
+            self.needs_new_nickname.pop((after.guild.id, after.id), None)
+
+    @commands.Cog.listener()
+    async def on_user_update(
+        self: Self, before: discord.User, after: discord.User
+    ) -> None:
+        """Forgets the cached nickname checks for a user when their global name changes
+        See: https://discordpy.readthedocs.io/en/latest/api.html#discord.on_user_update
+
+        Args:
+            before (discord.User): The user before the update
+            after (discord.User): The user after the update
+        """
+        if before.display_name == after.display_name:
+            return
+        for guild in after.mutual_guilds:
+            self.needs_new_nickname.pop((guild.id, after.id), None)
@@ -5,13 +5,14 @@ from __future__ import annotations
 import datetime
 import io
 import json
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Self
 
 import discord
 import munch
 from discord.ext import commands
 
-from core import auxiliary, cogs
+from core import auxiliary, cogs, rules_cache
 
 if TYPE_CHECKING:
     import bot
@@ -26,6 +27,32 @@ async def setup(bot: bot.TechSupportBot) -> None:
     await bot.add_cog(Rules(bot=bot))
 
 
+@dataclass
+class GuildRules:
+    """The parsed rules of a single guild, with the embed fields already built
+
+    Attributes:
+        data (munch.Munch): The full rules document. This is shared, and must not be modified
+        fields (tuple[tuple[str, str], ...]): The embed field name and value of each rule
+    """
+
+    data: munch.Munch
+    fields: tuple[tuple[str, str], ...]
+
+    def get_rule(self: Self, number: int) -> munch.Munch:
+        """Gets a single rule by its number
+
+        Args:
+            number (int): The number of the rule, starting at 1
+
+        Returns:
+            munch.Munch: The rule, or None if there is no rule with that number
+        """
+        if number <= 0 or number > len(self.fields):
+            return None
+        return self.data.rules[number - 1]
+
+
 class Rules(cogs.BaseCog):
     """Class to define the rules for the extension.
 
@@ -38,6 +65,10 @@ class Rules(cogs.BaseCog):
         "https://www.iconarchive.com/download/i96945/iconsmind/outline/Scale.512.png"
     )
 
+    async def cog_unload(self: Self) -> None:
+        """Forgets the cached rules, so a reload parses them again"""
+        rules_cache.parsed_rules.clear()
+
     @commands.group(name="rule")
     async def rule_group(self: Self, ctx: commands.Context) -> None:
         """The bare .rule command. This does nothing but generate the help message
@@ -126,14 +157,10 @@ class Rules(cogs.BaseCog):
             color=discord.Color.gold(),
             url=self.RULE_ICON_URL,
         )
-        raw_rules = await get_guild_rules(self.bot, ctx.guild)
-        guild_rules = raw_rules.get("rules")
+        guild_rules = await get_parsed_rules(self.bot, ctx.guild)
         for rule_number in numbers:
-            embed.add_field(
-                name=f"Rule {rule_number}: {guild_rules[rule_number - 1].get('name', '')}",
-                value=guild_rules[rule_number - 1].get("description", "None"),
-                inline=False,
-            )
+            name, value = guild_rules.fields[rule_number - 1]
+            embed.add_field(name=name, value=value, inline=False)
 
         # Send it, and mention anyone origially mentioned
         await ctx.send(
@@ -153,8 +180,8 @@ class Rules(cogs.BaseCog):
         Args:
             ctx (commands.Context): The context that was generated when the command was run
         """
-        rules_data = await get_guild_rules(self.bot, ctx.guild)
-        if not rules_data or not rules_data.get("rules"):
+        guild_rules = await get_parsed_rules(self.bot, ctx.guild)
+        if not guild_rules.fields:
             await auxiliary.send_confirm_embed(
                 message="There are no rules for this server", channel=ctx.channel
             )
@@ -166,12 +193,8 @@ class Rules(cogs.BaseCog):
             color=discord.Color.gold(),
         )
 
-        for index, rule in enumerate(rules_data.get("rules")):
-            embed.add_field(
-                name=f"Rule {index + 1}: {rule.get('name', '')}",
-                value=rule.get("description", "None"),
-                inline=False,
-            )
+        for name, value in guild_rules.fields:
+            embed.add_field(name=name, value=value, inline=False)
 
         embed.set_thumbnail(url=self.RULE_ICON_URL)
         embed.color = discord.Color.gold()
@@ -188,15 +211,31 @@ class Rules(cogs.BaseCog):
         Returns:
             int: The number of rules in the given guild
         """
-        rules_data = await get_guild_rules(self.bot, guild)
-        if not rules_data or not rules_data.get("rules"):
-            return 0
+        guild_rules = await get_parsed_rules(self.bot, guild)
+        return len(guild_rules.fields)
 
-        return len(rules_data.get("rules"))
 
+def parse_rules(rules_data: munch.Munch) -> GuildRules:
+    """Builds the embed fields for every rule in a rules document
 
-async def get_guild_rules(bot: object, guild: discord.Guild) -> munch.Munch:
-    """Gets the munchified rules for a given guild.
+    Args:
+        rules_data (munch.Munch): The munchified rules document
+
+    Returns:
+        GuildRules: The parsed rules
+    """
+    fields = tuple(
+        (
+            f"Rule {index + 1}: {rule.get('name', '')}",
+            rule.get("description", "None"),
+        )
+        for index, rule in enumerate(rules_data.get("rules") or [])
+    )
+    return GuildRules(data=rules_data, fields=fields)
+
+
+async def get_parsed_rules(bot: object, guild: discord.Guild) -> GuildRules:
+    """Gets the parsed rules for a given guild, from the cache if possible
     Will create and write to the database if no rules exist
 
     Args:
@@ -204,14 +243,17 @@ async def get_guild_rules(bot: object, guild: discord.Guild) -> munch.Munch:
         guild (discord.Guild): The guild to get rules for
 
     Returns:
-        munch.Munch: The munchified rules ready to be parsed and shown to the user
+        GuildRules: The parsed rules of the guild
     """
+    if guild_rules := rules_cache.parsed_rules.get(guild.id):
+        return guild_rules
+
     query = await bot.models.Rule.query.where(
         bot.models.Rule.guild_id == str(guild.id)
     ).gino.first()
     if not query:
         # Handle case where guild doesn't have rules
-        rules_data = json.dumps(
+        new_rules = munch.munchify(
             {
                 "rules": [
                     {
@@ -225,16 +267,38 @@ async def get_guild_rules(bot: object, guild: discord.Guild) -> munch.Munch:
                 ],
             }
         )
-        new_rules = munch.munchify(json.loads(rules_data))
         await write_new_rules(bot=bot, guild=guild, rules=new_rules)
-        return munch.munchify(json.loads(rules_data))
-    return munch.munchify(json.loads(query.rules))
+        return parse_rules(new_rules)
+
+    rules_data = json.loads(query.rules)
+    # Rules used to be written encoded twice when they were first created
+    if isinstance(rules_data, str):
+        rules_data = json.loads(rules_data)
+    guild_rules = parse_rules(munch.munchify(rules_data))
+    rules_cache.parsed_rules.set(guild.id, guild_rules)
+    return guild_rules
+
+
+async def get_guild_rules(bot: object, guild: discord.Guild) -> munch.Munch:
+    """Gets the munchified rules for a given guild.
+    Will create and write to the database if no rules exist
+
+    Args:
+        bot (object): The instance of TS to use
+        guild (discord.Guild): The guild to get rules for
+
+    Returns:
+        munch.Munch: The munchified rules ready to be parsed and shown to the user
+    """
+    guild_rules = await get_parsed_rules(bot, guild)
+    return guild_rules.data
 
 
 async def write_new_rules(
     bot: object, guild: discord.Guild, rules: munch.Munch
 ) -> None:
     """This converts the munchified rules into a string and writes it to the database
+    The cached rules for the guild are dropped
 
     Args:
         bot (object): The instance of TS to use
@@ -246,11 +310,11 @@ async def write_new_rules(
     ).gino.first()
     if not query:
         # Handle case where guild doesn't have rules
-        rules_data = json.dumps(rules)
         new_guild_rules = bot.models.Rule(
             guild_id=str(guild.id),
-            rules=str(json.dumps(rules_data)),
+            rules=str(json.dumps(rules)),
         )
         await new_guild_rules.create()
     else:
         await query.update(rules=str(json.dumps(rules))).apply()
+    rules_cache.parsed_rules.drop(guild.id)
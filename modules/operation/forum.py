@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import heapq
 import random
 import re
 from typing import TYPE_CHECKING, Self
@@ -75,20 +76,147 @@ STATUS_CONFIG = {
 }
 
 
+class OpenThreadIndex:
+    """Tracks the open threads of every thread owner in the support forums
+    This is kept up to date from thread events, so finding the open threads
+    of a member doesn't require looking at every thread in the forum
+    """
+
+    def __init__(self: Self) -> None:
+        self.threads_by_owner: dict[tuple[int, int], set[int]] = {}
+        self.thread_owners: dict[int, tuple[int, int]] = {}
+
+    def add(self: Self, thread: discord.Thread) -> None:
+        """Adds an open thread to the index
+
+        Args:
+            thread (discord.Thread): The thread that is open
+        """
+        owner_key = (thread.guild.id, thread.owner_id)
+        self.threads_by_owner.setdefault(owner_key, set()).add(thread.id)
+        self.thread_owners[thread.id] = owner_key
+
+    def remove(self: Self, thread_id: int) -> None:
+        """Removes a thread that is no longer open from the index
+
+        Args:
+            thread_id (int): The ID of the thread that was closed or deleted
+        """
+        owner_key = self.thread_owners.pop(thread_id, None)
+        if owner_key is None:
+            return
+        owner_threads = self.threads_by_owner[owner_key]
+        owner_threads.discard(thread_id)
+        if not owner_threads:
+            del self.threads_by_owner[owner_key]
+
+    def get_open_threads(self: Self, guild: discord.Guild, owner_id: int) -> list[int]:
+        """Gets the IDs of every open thread a member owns in a guild
+
+        Args:
+            guild (discord.Guild): The guild to look in
+            owner_id (int): The ID of the owner of the threads
+
+        Returns:
+            list[int]: The IDs of the open threads
+        """
+        return list(self.threads_by_owner.get((guild.id, owner_id), ()))
+
+
+class InactivityHeap:
+    """Holds the inactivity deadline of every open thread in a guild, soonest first
+    Activity only updates the deadline stored for a thread. Entries in the heap
+    that are behind their thread's deadline are moved when they reach the top
+    """
+
+    def __init__(self: Self) -> None:
+        self.heap: list[tuple[datetime.datetime, int]] = []
+        self.deadlines: dict[int, datetime.datetime] = {}
+        self.max_age: datetime.timedelta = None
+
+    def push(self: Self, thread_id: int, deadline: datetime.datetime) -> None:
+        """Sets the time a thread will be abandoned at
+
+        Args:
+            thread_id (int): The ID of the thread
+            deadline (datetime.datetime): When the thread will be abandoned
+        """
+        current = self.deadlines.get(thread_id)
+        self.deadlines[thread_id] = deadline
+        if current is None or deadline < current:
+            heapq.heappush(self.heap, (deadline, thread_id))
+
+    def discard(self: Self, thread_id: int) -> None:
+        """Stops tracking a thread that is no longer open
+
+        Args:
+            thread_id (int): The ID of the thread
+        """
+        self.deadlines.pop(thread_id, None)
+
+    def peek(self: Self) -> datetime.datetime:
+        """Gets the soonest time a thread could be abandoned at
+
+        Returns:
+            datetime.datetime: The soonest deadline, or None if no threads are tracked
+        """
+        while self.heap:
+            deadline, thread_id = self.heap[0]
+            if thread_id in self.deadlines:
+                return deadline
+            heapq.heappop(self.heap)
+        return None
+
+    def pop_expired(self: Self, now: datetime.datetime) -> list[int]:
+        """Removes and returns every thread with a deadline that has passed
+
+        Args:
+            now (datetime.datetime): The current time
+
+        Returns:
+            list[int]: The IDs of the threads that have been abandoned
+        """
+        expired = []
+        while self.heap and self.heap[0][0] <= now:
+            deadline, thread_id = heapq.heappop(self.heap)
+            current = self.deadlines.get(thread_id)
+            if current is None:
+                continue
+            if current > now:
+                # There was activity since this entry was added
+                if current != deadline:
+                    heapq.heappush(self.heap, (current, thread_id))
+                continue
+            del self.deadlines[thread_id]
+            expired.append(thread_id)
+        return expired
+
+
 class ForumChannel(cogs.BaseCog):
     """The cog that holds the forum channel commands and helper functions
 
     Attributes:
         forum_group (app_commands.Group): The group for the /forum commands
+        STARTER_MESSAGE_TIMEOUT (int): How long to wait for the first message
+            of a new thread before fetching it
     """
 
     forum_group: app_commands.Group = app_commands.Group(
         name="forum", description="..."
     )
+    STARTER_MESSAGE_TIMEOUT: int = 10
 
     async def preconfig(self: Self) -> None:
-        """Sets up a small list of threads closed by TS"""
+        """Sets up a small list of threads closed by TS,
+        and indexes the open threads in every forum"""
         self.thread_ID_closed = []
+        self.pattern_cache: dict[
+            tuple[int, str], tuple[tuple[str, ...], list[re.Pattern[str]]]
+        ] = {}
+
+        self.open_threads = OpenThreadIndex()
+        self.inactivity_heaps: dict[int, InactivityHeap] = {}
+        self.forum_manager_jobs: dict[int, tuple[datetime.datetime, str]] = {}
 
         # Scheduled task stuff
         self.bot.scheduler.register_task(
@@ -96,55 +224,132 @@ class ForumChannel(cogs.BaseCog):
             self.run_forum_manager,
         )
 
-        # Start the initial tasks
+        # Track every open thread, which starts the inactivity timers
         for guild in self.bot.guilds:
-            await self.schedule_forum_manager(guild)
+            channel = self.get_forum_channel(guild)
+            if not channel:
+                continue
+            for thread in channel.threads:
+                if not thread.archived and not thread.locked:
+                    self.open_threads.add(thread)
+                    await self.update_thread_activity(thread, get_last_activity(thread))
+
+    def get_forum_channel(self: Self, guild: discord.Guild) -> discord.ForumChannel:
+        """Gets the configured support forum of a guild from the channel cache
+
+        Args:
+            guild (discord.Guild): The guild to get the forum of
+
+        Returns:
+            discord.ForumChannel: The forum channel, or None if there isn't one
+        """
+        channel_id = configuration.get_config_entry(guild.id, "forum_forum_channel_id")
+        if not channel_id:
+            return None
+        return guild.get_channel(int(channel_id))
+
+    def get_patterns(
+        self: Self, guild: discord.Guild, config_key: str
+    ) -> list[re.Pattern[str]]:
+        """Gets the compiled regex list from a config entry
+        The patterns are only compiled again when the config entry changes
+
+        Args:
+            guild (discord.Guild): The guild to get the patterns for
+            config_key (str): The config entry holding the list of patterns
+
+        Returns:
+            list[re.Pattern[str]]: The compiled patterns
+        """
+        pattern_strings = tuple(configuration.get_config_entry(guild.id, config_key))
+        cache_key = (guild.id, config_key)
+        cached = self.pattern_cache.get(cache_key)
+        if cached and cached[0] == pattern_strings:
+            return cached[1]
+
+        patterns = create_regex_list(pattern_strings)
+        self.pattern_cache[cache_key] = (pattern_strings, patterns)
+        return patterns
+
+    async def get_starter_message(
+        self: Self, thread: discord.Thread
+    ) -> discord.Message:
+        """Gets the first message of a new forum thread
+        The message can arrive after the thread is created, so this waits for it
+
+        Args:
+            thread (discord.Thread): The thread to get the first message of
+
+        Returns:
+            discord.Message: The first message of the thread
+        """
+        # For forum posts, the starter message ID is the same as the thread ID
+        if thread.starter_message:
+            return thread.starter_message
+        try:
+            return await self.bot.wait_for(
+                "message",
+                check=lambda message: message.id == thread.id,
+                timeout=self.STARTER_MESSAGE_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            return await thread.fetch_message(thread.id)
 
     # Loop Stuff
 
     async def run_forum_manager(self: Self, payload: dict) -> None:
         """This is what closes threads after inactivity
+        This runs when the soonest inactivity deadline in a guild is reached
 
         Args:
             payload (dict): A dictionary containing a guild to run this job in
         """
         # Expand the payload
         guild: discord.Guild = payload["guild"]
+        self.forum_manager_jobs.pop(guild.id, None)
+
         # Ensure forum is enabled
         if not self.extension_enabled(guild):
             return
 
-        # Schedule the next check
-        await self.schedule_forum_manager(guild)
+        heap = self.inactivity_heaps.get(guild.id)
+        if not heap:
+            return
 
-        channel = guild.get_channel(
-            int(configuration.get_config_entry(guild.id, "forum_forum_channel_id"))
+        now = datetime.datetime.now(datetime.timezone.utc)
+        max_age = datetime.timedelta(
+            minutes=configuration.get_config_entry(guild.id, "forum_max_age_minutes")
         )
-        for existing_thread in channel.threads:
-            if not existing_thread.archived and not existing_thread.locked:
-                most_recent_message_id = existing_thread.last_message_id
-                # If there are NO messages in the thread, use the thread creation timestamp instead
-                if not most_recent_message_id:
-                    most_recent_message_id = existing_thread.id
-
-                message_timestamp = discord.utils.snowflake_time(most_recent_message_id)
-                timestamp_delta = (
-                    datetime.datetime.now(datetime.timezone.utc) - message_timestamp
-                )
-                if timestamp_delta > datetime.timedelta(
-                    minutes=configuration.get_config_entry(
-                        guild.id, "forum_max_age_minutes"
-                    )
-                ):
-                    await mark_thread(
-                        existing_thread,
-                        self.thread_ID_closed,
-                        "abandoned",
-                        "Threads are automatically closed after periods of no activity",
-                    )
+        heap.max_age = max_age
+        for thread_id in heap.pop_expired(now):
+            existing_thread = guild.get_thread(thread_id)
+            if (
+                not existing_thread
+                or existing_thread.archived
+                or existing_thread.locked
+            ):
+                continue
+
+            # Check the thread itself, in case activity was missed or the config changed
+            deadline = get_last_activity(existing_thread) + max_age
+            if deadline > now:
+                heap.push(thread_id, deadline)
+                continue
+
+            await mark_thread(
+                existing_thread,
+                self.thread_ID_closed,
+                "abandoned",
+                "Threads are automatically closed after periods of no activity",
+            )
+
+        # Schedule the next check
+        await self.schedule_forum_manager(guild)
 
     async def schedule_forum_manager(self: Self, guild: discord.Guild) -> None:
-        """This schedules the forum manager check for a 5 minute delay, for the given guild
+        """This schedules the forum manager check for the soonest inactivity deadline
+        An existing check is only moved if it would run too late
+        Deadlines that have already passed, such as after a restart, are checked now
 
         Args:
             guild (discord.Guild): The guild to schedule for
@@ -153,9 +358,59 @@ class ForumChannel(cogs.BaseCog):
         if not self.extension_enabled(guild):
             return
 
-        await self.bot.scheduler.schedule_delay(
-            task_name="forum_manager", seconds=300, payload={"guild": guild}
+        heap = self.inactivity_heaps.get(guild.id)
+        next_deadline = heap.peek() if heap else None
+        if next_deadline is None:
+            return
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        run_at = max(next_deadline, now)
+
+        scheduled = self.forum_manager_jobs.get(guild.id)
+        if scheduled:
+            # A check that should have run already may have been missed,
+            # so it is only trusted while its time is still to come
+            if now < scheduled[0] <= run_at:
+                return
+            await self.bot.scheduler.cancel_task(scheduled[1])
+
+        job_id = await self.bot.scheduler.schedule_date(
+            task_name="forum_manager",
+            run_at=run_at,
+            payload={"guild": guild},
+            run_if_late=True,
         )
+        self.forum_manager_jobs[guild.id] = (run_at, job_id)
+
+    async def update_thread_activity(
+        self: Self, thread: discord.Thread, last_activity: datetime.datetime
+    ) -> None:
+        """Moves the inactivity deadline of an open thread
+
+        Args:
+            thread (discord.Thread): The thread that had activity
+            last_activity (datetime.datetime): When the activity happened
+        """
+        max_age = datetime.timedelta(
+            minutes=configuration.get_config_entry(
+                thread.guild.id, "forum_max_age_minutes"
+            )
+        )
+        heap = self.inactivity_heaps.setdefault(thread.guild.id, InactivityHeap())
+        heap.max_age = max_age
+        heap.push(thread.id, last_activity + max_age)
+        await self.schedule_forum_manager(thread.guild)
+
+    def stop_tracking_thread(self: Self, guild_id: int, thread_id: int) -> None:
+        """Forgets a thread that was closed or deleted
+
+        Args:
+            guild_id (int): The ID of the guild the thread was in
+            thread_id (int): The ID of the thread
+        """
+        self.open_threads.remove(thread_id)
+        if heap := self.inactivity_heaps.get(guild_id):
+            heap.discard(thread_id)
 
     @forum_group.command(
         name="mark",
@@ -175,13 +430,7 @@ class ForumChannel(cogs.BaseCog):
         status = status.lower()
         await interaction.response.defer(ephemeral=True)
 
-        forum_channel = await interaction.guild.fetch_channel(
-            int(
-                configuration.get_config_entry(
-                    interaction.guild.id, "forum_forum_channel_id"
-                )
-            )
-        )
+        forum_channel = self.get_forum_channel(interaction.guild)
 
         invalid_embed = discord.Embed(
             title="Invalid location",
@@ -299,14 +548,8 @@ class ForumChannel(cogs.BaseCog):
             interaction (discord.Interaction): The interaction that called the command
         """
         await interaction.response.defer(ephemeral=True)
-        channel = await interaction.guild.fetch_channel(
-            int(
-                configuration.get_config_entry(
-                    interaction.guild.id, "forum_forum_channel_id"
-                )
-            )
-        )
-        mention_threads: list[discord.Thread] = channel.threads
+        channel = self.get_forum_channel(interaction.guild)
+        mention_threads: list[discord.Thread] = channel.threads if channel else []
         if len(mention_threads) == 0:
             embed = discord.Embed(
                 title="Unsolved",
@@ -349,13 +592,7 @@ class ForumChannel(cogs.BaseCog):
             interaction (discord.Interaction): The interaction calling the command
         """
         await interaction.response.defer(ephemeral=True)
-        forum_channel = await interaction.guild.fetch_channel(
-            int(
-                configuration.get_config_entry(
-                    interaction.guild.id, "forum_forum_channel_id"
-                )
-            )
-        )
+        forum_channel = self.get_forum_channel(interaction.guild)
 
         invalid_embed = discord.Embed(
             title="Invalid location",
@@ -414,16 +651,18 @@ class ForumChannel(cogs.BaseCog):
             before (discord.Thread): The original thread
             after (discord.Thread): The thread after the update
         """
-        channel = await before.guild.fetch_channel(
-            int(
-                configuration.get_config_entry(
-                    before.guild.id, "forum_forum_channel_id"
-                )
-            )
-        )
-        if before.parent != channel:
+        channel = self.get_forum_channel(before.guild)
+        if not channel or before.parent != channel:
             return
 
+        if after.archived or after.locked:
+            self.stop_tracking_thread(after.guild.id, after.id)
+        elif before.archived or before.locked:
+            self.open_threads.add(after)
+            await self.update_thread_activity(
+                after, datetime.datetime.now(datetime.timezone.utc)
+            )
+
         # If the edit was not archiving it, we don't care
         if not after.archived:
             return
@@ -453,20 +692,23 @@ class ForumChannel(cogs.BaseCog):
         Args:
             thread (discord.Thread): The thread that was created
         """
-        # Fuck if I know what causes this bug
-        await asyncio.sleep(5)
-        channel = await thread.guild.fetch_channel(
-            int(
-                configuration.get_config_entry(
-                    thread.guild.id, "forum_forum_channel_id"
-                )
-            )
-        )
-        if thread.parent != channel:
+        channel = self.get_forum_channel(thread.guild)
+        if not channel or thread.parent != channel:
             return
 
-        disallowed_title_patterns = create_regex_list(
-            configuration.get_config_entry(thread.guild.id, "forum_title_regex_list")
+        # Find other open threads before indexing this one
+        existing_thread_ids = [
+            thread_id
+            for thread_id in self.open_threads.get_open_threads(
+                thread.guild, thread.owner_id
+            )
+            if thread_id != thread.id
+        ]
+        self.open_threads.add(thread)
+        await self.update_thread_activity(thread, thread.created_at)
+
+        disallowed_title_patterns = self.get_patterns(
+            thread.guild, "forum_title_regex_list"
         )
 
         # Check if the thread title is disallowed
@@ -483,13 +725,13 @@ class ForumChannel(cogs.BaseCog):
             return
 
         # Check if the thread body is disallowed
-        message = await thread.fetch_message(thread.id)
+        message = await self.get_starter_message(thread)
         body = message.clean_content
         if not body:
             body = ""
 
-        disallowed_body_patterns = create_regex_list(
-            configuration.get_config_entry(thread.guild.id, "forum_body_regex_list")
+        disallowed_body_patterns = self.get_patterns(
+            thread.guild, "forum_body_regex_list"
         )
         if any(pattern.search(body) for pattern in disallowed_body_patterns):
             await mark_thread(
@@ -517,12 +759,9 @@ class ForumChannel(cogs.BaseCog):
             return
 
         # Check if the thread creator has an existing open thread
-        for existing_thread in channel.threads:
-            if (
-                existing_thread.owner_id == thread.owner_id
-                and not existing_thread.archived
-                and existing_thread.id != thread.id
-            ):
+        for thread_id in existing_thread_ids:
+            existing_thread = thread.guild.get_thread(thread_id)
+            if existing_thread and not existing_thread.archived:
                 await mark_thread(
                     thread,
                     self.thread_ID_closed,
@@ -543,6 +782,32 @@ class ForumChannel(cogs.BaseCog):
         )
         await thread.send(embed=embed)
 
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(
+        self: Self, payload: discord.RawThreadDeleteEvent
+    ) -> None:
+        """Removes deleted threads from the open thread index
+
+        Args:
+            payload (discord.RawThreadDeleteEvent): The thread delete event payload
+        """
+        self.stop_tracking_thread(payload.guild_id, payload.thread_id)
+
+    @commands.Cog.listener()
+    async def on_message(self: Self, message: discord.Message) -> None:
+        """Moves the inactivity deadline of open forum threads with new messages
+
+        Args:
+            message (discord.Message): The message that was sent
+        """
+        if not message.guild:
+            return
+        heap = self.inactivity_heaps.get(message.guild.id)
+        if not heap or message.channel.id not in heap.deadlines:
+            return
+        # The deadline only moves later, so the scheduled check is still early enough
+        heap.push(message.channel.id, message.created_at + heap.max_age)
+
     @commands.Cog.listener()
     async def on_member_remove(self: Self, member: discord.Member) -> None:
         """Monitor for members leaving to mark [LEFT] on threads
@@ -550,18 +815,9 @@ class ForumChannel(cogs.BaseCog):
         Args:
             member (discord.Member): The member who has left the server
         """
-        channel = await member.guild.fetch_channel(
-            int(
-                configuration.get_config_entry(
-                    member.guild.id, "forum_forum_channel_id"
-                )
-            )
-        )
-        for thread in channel.threads:
-            if thread.archived:
-                continue
-
-            if thread.owner_id != member.id:
+        for thread_id in self.open_threads.get_open_threads(member.guild, member.id):
+            thread = member.guild.get_thread(thread_id)
+            if not thread or thread.archived:
                 continue
 
             # At this point we know for a fact that the the owner has left
@@ -593,22 +849,13 @@ class ForumChannel(cogs.BaseCog):
         if guild is None:
             return
 
-        try:
-            thread = await guild.fetch_channel(payload.channel_id)
-        except (discord.NotFound, discord.Forbidden):
-            return
-
-        if not isinstance(thread, discord.Thread):
+        # Archived threads aren't cached, but those are ignored anyway
+        thread = guild.get_thread(payload.channel_id)
+        if not thread:
             return
 
-        channel = await thread.guild.fetch_channel(
-            int(
-                configuration.get_config_entry(
-                    thread.guild.id, "forum_forum_channel_id"
-                )
-            )
-        )
-        if thread.parent != channel:
+        channel = self.get_forum_channel(thread.guild)
+        if not channel or thread.parent != channel:
             return
 
         if thread.archived:
@@ -628,6 +875,20 @@ class ForumChannel(cogs.BaseCog):
         )
 
 
+def get_last_activity(thread: discord.Thread) -> datetime.datetime:
+    """Gets the time of the most recent message in a thread
+
+    Args:
+        thread (discord.Thread): The thread to check
+
+    Returns:
+        datetime.datetime: When the last message was sent,
+            or when the thread was created if it has no messages
+    """
+    # If there are NO messages in the thread, use the thread creation timestamp instead
+    return discord.utils.snowflake_time(thread.last_message_id or thread.id)
+
+
 def create_regex_list(str_list: list[str]) -> list[re.Pattern[str]]:
     """This turns a list of strings into a list of complied regex
 
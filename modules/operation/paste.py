@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
 import io
 from typing import TYPE_CHECKING, Self
 
@@ -10,7 +12,7 @@ from discord.ext import commands
 
 import configuration
 from botlogging import LogContext, LogLevel
-from core import cogs
+from core import auxiliary, cogs
 from modules.moderation import automod
 
 if TYPE_CHECKING:
@@ -27,7 +29,102 @@ async def setup(bot: bot.TechSupportBot) -> None:
 
 
 class Paster(cogs.MatchCog):
-    """The pasting module"""
+    """The pasting module
+    Pastes are made by a small pool of background workers, so uploading
+    a large paste doesn't hold up other message handlers
+    Every guild has its own queue of pastes, and the workers take turns
+    between guilds, so a single guild can't take up every worker
+
+    Attributes:
+        WORKER_COUNT (int): How many pastes can be made at once across all guilds
+        GUILD_WORKER_COUNT (int): How many pastes can be made at once in a single guild
+        QUEUE_SIZE (int): How many pastes can be waiting before new pastes wait to queue
+    """
+
+    WORKER_COUNT: int = 4
+    GUILD_WORKER_COUNT: int = 2
+    QUEUE_SIZE: int = 100
+
+    async def preconfig(self: Self) -> None:
+        """Starts the paste workers"""
+        # The waiting pastes of every guild
+        self.guild_pastes: dict[
+            int, collections.deque[tuple[commands.Context, str]]
+        ] = collections.defaultdict(collections.deque)
+        # A guild ID is queued once for every worker that may take a paste from
+        # that guild, so guilds with waiting pastes are served in turn
+        self.paste_queue: asyncio.Queue[int] = asyncio.Queue()
+        # How many times each guild is queued, and how many workers it has
+        self.guild_turns: collections.Counter[int] = collections.Counter()
+        self.guild_workers: collections.Counter[int] = collections.Counter()
+        self.queue_slots = asyncio.Semaphore(self.QUEUE_SIZE)
+        self.paste_workers = [
+            asyncio.create_task(self.paste_worker()) for _ in range(self.WORKER_COUNT)
+        ]
+
+    async def cog_unload(self: Self) -> None:
+        """Stops the paste workers when the extension is unloaded"""
+        for worker in getattr(self, "paste_workers", []):
+            worker.cancel()
+
+    async def queue_paste(self: Self, ctx: commands.Context, content: str) -> None:
+        """Adds a message to be pasted by the workers
+        This waits if QUEUE_SIZE pastes are already waiting
+
+        Args:
+            ctx (commands.Context): The context of the message to paste
+            content (str): The content of the message
+        """
+        await self.queue_slots.acquire()
+        self.guild_pastes[ctx.guild.id].append((ctx, content))
+        self.give_guild_turn(ctx.guild.id)
+
+    def give_guild_turn(self: Self, guild_id: int) -> None:
+        """Queues a guild for a worker, if it has a paste waiting that no turn
+        is queued for, and it is under its worker limit
+
+        Args:
+            guild_id (int): The ID of the guild
+        """
+        if (
+            self.guild_turns[guild_id] < len(self.guild_pastes[guild_id])
+            and self.guild_turns[guild_id] + self.guild_workers[guild_id]
+            < self.GUILD_WORKER_COUNT
+        ):
+            self.guild_turns[guild_id] += 1
+            self.paste_queue.put_nowait(guild_id)
+
+    async def paste_worker(self: Self) -> None:
+        """Makes queued pastes one at a time, forever
+        Each turn makes a single paste, and the guild is queued again at the
+        back if it still has pastes waiting
+        """
+        while True:
+            guild_id = await self.paste_queue.get()
+            self.guild_turns[guild_id] -= 1
+            self.guild_workers[guild_id] += 1
+            ctx, content = self.guild_pastes[guild_id].popleft()
+            try:
+                await self.paste_message(ctx, content)
+            except Exception as exception:
+                log_channel = configuration.get_config_entry(
+                    ctx.guild.id, "core_logging_channel"
+                )
+                await self.bot.logger.send_log(
+                    message=f"Could not paste message {ctx.message.id}",
+                    level=LogLevel.ERROR,
+                    context=LogContext(guild=ctx.guild, channel=ctx.channel),
+                    channel=log_channel,
+                    exception=exception,
+                )
+            finally:
+                self.guild_workers[guild_id] -= 1
+                self.queue_slots.release()
+                if not self.guild_pastes[guild_id]:
+                    del self.guild_pastes[guild_id]
+                else:
+                    self.give_guild_turn(guild_id)
+                self.paste_queue.task_done()
 
     async def match(self: Self, ctx: commands.Context, content: str) -> bool:
         """Checks to see if a message should be considered for a paste
@@ -84,11 +181,10 @@ class Paster(cogs.MatchCog):
             if "moderation.automod" in configuration.get_config_entry(
                 ctx.guild.id, "core_enabled_extensions"
             ):
-                automod_actions = await automod.run_all_checks(ctx.message)
-                automod_final = automod.process_automod_violations(automod_actions)
+                automod_final = await automod.get_message_verdict(ctx.message)
                 if automod_final and automod_final.delete_message:
                     return
-            await self.paste_message(ctx, content)
+            await self.queue_paste(ctx, content)
 
     def max_newlines(self: Self, max_length: int) -> int:
         """Gets a theoretical maximum number of new lines in a given message
@@ -175,12 +271,9 @@ class Paster(cogs.MatchCog):
 
         attachments: list[discord.File] = []
         if ctx.message.attachments:
-            total_attachment_size = 0
-            for attch in ctx.message.attachments:
-                if (
-                    total_attachment_size := total_attachment_size + attch.size
-                ) <= ctx.filesize_limit:
-                    attachments.append(await attch.to_file())
+            attachments = await auxiliary.build_attachment_files(
+                ctx.message.attachments, ctx.filesize_limit
+            )
             if (lf := len(ctx.message.attachments) - len(attachments)) != 0:
                 await self.bot.logger.send_log(
                     message=(
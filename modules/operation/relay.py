@@ -415,10 +415,9 @@ class DiscordToIRC(cogs.MatchCog):
         ) and str(discord_channel.id) in configuration.get_config_entry(
             discord_channel.guild.id, "automod_channels"
         ):
-            automod_actions = automod.run_only_string_checks(
+            automod_final = await automod.get_string_verdict(
                 discord_channel.guild, split_message["content"]
             )
-            automod_final = automod.process_automod_violations(automod_actions)
             if automod_final and automod_final.delete_message:
                 embed = discord.Embed(title="IRC Automod")
                 embed.description = (
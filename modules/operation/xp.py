@@ -151,7 +151,7 @@ class LevelXP(cogs.MatchCog):
             allow_bot=False,
             skip_messages=[ctx.message.id],
         )
-        if last_message_in_channel.author == ctx.author:
+        if last_message_in_channel and last_message_in_channel.author == ctx.author:
             return False
 
         return True
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import product
 from typing import TYPE_CHECKING, Self
 
 import discord
+import expiringdict
 from discord import app_commands
 from discord.ext import commands
 
@@ -24,11 +25,13 @@ class PrintableCommand:
     With a priority on being sortable and searchable
 
     Attributes:
-        prefix (str): The prefix to call the command with
+        prefix (str): The prefix to call the command with, or None to use the guild prefix
         name (str): The command name
         usage (str): The usage hints for the command
         description (str): The description of the command
+        extension_name (str): The name of the extension that owns the command
         mention (str): A mention string for the command, only for application commands
+        search_text (str): The lowercase name and description, to search against
 
     """
 
@@ -36,7 +39,13 @@ class PrintableCommand:
     name: str
     usage: str
     description: str
+    extension_name: str
     mention: str = None
+    search_text: str = field(init=False)
+
+    def __post_init__(self: Self) -> None:
+        """Builds the search text once, so searches don't lowercase every command"""
+        self.search_text = f"{self.name}\n{self.description}".lower()
 
 
 async def setup(bot: bot.TechSupportBot) -> None:
@@ -51,49 +60,57 @@ async def setup(bot: bot.TechSupportBot) -> None:
 class Helper(cogs.BaseCog):
     """Cog object for help commands."""
 
-    @commands.command(
-        name="help",
-        brief="Displays helpful infromation",
-        description="Searches commands for your query and dispays usage info",
-        usage="[search]",
-    )
-    async def help_command(
-        self: Self, ctx: commands.Context, search_term: str = ""
-    ) -> None:
-        """Main comand interface for getting help with bot commands.
-
-        This is a command and should be accessed via Discord.
+    async def preconfig(self: Self) -> None:
+        """Fetches the command mentions and builds the help index"""
+        self.help_index: list[PrintableCommand] = None
+        self.command_mentions: dict[str, str] = {}
+        self.page_cache = expiringdict.ExpiringDict(
+            max_len=500,
+            max_age_seconds=3600,
+        )
+        fetched_commands = await self.bot.tree.fetch_commands()
+        self.command_mentions = build_command_mentions(fetched_commands)
+        self.build_help_index()
 
-        Args:
-            ctx (commands.Context): the context object for the message
-            search_term (str, optional): The term to search command name and descriptions for.
-                Will default to empty string
+    @commands.Cog.listener()
+    async def on_commands_changed(self: Self) -> None:
+        """Rebuilds the help index when an extension is loaded or unloaded
+        The mentions are kept, since the slash commands aren't synced yet
         """
-        # Build raw lists of commands
-        prefix_command_list = list(self.bot.walk_commands())
-        app_command_list = list(self.bot.tree.walk_commands())
-        fetched_commands = await self.bot.tree.fetch_commands()
+        if getattr(self, "help_index", None) is None:
+            return
+        self.build_help_index()
 
-        command_mentions = build_command_mentions(fetched_commands)
+    @commands.Cog.listener()
+    async def on_app_commands_synced(
+        self: Self, synced: list[app_commands.AppCommand]
+    ) -> None:
+        """Rebuilds the help index with the mentions of the newly synced commands
 
-        command_prefix = await self.bot.get_prefix(ctx.message)
+        Args:
+            synced (list[app_commands.AppCommand]): The commands returned by the sync
+        """
+        if getattr(self, "help_index", None) is None:
+            return
+        self.command_mentions = build_command_mentions(synced)
+        self.build_help_index()
 
+    def build_help_index(self: Self) -> None:
+        """Builds a sorted list of every command that can be shown in help
+        This includes every alias permutation of prefix commands, and the
+        extension owning each command so it can be filtered per guild
+        """
         # Build a list of custom command objects from the lists
         # Will include aliases and full command names
         all_command_list: list[PrintableCommand] = []
 
         # Looping through all the prefix commands
-        for command in prefix_command_list:
+        for command in self.bot.walk_commands():
             # If the command is a group, ignore it
             if issubclass(command.__class__, commands.Group):
                 continue
 
-            # Check if extension is enabled
             extension_name = self.bot.get_command_extension_name(command)
-            if extension_name not in configuration.get_config_entry(
-                ctx.guild.id, "core_enabled_extensions"
-            ):
-                continue
 
             # Deal with aliases by looping through all parent groups and alises
             # Then, make all permutations and get a string
@@ -112,29 +129,24 @@ class Helper(cogs.BaseCog):
             all_commands = [" ".join(map(str, perm)) for perm in all_permutations]
 
             # Add all possible permutations to the help menu
+            # The prefix is left empty, as it depends on the guild
             for command_name in all_commands:
                 all_command_list.append(
                     PrintableCommand(
-                        prefix=command_prefix,
+                        prefix=None,
                         name=command_name,
                         usage=command.usage if command.usage else "",
                         description=command.description,
+                        extension_name=extension_name,
                     )
                 )
 
         # Loop through all the slash commands
-        for command in app_command_list:
+        for command in self.bot.tree.walk_commands():
             # Ignore the command in a group
             if issubclass(command.__class__, app_commands.Group):
                 continue
 
-            # Check if extension is enabled
-            extension_name = command.callback.__module__[8:]
-            if extension_name not in configuration.get_config_entry(
-                ctx.guild.id, "core_enabled_extensions"
-            ):
-                continue
-
             # We have to manually build a string representation of the usage
             # We are given it in a list
             command_usage = "".join(
@@ -154,39 +166,83 @@ class Helper(cogs.BaseCog):
                     name=command.qualified_name,
                     usage=command_usage.strip(),
                     description=command.description,
-                    mention=command_mentions.get(command.qualified_name),
+                    extension_name=command.callback.__module__[8:],
+                    mention=self.command_mentions.get(command.qualified_name),
                 )
             )
 
-        # Sort and search the commands
-        sorted_commands = sorted(all_command_list, key=lambda x: x.name.lower())
-        filtered_commands = [
-            command
-            for command in sorted_commands
-            if search_term.lower() in command.name.lower()
-            or search_term.lower() in command.description.lower()
-        ]
+        self.help_index = sorted(all_command_list, key=lambda x: x.name.lower())
+        self.page_cache.clear()
 
-        # Ensure at least a single command was found
-        if not filtered_commands:
-            await auxiliary.send_deny_embed(
-                message=f"No commands matching `{search_term}` have been found",
-                channel=ctx.channel,
+    @commands.command(
+        name="help",
+        brief="Displays helpful infromation",
+        description="Searches commands for your query and dispays usage info",
+        usage="[search]",
+    )
+    async def help_command(
+        self: Self, ctx: commands.Context, search_term: str = ""
+    ) -> None:
+        """Main comand interface for getting help with bot commands.
+
+        This is a command and should be accessed via Discord.
+
+        Args:
+            ctx (commands.Context): the context object for the message
+            search_term (str, optional): The term to search command name and descriptions for.
+                Will default to empty string
+        """
+        command_prefix = await self.bot.get_prefix(ctx.message)
+        enabled_extensions = configuration.get_config_entry(
+            ctx.guild.id, "core_enabled_extensions"
+        )
+
+        cache_key = (
+            ctx.guild.id,
+            command_prefix,
+            search_term.lower(),
+            tuple(sorted(enabled_extensions)),
+        )
+        embeds = self.page_cache.get(cache_key)
+
+        if embeds is None:
+            # Search the commands of the enabled extensions
+            enabled_extensions = set(enabled_extensions)
+            filtered_commands = [
+                command
+                for command in self.help_index
+                if command.extension_name in enabled_extensions
+                and search_term.lower() in command.search_text
+            ]
+
+            # Ensure at least a single command was found
+            if not filtered_commands:
+                await auxiliary.send_deny_embed(
+                    message=f"No commands matching `{search_term}` have been found",
+                    channel=ctx.channel,
+                )
+                return
+
+            # Use pages to ensure we don't overflow the max embed size
+            embeds = self.build_embeds_from_list(
+                filtered_commands, search_term, command_prefix
             )
-            return
+            self.page_cache[cache_key] = embeds
 
-        # Use pages to ensure we don't overflow the max embed size
-        embeds = self.build_embeds_from_list(filtered_commands, search_term)
         await ui.PaginateView().send(ctx.channel, ctx.author, embeds)
 
     def build_embeds_from_list(
-        self: Self, commands_list: list[PrintableCommand], search_term: str
+        self: Self,
+        commands_list: list[PrintableCommand],
+        search_term: str,
+        command_prefix: str,
     ) -> list[discord.Embed]:
         """Takes a list of commands and returns a list of embeds ready to be paginated
 
         Args:
             commands_list (list[PrintableCommand]): A list of the dataclass PrintableCommand
             search_term (str): The string for the search term.
+            command_prefix (str): The prefix of the guild, for commands without their own
 
         Returns:
             list[discord.Embed]: The list of embeds always of at least size 1 ready
@@ -203,7 +259,7 @@ class Helper(cogs.BaseCog):
                 display_name = (
                     command.mention
                     if command.mention
-                    else f"{command.prefix}{command.name}"
+                    else f"{command.prefix or command_prefix}{command.name}"
                 )
                 embed.add_field(
                     name=f"{display_name} {command.usage}",
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Self
 
 import discord
 import munch
 from discord import app_commands
 
-from core import auxiliary, cogs
+from core import auxiliary, cogs, resources
 
 if TYPE_CHECKING:
     import bot
@@ -25,13 +24,24 @@ async def setup(bot: bot.TechSupportBot) -> None:
 
 
 class Weather(cogs.BaseCog):
-    """Class to set up the weather extension for the discord bot."""
+    """Class to set up the weather extension for the discord bot.
+
+    Attributes:
+        wmo_map (munch.Munch): The map of WMO codes to descriptions and images
+    """
 
     async def preconfig(self: Self) -> None:
-        """Loads the wmo-map.json file as self.wmo_map"""
-        wmo_file = "resources/wmo-map.json"
-        with open(wmo_file, "r", encoding="utf-8") as file:
-            self.wmo_map = munch.munchify(json.load(file))
+        """Loads the wmo-map.json file, so a missing file unloads the extension"""
+        resources.get_json("wmo-map.json", as_munch=True)
+
+    @property
+    def wmo_map(self: Self) -> munch.Munch:
+        """The parsed wmo-map.json file, shared through the resource registry
+
+        Returns:
+            munch.Munch: The map of WMO codes to descriptions and images
+        """
+        return resources.get_json("wmo-map.json", as_munch=True)
 
     @app_commands.command(
         name="weather",
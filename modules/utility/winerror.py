@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import bisect
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Self
+from typing import IO, TYPE_CHECKING, Self
 
 import discord
 from discord import app_commands
 
 import ui
-from core import auxiliary, cogs
+from core import auxiliary, cogs, resources
 
 if TYPE_CHECKING:
     import bot
@@ -35,11 +37,13 @@ class Error:
         name (str): the name of the error
         source (str): the header file where the error is from
         description (str): the description of the error
+        code (int): the unsigned integer value of the error
     """
 
     name: str
     source: str
     description: str
+    code: int = 0
 
 
 @dataclass
@@ -57,14 +61,218 @@ class ErrorCategory:
     errors: list[Error]
 
 
+class ErrorIndex:
+    """Lookup tables for the windows error list, built once per load of winerrors.json
+
+    Attributes:
+        HRESULT_HEADERS (tuple[str, ...]): The headers that define HRESULT codes
+        WORD_PATTERN (re.Pattern): The pattern used to split descriptions into words
+
+    Args:
+        raw_errors (list[dict[str, str]]): The decoded contents of winerrors.json
+    """
+
+    HRESULT_HEADERS: tuple[str, ...] = ("winerror.h", "winbio_err.h")
+    WORD_PATTERN: re.Pattern = re.compile(r"[a-z0-9_]+")
+
+    def __init__(self: Self, raw_errors: list[dict[str, str]]) -> None:
+        self.errors: list[Error] = []
+        self.by_code: dict[int, list[Error]] = {}
+        self.by_header: dict[str, dict[int, list[Error]]] = {}
+        self.by_name: dict[str, list[int]] = {}
+        self.name_trigrams: dict[str, set[int]] = {}
+        self.description_words: dict[str, set[int]] = {}
+
+        for position, raw_error in enumerate(raw_errors):
+            error = Error(
+                raw_error["name"],
+                raw_error["header"],
+                raw_error["description"],
+                int(raw_error["hex"], 16),
+            )
+            self.errors.append(error)
+            self.by_code.setdefault(error.code, []).append(error)
+            self.by_header.setdefault(error.source, {}).setdefault(
+                error.code, []
+            ).append(error)
+
+            lower_name = error.name.lower()
+            self.by_name.setdefault(lower_name, []).append(position)
+            for trigram in self.get_trigrams(lower_name):
+                self.name_trigrams.setdefault(trigram, set()).add(position)
+            for word in self.WORD_PATTERN.findall(error.description.lower()):
+                self.description_words.setdefault(word, set()).add(position)
+
+        self.sorted_names: list[str] = sorted(self.by_name)
+        self.sorted_words: list[str] = sorted(self.description_words)
+
+    @staticmethod
+    def get_trigrams(text: str) -> set[str]:
+        """Splits a string into every 3 character substring
+
+        Args:
+            text (str): The string to split
+
+        Returns:
+            set[str]: Every trigram in the string
+        """
+        return {text[index : index + 3] for index in range(len(text) - 2)}
+
+    def get_code_errors(self: Self, code: int) -> list[Error]:
+        """Gets every error with the given code
+
+        Args:
+            code (int): The unsigned value of the error
+
+        Returns:
+            list[Error]: The errors with this code, in file order
+        """
+        return self.by_code.get(code, [])
+
+    def get_hresult_errors(self: Self, code: int) -> list[Error]:
+        """Gets every error with the given code from the HRESULT headers
+
+        Args:
+            code (int): The lower 16 bits of an HRESULT
+
+        Returns:
+            list[Error]: The errors with this code that are defined as HRESULTs
+        """
+        errors = []
+        for header in self.HRESULT_HEADERS:
+            errors.extend(self.by_header.get(header, {}).get(code, []))
+        return errors
+
+    def prefix_matches(self: Self, sorted_keys: list[str], prefix: str) -> list[str]:
+        """Finds every key starting with a prefix, using a binary search
+
+        Args:
+            sorted_keys (list[str]): The sorted list of keys to search
+            prefix (str): The prefix to match
+
+        Returns:
+            list[str]: Every key starting with the prefix
+        """
+        matches = []
+        for key in sorted_keys[bisect.bisect_left(sorted_keys, prefix) :]:
+            if not key.startswith(prefix):
+                break
+            matches.append(key)
+        return matches
+
+    def search(self: Self, text: str, limit: int) -> list[Error]:
+        """Searches error names and descriptions
+        Exact name matches come first, then names starting with the text,
+        then names containing the text, then descriptions containing every word
+
+        Args:
+            text (str): The text to search for
+            limit (int): The most errors to return
+
+        Returns:
+            list[Error]: The matching errors, best matches first
+        """
+        query = text.strip().lower()
+        if not query:
+            return []
+
+        positions: list[int] = []
+        seen: set[int] = set()
+
+        def add_positions(new_positions: Iterable[int]) -> None:
+            """Adds positions to the results, skipping ones already found
+
+            Args:
+                new_positions (Iterable[int]): The positions to add
+            """
+            for position in sorted(new_positions):
+                if position not in seen:
+                    seen.add(position)
+                    positions.append(position)
+
+        add_positions(self.by_name.get(query, []))
+        for name in self.prefix_matches(self.sorted_names, query):
+            add_positions(self.by_name[name])
+
+        if len(query) >= 3 and len(positions) < limit:
+            candidates = None
+            for trigram in self.get_trigrams(query):
+                trigram_positions = self.name_trigrams.get(trigram, set())
+                candidates = (
+                    trigram_positions
+                    if candidates is None
+                    else candidates & trigram_positions
+                )
+                if not candidates:
+                    break
+            add_positions(
+                position
+                for position in candidates or set()
+                if query in self.errors[position].name.lower()
+            )
+
+        words = self.WORD_PATTERN.findall(query)
+        if words and len(positions) < limit:
+            candidates = None
+            for index, word in enumerate(words):
+                # The last word may still be being typed, so match it as a prefix
+                word_positions = set(self.description_words.get(word, set()))
+                if index == len(words) - 1:
+                    for match in self.prefix_matches(self.sorted_words, word):
+                        word_positions |= self.description_words[match]
+                candidates = (
+                    word_positions
+                    if candidates is None
+                    else candidates & word_positions
+                )
+                if not candidates:
+                    break
+            add_positions(candidates or set())
+
+        return [self.errors[position] for position in positions[:limit]]
+
+
+def parse_error_index(resource_file: IO[str]) -> ErrorIndex:
+    """Builds the error index from the winerrors.json file
+
+    Args:
+        resource_file (IO[str]): The open winerrors.json file
+
+    Returns:
+        ErrorIndex: The lookup tables for the errors in the file
+    """
+    return ErrorIndex(resources.parse_json(resource_file))
+
+
 class WindowsError(cogs.BaseCog):
-    """The core of the /winerror extension"""
+    """The core of the /winerror extension
+
+    Attributes:
+        error_index (ErrorIndex): The lookup tables for every known windows error
+        SEARCH_LIMIT (int): The most errors to show for a name or description search
+        AUTOCOMPLETE_LIMIT (int): The most suggestions discord allows for autocomplete
+        ERROR_CODE_PATTERN (re.Pattern): A decimal number, a 0x prefixed hex number,
+            or a full 8 digit hex number
+    """
+
+    SEARCH_LIMIT: int = 50
+    AUTOCOMPLETE_LIMIT: int = 25
+    ERROR_CODE_PATTERN: re.Pattern = re.compile(
+        r"-?[0-9]+|0x[0-9a-f]+|[0-9a-f]{8}", re.IGNORECASE
+    )
 
     async def preconfig(self: Self) -> None:
-        """Loads the winerrors.json file as self.errors"""
-        errors_file = "resources/winerrors.json"
-        with open(errors_file, "r", encoding="utf-8") as file:
-            self.errors = json.load(file)
+        """Builds the winerrors.json index, so a missing file unloads the extension"""
+        resources.get_resource("winerrors.json", parse_error_index)
+
+    @property
+    def error_index(self: Self) -> ErrorIndex:
+        """The index of winerrors.json, rebuilt by the resource registry on change
+
+        Returns:
+            ErrorIndex: The lookup tables for every known windows error
+        """
+        return resources.get_resource("winerrors.json", parse_error_index)
 
     @app_commands.command(
         name="winerror",
@@ -78,10 +286,134 @@ class WindowsError(cogs.BaseCog):
 
         Args:
             interaction (discord.Interaction): The interaction that started the command
+            search_term (str): The decimal or hex value, or the error name, to search for
+        """
+        categories = self.find_categories(search_term)
+
+        if len(categories) == 0:
+            embed = auxiliary.prepare_deny_embed(
+                f"No errors could be found for search term '{search_term}`"
+            )
+            await interaction.response.send_message(embed=embed)
+            return
+
+        embeds = []
+        await interaction.response.defer(ephemeral=False)
+        # loop through all errors in the category
+        for category_index, category in enumerate(categories):
+            embed = self.generate_blank_embed(
+                search_term=search_term,
+                category_index=(category_index + 1),
+                category_name=category.name,
+            )
+            for error_index, error in enumerate(category.errors):
+                if error_index % 10 == 0 and error_index > 0:
+                    if error_index + 1 == len(category.errors):
+                        continue
+                    embeds.append(embed)
+                    # Create a new embed for the next set of fields
+                    embed = self.generate_blank_embed(
+                        search_term=search_term,
+                        category_index=(category_index + 1),
+                        category_name=category.name,
+                    )
+                embed.add_field(
+                    name=f"{error.name} - {error.source}",
+                    value=error.description,
+                    inline=False,
+                )
+            embeds.append(embed)
+
+        # Initialize PaginateView with necessary arguments
+        await ui.PaginateView().send(
+            interaction.channel, interaction.user, embeds, interaction
+        )
+
+    @winerror.autocomplete("search_term")
+    async def winerror_autocomplete(
+        self: Self,
+        interaction: discord.Interaction,
+        current: str,
+    ) -> list[app_commands.Choice[str]]:
+        """This runs autocomplete for the winerror search term
+        This will suggest errors whose name or description matches current
+
+        Args:
+            interaction (discord.Interaction): The interaction creating the command
+            current (str): The current text in the search_term field
+
+        Returns:
+            list[app_commands.Choice[str]]: The list of options proposed to the user
+        """
+        if not current or self.is_error_code(current):
+            return []
+
+        return [
+            app_commands.Choice(
+                name=f"{error.name} ({hex(error.code)})"[:100], value=error.name[:100]
+            )
+            for error in self.error_index.search(current, self.AUTOCOMPLETE_LIMIT)
+        ]
+
+    def find_categories(self: Self, search_term: str) -> list[ErrorCategory]:
+        """Finds every category of errors for a search term
+        Words like "dead" are valid hex too, so anything that isn't clearly an
+        error code is searched as text as well, and so is a code with no errors
+
+        Args:
+            search_term (str): The code, name or description to search for
+
+        Returns:
+            list[ErrorCategory]: Every category with at least one error
+        """
+        categories = []
+        if self.is_error_code(search_term) or self.is_hex_number(search_term):
+            categories = self.handle_code_search(search_term)
+        if not categories or not self.is_error_code(search_term):
+            text_errors = self.handle_text_errors(search_term)
+            if text_errors:
+                categories.insert(0, text_errors)
+        return categories
+
+    def is_error_code(self: Self, search_term: str) -> bool:
+        """Checks if a search term is clearly an error code, rather than a name or
+        description that happens to only use the letters a to f
+
+        Args:
+            search_term (str): The search term the user entered
+
+        Returns:
+            bool: True if the search term is a decimal number, a 0x prefixed
+                hex number, or a full 8 digit hex number
+        """
+        return bool(self.ERROR_CODE_PATTERN.fullmatch(search_term.strip()))
+
+    def is_hex_number(self: Self, search_term: str) -> bool:
+        """Checks if a search term could be read as a hex number
+
+        Args:
+            search_term (str): The search term the user entered
+
+        Returns:
+            bool: True if the search term is a valid hex number
+        """
+        try:
+            int(search_term, 16)
+        except ValueError:
+            return False
+        return True
+
+    def handle_code_search(self: Self, search_term: str) -> list[ErrorCategory]:
+        """Finds every category of errors for a numeric search term
+
+        Args:
             search_term (str): The decimal or hex value to search for
 
         Raises:
             ValueError: In the event the hex is invalid
+
+        Returns:
+            list[ErrorCategory]: Every category with at least one error
         """
         # Convert entry into decimal and hex
         decimal_code = self.try_parse_decimal(search_term)
@@ -100,7 +432,7 @@ class WindowsError(cogs.BaseCog):
                 facility_code = int(upper_sixteen, 16) & 0x1FFF
             else:
                 severity = "SUCCESS (0)"
-                facility_code = upper_sixteen
+                facility_code = int(upper_sixteen, 16)
         except ValueError as exc:
             # this should never happen. the 32-bit checks in tryParseHex along with the 10 digit
             # check in padhex() should prevent the failure. The catch is here just in case I
@@ -126,49 +458,12 @@ class WindowsError(cogs.BaseCog):
                 categories.append(hresult_errors)
 
         # Decimal error - this might exist
-        if decimal_code > 0 and hex_code != hex(decimal_code):
+        if decimal_code > 0 and hex_code != decimal_code:
             decimal_errors = self.handle_decimal_errors(decimal_code)
             if decimal_errors:
                 categories.append(decimal_errors)
 
-        if len(categories) == 0:
-            embed = auxiliary.prepare_deny_embed(
-                f"No errors could be found for search term '{search_term}`"
-            )
-            await interaction.response.send_message(embed=embed)
-            return
-
-        embeds = []
-        await interaction.response.defer(ephemeral=False)
-        # loop through all errors in the category
-        for category_index, category in enumerate(categories):
-            embed = self.generate_blank_embed(
-                search_term=search_term,
-                category_index=(category_index + 1),
-                category_name=category.name,
-            )
-            for error_index, error in enumerate(category.errors):
-                if error_index % 10 == 0 and error_index > 0:
-                    if error_index + 1 == len(category.errors):
-                        continue
-                    embeds.append(embed)
-                    # Create a new embed for the next set of fields
-                    embed = self.generate_blank_embed(
-                        search_term=search_term,
-                        category_index=(category_index + 1),
-                        category_name=category.name,
-                    )
-                embed.add_field(
-                    name=f"{error.name} - {error.source}",
-                    value=error.description,
-                    inline=False,
-                )
-            embeds.append(embed)
-
-        # Initialize PaginateView with necessary arguments
-        await ui.PaginateView().send(
-            interaction.channel, interaction.user, embeds, interaction
-        )
+        return categories
 
     def handle_hresult_errors(
         self: Self, trunc_hex_code: int, severity: str, facility_code: int
@@ -176,32 +471,22 @@ class WindowsError(cogs.BaseCog):
         """Searches for and returns the hresult errors
 
         Args:
-            trunc_hex_code (int): _description_
-            severity (str): _description_
-            facility_code (int): _description_
+            trunc_hex_code (int): The lower 16 bits of the HRESULT
+            severity (str): The printable severity bit of the HRESULT
+            facility_code (int): The facility bits of the HRESULT
 
         Returns:
             ErrorCategory: The category with header and array of hresult errors
         """
-        valid_errors_trunc = [
-            x
-            for x in self.errors
-            if x["hex"] == hex(trunc_hex_code)
-            and (x["header"] == "winerror.h" or x["header"] == "winbio_err.h")
-        ]
+        valid_errors_trunc = self.error_index.get_hresult_errors(trunc_hex_code)
         if len(valid_errors_trunc) == 0:
             return None
 
-        category = ErrorCategory(
+        return ErrorCategory(
             f"As an HRESULT: Severity: {severity}, Facility: {hex(facility_code)},"
             f" Code: {hex(trunc_hex_code)}",
-            [],
+            list(valid_errors_trunc),
         )
-        for error in valid_errors_trunc:
-            category.errors.append(
-                Error(error["name"], error["header"], error["description"])
-            )
-        return category
 
     def handle_decimal_errors(self: Self, decimal_code: int) -> ErrorCategory:
         """Searches for errors based on a decimal input
@@ -212,17 +497,13 @@ class WindowsError(cogs.BaseCog):
         Returns:
             ErrorCategory: The category with header and array of decimal errors
         """
-        valid_errors_decimal = [x for x in self.errors if x["hex"] == hex(decimal_code)]
+        valid_errors_decimal = self.error_index.get_code_errors(decimal_code)
         if len(valid_errors_decimal) == 0:
             return None
-        category = ErrorCategory(
-            f"For decimal {decimal_code} / hex {hex(decimal_code)}", []
+        return ErrorCategory(
+            f"For decimal {decimal_code} / hex {hex(decimal_code)}",
+            list(valid_errors_decimal),
         )
-        for error in valid_errors_decimal:
-            category.errors.append(
-                Error(error["name"], error["header"], error["description"])
-            )
-        return category
 
     def handle_hex_errors(self: Self, hex_code: int) -> ErrorCategory:
         """Searches for errors based on a hex input
@@ -233,17 +514,29 @@ class WindowsError(cogs.BaseCog):
         Returns:
             ErrorCategory: The category with header and array of hex errors
         """
-        valid_errors_hex = [x for x in self.errors if x["hex"] == hex(hex_code)]
+        valid_errors_hex = self.error_index.get_code_errors(hex_code)
         if len(valid_errors_hex) == 0:
             return None
-        category = ErrorCategory(
-            f"For hex {hex(hex_code)} / decimal {self.twos_comp(hex_code, 32)}", []
+        return ErrorCategory(
+            f"For hex {hex(hex_code)} / decimal {self.twos_comp(hex_code, 32)}",
+            list(valid_errors_hex),
+        )
+
+    def handle_text_errors(self: Self, search_term: str) -> ErrorCategory:
+        """Searches for errors based on their name or description
+
+        Args:
+            search_term (str): The text to match errors to
+
+        Returns:
+            ErrorCategory: The category with header and array of matching errors
+        """
+        valid_errors_text = self.error_index.search(search_term, self.SEARCH_LIMIT)
+        if len(valid_errors_text) == 0:
+            return None
+        return ErrorCategory(
+            f"Names or descriptions matching '{search_term}'", valid_errors_text
         )
-        for error in valid_errors_hex:
-            category.errors.append(
-                Error(error["name"], error["header"], error["description"])
-            )
-        return category
 
     def twos_comp(self: Self, original_value: int, bits: int) -> int:
         """Compute the two's complement of an integer value.
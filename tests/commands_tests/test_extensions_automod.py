@@ -0,0 +1,90 @@
+"""
+This is a file to test the extensions/automod.py file
+This contains 3 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import configuration
+from core import auxiliary, verdicts
+from modules.moderation import automod
+
+
+class Test_GetMessageVerdict:
+    """Tests to ensure that a message is only checked once until it is edited"""
+
+    @pytest.mark.asyncio
+    async def test_checked_once(self: Self) -> None:
+        """Test to ensure that asking for a verdict twice only runs the checks once"""
+        # Step 1 - Setup env
+        message = MagicMock(id=1, clean_content="hello")
+        run_all_checks = AsyncMock(return_value=[])
+
+        # Step 2 - Call the function
+        with (
+            patch.object(verdicts, "verdict_cache", verdicts.VerdictCache()),
+            patch.object(automod, "run_all_checks", run_all_checks),
+        ):
+            first = await automod.get_message_verdict(message)
+            second = await automod.get_message_verdict(message)
+
+        # Step 3 - Assert that everything works
+        assert first is None
+        assert second is None
+        run_all_checks.assert_awaited_once_with(message)
+
+    @pytest.mark.asyncio
+    async def test_edit_checked_again(self: Self) -> None:
+        """Test to ensure that an edited message is checked again"""
+        # Step 1 - Setup env
+        message = MagicMock(id=1, clean_content="hello")
+        run_all_checks = AsyncMock(return_value=[])
+
+        # Step 2 - Call the function
+        with (
+            patch.object(verdicts, "verdict_cache", verdicts.VerdictCache()),
+            patch.object(automod, "run_all_checks", run_all_checks),
+        ):
+            await automod.get_message_verdict(message)
+            message.clean_content = "hello, edited"
+            await automod.get_message_verdict(message)
+
+        # Step 3 - Assert that everything works
+        assert run_all_checks.await_count == 2
+
+
+class Test_HandleFileHashes:
+    """Tests to ensure that only attachments that could be banned are downloaded"""
+
+    @pytest.mark.asyncio
+    async def test_skipped_attachments(self: Self) -> None:
+        """Test to ensure that attachments that are too large, or have a skipped
+        extension, are never hashed"""
+        # Step 1 - Setup env
+        config = {
+            "automod_banned_file_hashes": ["ABC"],
+            "automod_max_hash_size_mb": 1,
+            "automod_hash_skip_extensions": [".TXT"],
+        }
+        attachments = [
+            MagicMock(filename="notes.txt", size=10),
+            MagicMock(filename="large.png", size=2 * 1024 * 1024),
+            MagicMock(filename="small.png", size=10),
+        ]
+        get_attachment_hash = AsyncMock(return_value="abc")
+
+        # Step 2 - Call the function
+        with (
+            patch.object(configuration, "get_config_entry", lambda _, key: config[key]),
+            patch.object(auxiliary, "get_attachment_hash", get_attachment_hash),
+        ):
+            violations = await automod.handle_file_hashes(MagicMock(), attachments)
+
+        # Step 3 - Assert that everything works
+        get_attachment_hash.assert_awaited_once_with(attachments[2])
+        assert len(violations) == 1
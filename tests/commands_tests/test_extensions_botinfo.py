@@ -0,0 +1,54 @@
+"""
+This is a file to test the extensions/botinfo.py file
+This contains 1 test
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from modules.administration import botinfo
+
+
+class Test_VersionRefresh:
+    """Tests to ensure that only one version refresh chain ever runs"""
+
+    @pytest.mark.asyncio
+    async def test_unload_during_refresh(self: Self) -> None:
+        """Test to ensure that a refresh running when the cog is unloaded
+        doesn't schedule another refresh"""
+        # Step 1 - Setup env
+        with patch("asyncio.create_task", return_value=None):
+            botinfo_cog = botinfo.BotInfo(MagicMock())
+        botinfo_cog.bot.scheduler.schedule_delay = AsyncMock(return_value="job")
+        botinfo_cog.bot.scheduler.cancel_task = AsyncMock()
+        git_finished = asyncio.Event()
+
+        async def to_thread(_: object) -> str:
+            """Waits until the test lets git finish
+
+            Returns:
+                str: The version info
+            """
+            await git_finished.wait()
+            return "version"
+
+        with patch("asyncio.to_thread", to_thread):
+            git_finished.set()
+            await botinfo_cog.preconfig()
+            git_finished.clear()
+            refresh = asyncio.create_task(botinfo_cog.refresh_version_info({}))
+            await asyncio.sleep(0)
+
+            # Step 2 - Call the function
+            await botinfo_cog.cog_unload()
+            git_finished.set()
+            await refresh
+
+        # Step 3 - Assert that everything works
+        botinfo_cog.bot.scheduler.schedule_delay.assert_awaited_once()
+        botinfo_cog.bot.scheduler.cancel_task.assert_awaited_once_with("job")
@@ -0,0 +1,59 @@
+"""
+This is a file to test the extensions/duck.py file
+This contains 1 test
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Self
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from modules.fun import duck
+
+
+def make_duck_user(author_id: str, speed_record: float) -> SimpleNamespace:
+    """Makes a fake DuckUser entry in guild 1
+
+    Args:
+        author_id (str): The string representation of the ID of the user
+        speed_record (float): The fastest time of the user
+
+    Returns:
+        SimpleNamespace: The fake DuckUser entry
+    """
+    return SimpleNamespace(
+        author_id=author_id,
+        guild_id="1",
+        befriend_count=1,
+        kill_count=1,
+        speed_record=speed_record,
+    )
+
+
+class Test_UserDataDeleted:
+    """Tests to ensure that deleted users leave the cached leaderboards"""
+
+    @pytest.mark.asyncio
+    async def test_user_removed(self: Self) -> None:
+        """Test to ensure that a deleted user is no longer on any leaderboard,
+        and doesn't hold the record"""
+        # Step 1 - Setup env
+        with patch("asyncio.create_task", return_value=None):
+            duck_cog = duck.DuckHunt(MagicMock())
+        duck_cog.leaderboards = {
+            1: duck.DuckLeaderboard(
+                [make_duck_user("10", 1.5), make_duck_user("20", 3.0)]
+            )
+        }
+
+        # Step 2 - Call the function
+        await duck_cog.on_user_data_deleted(MagicMock(id=10))
+
+        # Step 3 - Assert that everything works
+        leaderboard = duck_cog.leaderboards[1]
+        assert [score.author_id for score in leaderboard.top_friends()] == ["20"]
+        assert [score.author_id for score in leaderboard.top_killers()] == ["20"]
+        assert leaderboard.global_record == 3.0
@@ -0,0 +1,150 @@
+"""
+This is a file to test the extensions/forum.py file
+This contains 6 tests
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from modules.operation import forum
+
+START = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def minutes(count: int) -> datetime.datetime:
+    """Gets a time a number of minutes after START
+
+    Args:
+        count (int): The number of minutes
+
+    Returns:
+        datetime.datetime: The time
+    """
+    return START + datetime.timedelta(minutes=count)
+
+
+def setup_local_extension() -> forum.ForumChannel:
+    """A simple function to setup an instance of the forum extension,
+    with a fake scheduler and one tracked thread
+
+    Returns:
+        forum.ForumChannel: The instance of the ForumChannel class
+    """
+    bot = MagicMock()
+    bot.scheduler.schedule_date = AsyncMock(side_effect=["job1", "job2"])
+    bot.scheduler.cancel_task = AsyncMock()
+    with patch("asyncio.create_task", return_value=None):
+        forum_cog = forum.ForumChannel(bot)
+    forum_cog.extension_enabled = MagicMock(return_value=True)
+    forum_cog.inactivity_heaps = {1: forum.InactivityHeap()}
+    forum_cog.forum_manager_jobs = {}
+    return forum_cog
+
+
+class Test_InactivityHeap:
+    """Tests to ensure that the heap finds abandoned threads"""
+
+    def test_activity_moves_deadline(self: Self) -> None:
+        """Test to ensure that a thread with new activity isn't expired
+        at its old deadline, but is at its new one"""
+        # Step 1 - Setup env
+        heap = forum.InactivityHeap()
+        heap.push(1, minutes(10))
+        heap.push(2, minutes(20))
+
+        # Step 2 - Call the function
+        heap.push(1, minutes(30))
+        expired_early = heap.pop_expired(minutes(15))
+        expired_late = heap.pop_expired(minutes(30))
+
+        # Step 3 - Assert that everything works
+        assert not expired_early
+        assert expired_late == [2, 1]
+        assert heap.peek() is None
+
+    def test_discard_skipped(self: Self) -> None:
+        """Test to ensure that discarded threads are never expired or peeked"""
+        # Step 1 - Setup env
+        heap = forum.InactivityHeap()
+        heap.push(1, minutes(10))
+        heap.push(2, minutes(20))
+
+        # Step 2 - Call the function
+        heap.discard(1)
+
+        # Step 3 - Assert that everything works
+        assert heap.peek() == minutes(20)
+        assert heap.pop_expired(minutes(30)) == [2]
+
+    def test_earlier_deadline_pushed(self: Self) -> None:
+        """Test to ensure that moving a deadline earlier makes it the soonest"""
+        # Step 1 - Setup env
+        heap = forum.InactivityHeap()
+        heap.push(1, minutes(30))
+
+        # Step 2 - Call the function
+        heap.push(1, minutes(5))
+
+        # Step 3 - Assert that everything works
+        assert heap.peek() == minutes(5)
+        assert heap.pop_expired(minutes(5)) == [1]
+
+
+class Test_ScheduleForumManager:
+    """Tests to ensure that the forum manager is always scheduled to run"""
+
+    @pytest.mark.asyncio
+    async def test_past_deadline_scheduled_now(self: Self) -> None:
+        """Test to ensure that a deadline that has passed is checked now,
+        even if the scheduler starts late"""
+        # Step 1 - Setup env
+        forum_cog = setup_local_extension()
+        forum_cog.inactivity_heaps[1].push(1, minutes(0))
+        guild = MagicMock(id=1)
+
+        # Step 2 - Call the function
+        await forum_cog.schedule_forum_manager(guild)
+
+        # Step 3 - Assert that everything works
+        kwargs = forum_cog.bot.scheduler.schedule_date.call_args.kwargs
+        assert kwargs["run_at"] > minutes(0)
+        assert kwargs["run_if_late"]
+
+    @pytest.mark.asyncio
+    async def test_missed_job_replaced(self: Self) -> None:
+        """Test to ensure that a job whose time has passed without running
+        doesn't stop the next check from being scheduled"""
+        # Step 1 - Setup env
+        forum_cog = setup_local_extension()
+        forum_cog.inactivity_heaps[1].push(1, minutes(0))
+        forum_cog.forum_manager_jobs[1] = (minutes(-5), "missed")
+        guild = MagicMock(id=1)
+
+        # Step 2 - Call the function
+        await forum_cog.schedule_forum_manager(guild)
+
+        # Step 3 - Assert that everything works
+        forum_cog.bot.scheduler.cancel_task.assert_awaited_once_with("missed")
+        assert forum_cog.forum_manager_jobs[1][1] == "job1"
+
+    @pytest.mark.asyncio
+    async def test_sooner_job_kept(self: Self) -> None:
+        """Test to ensure that a job that will run before the next deadline is kept"""
+        # Step 1 - Setup env
+        forum_cog = setup_local_extension()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        forum_cog.inactivity_heaps[1].push(1, now + datetime.timedelta(hours=2))
+        forum_cog.forum_manager_jobs[1] = (now + datetime.timedelta(hours=1), "job0")
+        guild = MagicMock(id=1)
+
+        # Step 2 - Call the function
+        await forum_cog.schedule_forum_manager(guild)
+
+        # Step 3 - Assert that everything works
+        forum_cog.bot.scheduler.schedule_date.assert_not_awaited()
+        assert forum_cog.forum_manager_jobs[1][1] == "job0"
@@ -0,0 +1,94 @@
+"""
+This is a file to test the extensions/paste.py file
+This contains 2 tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Self
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from modules.operation import paste
+
+
+async def setup_local_extension() -> paste.Paster:
+    """A simple function to setup an instance of the paste extension,
+    with its workers running and pastes in guild 1 that never finish
+
+    Returns:
+        paste.Paster: The instance of the Paster class
+    """
+    with patch("asyncio.create_task", return_value=None):
+        paste_cog = paste.Paster(MagicMock())
+    await paste_cog.preconfig()
+    paste_cog.pasted = []
+    blocked = asyncio.Event()
+
+    async def fake_paste(ctx: MagicMock, content: str) -> None:
+        """Records a paste, and blocks forever if it is in guild 1
+
+        Args:
+            ctx (MagicMock): The context of the message to paste
+            content (str): The content of the message
+        """
+        paste_cog.pasted.append(content)
+        if ctx.guild.id == 1:
+            await blocked.wait()
+
+    paste_cog.paste_message = fake_paste
+    return paste_cog
+
+
+def make_context(guild_id: int) -> MagicMock:
+    """Makes a mock context in a guild
+
+    Args:
+        guild_id (int): The ID of the guild
+
+    Returns:
+        MagicMock: The mock context
+    """
+    ctx = MagicMock()
+    ctx.guild.id = guild_id
+    return ctx
+
+
+class Test_PasteWorkers:
+    """Tests to ensure that the paste workers are shared fairly between guilds"""
+
+    @pytest.mark.asyncio
+    async def test_flood_leaves_workers_free(self: Self) -> None:
+        """Test to ensure that a guild flooding pastes doesn't hold up another guild"""
+        # Step 1 - Setup env
+        paste_cog = await setup_local_extension()
+        for index in range(10):
+            await paste_cog.queue_paste(make_context(1), f"flood {index}")
+
+        # Step 2 - Call the function
+        await paste_cog.queue_paste(make_context(2), "other")
+        await asyncio.sleep(0.01)
+
+        # Step 3 - Assert that everything works
+        assert "other" in paste_cog.pasted
+        flood_pastes = [content for content in paste_cog.pasted if "flood" in content]
+        assert len(flood_pastes) == paste_cog.GUILD_WORKER_COUNT
+        await paste_cog.cog_unload()
+
+    @pytest.mark.asyncio
+    async def test_every_paste_made(self: Self) -> None:
+        """Test to ensure that every queued paste is made exactly once"""
+        # Step 1 - Setup env
+        paste_cog = await setup_local_extension()
+
+        # Step 2 - Call the function
+        for index in range(5):
+            await paste_cog.queue_paste(make_context(2), f"paste {index}")
+        await asyncio.wait_for(paste_cog.paste_queue.join(), 1)
+
+        # Step 3 - Assert that everything works
+        assert sorted(paste_cog.pasted) == [f"paste {index}" for index in range(5)]
+        assert not paste_cog.guild_pastes
+        await paste_cog.cog_unload()
@@ -0,0 +1,79 @@
+"""
+This is a file to test the extensions/rules.py file
+This contains 2 tests
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core import rules_cache
+from modules.moderation import rules
+
+RULES = {"rules": [{"name": "Be nice", "description": "Keep it friendly"}]}
+
+
+def make_bot() -> MagicMock:
+    """Makes a fake bot whose database holds one set of rules
+
+    Returns:
+        MagicMock: The fake bot
+    """
+    bot = MagicMock()
+    query = MagicMock(rules=json.dumps(RULES))
+    query.update.return_value.apply = AsyncMock()
+    bot.models.Rule.query.where.return_value.gino.first = AsyncMock(return_value=query)
+    return bot
+
+
+class Test_ParsedRules:
+    """Tests to ensure that parsed rules are cached in core"""
+
+    @pytest.mark.asyncio
+    async def test_read_once(self: Self) -> None:
+        """Test to ensure that the rules are only read from the database once"""
+        # Step 1 - Setup env
+        rules_cache.parsed_rules.clear()
+        bot = make_bot()
+        guild = MagicMock(id=1)
+
+        # Step 2 - Call the function
+        first = await rules.get_parsed_rules(bot, guild)
+        second = await rules.get_parsed_rules(bot, guild)
+
+        # Step 3 - Assert that everything works
+        assert first is second
+        assert first.fields == (("Rule 1: Be nice", "Keep it friendly"),)
+        bot.models.Rule.query.where.return_value.gino.first.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_write_after_reload(
+        self: Self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test to ensure that rules written by a reloaded extension are seen by
+        cogs that still hold the old extension module, like modmail
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to import a fresh copy of rules
+        """
+        # Step 1 - Setup env
+        rules_cache.parsed_rules.clear()
+        bot = make_bot()
+        guild = MagicMock(id=1)
+        await rules.get_parsed_rules(bot, guild)
+        monkeypatch.delitem(sys.modules, rules.__name__)
+        new_rules = importlib.import_module(rules.__name__)
+
+        # Step 2 - Call the function
+        await new_rules.write_new_rules(bot, guild, RULES)
+        await rules.get_parsed_rules(bot, guild)
+
+        # Step 3 - Assert that everything works
+        assert new_rules is not rules
+        assert bot.models.Rule.query.where.return_value.gino.first.await_count == 3
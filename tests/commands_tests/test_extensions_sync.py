@@ -0,0 +1,84 @@
+"""
+This is a file to test the extensions/sync.py file
+This contains 2 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core import app_command_sync, auxiliary
+from modules.administration import sync
+
+
+def setup_local_extension() -> sync.AppCommandSync:
+    """A simple function to setup an instance of the sync extension
+
+    Returns:
+        sync.AppCommandSync: The instance of the AppCommandSync class
+    """
+    with patch("asyncio.create_task", return_value=None):
+        sync_cog = sync.AppCommandSync(MagicMock())
+    return sync_cog
+
+
+def make_context() -> MagicMock:
+    """Makes a mock context that can't show typing
+
+    Returns:
+        MagicMock: The mock context
+    """
+    ctx = MagicMock()
+    ctx.typing = None
+    return ctx
+
+
+class Test_SyncCommand:
+    """Tests to ensure that the sync command can be forced"""
+
+    @pytest.mark.asyncio
+    async def test_force(self: Self) -> None:
+        """Test to ensure that .sync force syncs every scope"""
+        # Step 1 - Setup env
+        sync_cog = setup_local_extension()
+        sync_changed_scopes = AsyncMock(return_value={})
+
+        # Step 2 - Call the function
+        with (
+            patch.object(app_command_sync, "sync_changed_scopes", sync_changed_scopes),
+            patch.object(auxiliary, "send_confirm_embed", AsyncMock()),
+        ):
+            await sync_cog.sync_slash_commands.callback(
+                sync_cog, make_context(), "force"
+            )
+            await sync_cog.sync_slash_commands.callback(sync_cog, make_context())
+
+        # Step 3 - Assert that everything works
+        assert [
+            call.kwargs["force"] for call in sync_changed_scopes.call_args_list
+        ] == [
+            True,
+            False,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_option(self: Self) -> None:
+        """Test to ensure that an unknown option is denied, rather than forcing a sync"""
+        # Step 1 - Setup env
+        sync_cog = setup_local_extension()
+        sync_changed_scopes = AsyncMock(return_value={})
+        send_deny_embed = AsyncMock()
+
+        # Step 2 - Call the function
+        with (
+            patch.object(app_command_sync, "sync_changed_scopes", sync_changed_scopes),
+            patch.object(auxiliary, "send_deny_embed", send_deny_embed),
+        ):
+            await sync_cog.sync_slash_commands.callback(sync_cog, make_context(), "yes")
+
+        # Step 3 - Assert that everything works
+        sync_changed_scopes.assert_not_awaited()
+        send_deny_embed.assert_awaited_once()
@@ -0,0 +1,136 @@
+"""
+This is a file to test the extensions/winerror.py file
+This contains 6 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import MagicMock, patch
+
+from modules.utility import winerror
+
+RAW_ERRORS = [
+    {
+        "name": "ERROR_ACCESS_DENIED",
+        "header": "winerror.h",
+        "description": "Access is denied.",
+        "hex": "0x00000005",
+    },
+    {
+        "name": "E_ACCESSDENIED",
+        "header": "winerror.h",
+        "description": "General access denied error.",
+        "hex": "0x80070005",
+    },
+    {
+        "name": "ERROR_DEAD_LOCK",
+        "header": "ntstatus.h",
+        "description": "A dead lock was detected.",
+        "hex": "0x00000abc",
+    },
+]
+
+
+def setup_local_extension() -> winerror.WindowsError:
+    """A simple function to setup an instance of the winerror extension,
+    with a small error index
+
+    Returns:
+        winerror.WindowsError: The instance of the WindowsError class
+    """
+    with patch("asyncio.create_task", return_value=None):
+        winerror_cog = winerror.WindowsError(MagicMock())
+    return winerror_cog
+
+
+class Test_ErrorIndex:
+    """Tests to ensure that errors are found by name and description"""
+
+    def test_name_matches_ordered(self: Self) -> None:
+        """Test to ensure that names starting with the text come before
+        descriptions containing it"""
+        # Step 1 - Setup env
+        index = winerror.ErrorIndex(RAW_ERRORS)
+
+        # Step 2 - Call the function
+        errors = index.search("err", 10)
+
+        # Step 3 - Assert that everything works
+        assert [error.name for error in errors] == [
+            "ERROR_ACCESS_DENIED",
+            "ERROR_DEAD_LOCK",
+            "E_ACCESSDENIED",
+        ]
+
+    def test_description_words(self: Self) -> None:
+        """Test to ensure that every word must be in the description,
+        and the last word is matched as a prefix"""
+        # Step 1 - Setup env
+        index = winerror.ErrorIndex(RAW_ERRORS)
+
+        # Step 2 - Call the function
+        errors = index.search("general den", 10)
+
+        # Step 3 - Assert that everything works
+        assert [error.name for error in errors] == ["E_ACCESSDENIED"]
+
+    def test_codes_indexed(self: Self) -> None:
+        """Test to ensure that errors are found by code and as HRESULTs"""
+        # Step 1 - Setup env
+        index = winerror.ErrorIndex(RAW_ERRORS)
+
+        # Step 2 - Call the function
+        code_errors = index.get_code_errors(0x80070005)
+        hresult_errors = index.get_hresult_errors(0x0ABC)
+
+        # Step 3 - Assert that everything works
+        assert [error.name for error in code_errors] == ["E_ACCESSDENIED"]
+        assert not hresult_errors
+
+
+class Test_IsErrorCode:
+    """Tests to ensure that only clear error codes skip the text search"""
+
+    def test_codes(self: Self) -> None:
+        """Test to ensure that decimal, 0x prefixed and 8 digit hex are codes"""
+        # Step 1 - Setup env
+        winerror_cog = setup_local_extension()
+
+        # Step 2 - Call the function
+        results = [
+            winerror_cog.is_error_code(term) for term in ("5", "-5", "0x5", "80070005")
+        ]
+
+        # Step 3 - Assert that everything works
+        assert all(results)
+
+    def test_hex_words(self: Self) -> None:
+        """Test to ensure that words made of hex letters aren't codes"""
+        # Step 1 - Setup env
+        winerror_cog = setup_local_extension()
+
+        # Step 2 - Call the function
+        results = [
+            winerror_cog.is_error_code(term)
+            for term in ("dead", "bad", "cafe", "add", "fade")
+        ]
+
+        # Step 3 - Assert that everything works
+        assert not any(results)
+
+    def test_hex_word_searched_as_text(self: Self) -> None:
+        """Test to ensure that a hex word is searched as text, before its code"""
+        # Step 1 - Setup env
+        winerror_cog = setup_local_extension()
+        index = winerror.ErrorIndex(RAW_ERRORS)
+
+        # Step 2 - Call the function
+        with patch.object(winerror.resources, "get_resource", return_value=index):
+            categories = winerror_cog.find_categories("dead")
+            code_categories = winerror_cog.find_categories("0xabc")
+
+        # Step 3 - Assert that everything works
+        assert [error.name for error in categories[0].errors] == ["ERROR_DEAD_LOCK"]
+        assert len(code_categories) == 1
+        assert code_categories[0].name.startswith("For hex")
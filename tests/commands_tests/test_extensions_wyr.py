@@ -1,6 +1,6 @@
 """
 This is a file to test the extensions/wyr.py file
-This contains 7 tests
+This contains 8 tests
 """
 
 from __future__ import annotations
@@ -8,12 +8,12 @@ from __future__ import annotations
 import importlib
 import random
 from typing import Self
-from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
 
-from core import auxiliary
+from core import auxiliary, resources
 from modules.fun import wyr
 from tests import config_for_tests, helpers
 
@@ -37,7 +37,7 @@ class Test_Preconfig:
 
     @pytest.mark.asyncio
     async def test_preconfig(self: Self) -> None:
-        """A test to ensure that preconfig sets the last variable correctly"""
+        """A test to ensure that preconfig sets up a fresh question cursor"""
         # Step 1 - Setup env
         discord_env = config_for_tests.FakeDiscordEnv()
         wyr_test = setup_local_extension(discord_env.bot)
@@ -46,7 +46,8 @@ class Test_Preconfig:
         await wyr_test.preconfig()
 
         # Step 3 - Assert that everything works
-        assert wyr_test.last is None
+        assert isinstance(wyr_test.question_cursor, resources.ShuffledCursor)
+        assert wyr_test.question_cursor.last is None
 
 
 class Test_WYR_Command:
@@ -99,20 +100,20 @@ class Test_Get_Question:
     """A set of tests to test the get_question function
 
     Attributes:
-        sample_resource (str): A set of same questions for doing unit tests
+        sample_resource (tuple[str, ...]): A set of same questions for doing unit tests
     """
 
-    sample_resource: str = '"q1o1" || "q1o2"\n"q2o1" || "q2o2"'
+    sample_resource: tuple[str, ...] = ('"q1o1" || "q1o2"', '"q2o1" || "q2o2"')
 
     def test_any_question(self: Self) -> None:
         """Ensure that get_question gets any question"""
         # Step 1 - Setup env
         discord_env = config_for_tests.FakeDiscordEnv()
         wyr_test = setup_local_extension(discord_env.bot)
-        wyr_test.last = None
+        wyr_test.question_cursor = resources.ShuffledCursor()
 
         # Step 2 - Call the function
-        with patch("builtins.open", mock_open(read_data=self.sample_resource)):
+        with patch.object(resources, "get_lines", return_value=self.sample_resource):
             question = wyr_test.get_question()
 
         # Step 3 - Assert that everything works
@@ -124,10 +125,10 @@ class Test_Get_Question:
         # Step 1 - Setup env
         discord_env = config_for_tests.FakeDiscordEnv()
         wyr_test = setup_local_extension(discord_env.bot)
-        wyr_test.last = None
+        wyr_test.question_cursor = resources.ShuffledCursor()
 
         # Step 2 - Call the function
-        with patch("builtins.open", mock_open(read_data=self.sample_resource)):
+        with patch.object(resources, "get_lines", return_value=self.sample_resource):
             question = wyr_test.get_question()
 
         # Step 3 - Assert that everything works
@@ -141,10 +142,11 @@ class Test_Get_Question:
         # Step 1 - Setup env
         discord_env = config_for_tests.FakeDiscordEnv()
         wyr_test = setup_local_extension(discord_env.bot)
-        wyr_test.last = '"q1o1" || "q1o2"'
+        wyr_test.question_cursor = resources.ShuffledCursor()
+        wyr_test.question_cursor.last = '"q1o1" || "q1o2"'
 
         # Step 2 - Call the function
-        with patch("builtins.open", mock_open(read_data=self.sample_resource)):
+        with patch.object(resources, "get_lines", return_value=self.sample_resource):
             question = wyr_test.get_question()
 
         # Step 3 - Assert that everything works
@@ -153,19 +155,34 @@ class Test_Get_Question:
         # Step 4 - Cleanup
         importlib.reload(random)
 
+    def test_every_question_before_repeat(self: Self) -> None:
+        """A test to ensure that every question is used before any question repeats"""
+        # Step 1 - Setup env
+        discord_env = config_for_tests.FakeDiscordEnv()
+        wyr_test = setup_local_extension(discord_env.bot)
+        wyr_test.question_cursor = resources.ShuffledCursor()
+        many_questions = tuple(f'"q{i}o1" || "q{i}o2"' for i in range(10))
+
+        # Step 2 - Call the function
+        with patch.object(resources, "get_lines", return_value=many_questions):
+            questions = [wyr_test.get_question() for _ in range(10)]
+
+        # Step 3 - Assert that everything works
+        assert sorted(questions) == sorted(many_questions)
+
     def test_last_set(self: Self) -> None:
         """Ensure that the last variable is properly set"""
         # Step 1 - Setup env
         discord_env = config_for_tests.FakeDiscordEnv()
         wyr_test = setup_local_extension(discord_env.bot)
-        wyr_test.last = None
+        wyr_test.question_cursor = resources.ShuffledCursor()
 
         # Step 2 - Call the function
-        with patch("builtins.open", mock_open(read_data=self.sample_resource)):
+        with patch.object(resources, "get_lines", return_value=self.sample_resource):
             question = wyr_test.get_question()
 
         # Step 3 - Assert that everything works
-        assert wyr_test.last is question
+        assert wyr_test.question_cursor.last is question
 
     def test_create_question_string(self: Self) -> None:
         """Ensure that the string is properly turned into
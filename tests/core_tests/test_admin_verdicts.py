@@ -0,0 +1,84 @@
+"""
+This is a file to test the admin role verdicts in the bot.py file
+This contains 2 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import expiringdict
+import pytest
+
+import bot
+
+
+def make_bot() -> bot.TechSupportBot:
+    """Makes a bot, without starting it, where "Admin" is an admin role
+
+    Returns:
+        bot.TechSupportBot: The bot
+    """
+    discord_bot = bot.TechSupportBot.__new__(bot.TechSupportBot)
+    discord_bot.logger = MagicMock(send_log=AsyncMock())
+    discord_bot.get_owner = AsyncMock(return_value=None)
+    discord_bot.admin_ids = frozenset()
+    discord_bot.admin_role_names = frozenset({"Admin"})
+    discord_bot.admin_role_verdicts = expiringdict.ExpiringDict(
+        max_len=100, max_age_seconds=3600
+    )
+    return discord_bot
+
+
+def make_member(role_names: list[str]) -> MagicMock:
+    """Makes a mock member of guild 1 with the given roles
+
+    Args:
+        role_names (list[str]): The names of the roles of the member
+
+    Returns:
+        MagicMock: The mock member
+    """
+    member = MagicMock(id=2)
+    member.guild.id = 1
+    member.roles = [MagicMock() for _ in role_names]
+    for role, name in zip(member.roles, role_names):
+        role.name = name
+    return member
+
+
+class Test_AdminVerdicts:
+    """Tests to ensure that cached admin verdicts are dropped when roles may change"""
+
+    @pytest.mark.asyncio
+    async def test_rejoin_drops_verdict(self: Self) -> None:
+        """Test to ensure that a member who leaves and rejoins without their
+        admin role is no longer an admin"""
+        # Step 1 - Setup env
+        discord_bot = make_bot()
+        admin = make_member(["Admin"])
+        was_admin = await discord_bot.is_bot_admin(admin)
+
+        # Step 2 - Call the function
+        await discord_bot.on_member_remove(admin)
+        rejoined = make_member([])
+        await discord_bot.on_member_join(rejoined)
+
+        # Step 3 - Assert that everything works
+        assert was_admin
+        assert not await discord_bot.is_bot_admin(rejoined)
+
+    @pytest.mark.asyncio
+    async def test_resume_drops_verdicts(self: Self) -> None:
+        """Test to ensure that every verdict is dropped after a resume,
+        as role changes may have been missed"""
+        # Step 1 - Setup env
+        discord_bot = make_bot()
+        await discord_bot.is_bot_admin(make_member(["Admin"]))
+
+        # Step 2 - Call the function
+        await discord_bot.on_resumed()
+
+        # Step 3 - Assert that everything works
+        assert not await discord_bot.is_bot_admin(make_member([]))
@@ -0,0 +1,109 @@
+"""
+This is a file to test the core/app_command_sync.py file
+This contains 3 tests
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+from discord import app_commands
+
+from core import app_command_sync
+
+
+def make_command(name: str) -> app_commands.Command:
+    """Makes a simple slash command to put in a tree
+
+    Args:
+        name (str): The name of the command
+
+    Returns:
+        app_commands.Command: The slash command
+    """
+
+    async def callback(interaction: discord.Interaction) -> None:
+        """Does nothing
+
+        Args:
+            interaction (discord.Interaction): The interaction that called this command
+        """
+
+    return app_commands.Command(name=name, description=name, callback=callback)
+
+
+class Test_TreeHash:
+    """Tests to ensure that the tree hash only changes when the commands change"""
+
+    def test_order_ignored(self: Self) -> None:
+        """Test to ensure that adding the same commands in another order
+        gives the same hash"""
+        # Step 1 - Setup env
+        first_tree = app_commands.CommandTree(
+            discord.Client(intents=discord.Intents.none())
+        )
+        second_tree = app_commands.CommandTree(
+            discord.Client(intents=discord.Intents.none())
+        )
+        for name in ["alpha", "beta"]:
+            first_tree.add_command(make_command(name))
+        for name in ["beta", "alpha"]:
+            second_tree.add_command(make_command(name))
+
+        # Step 2 - Call the function
+        first_hash = app_command_sync.get_tree_hash(first_tree)
+        second_hash = app_command_sync.get_tree_hash(second_tree)
+
+        # Step 3 - Assert that everything works
+        assert first_hash == second_hash
+
+    def test_new_command_changes_hash(self: Self) -> None:
+        """Test to ensure that adding a command changes the hash"""
+        # Step 1 - Setup env
+        tree = app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+        tree.add_command(make_command("alpha"))
+        old_hash = app_command_sync.get_tree_hash(tree)
+
+        # Step 2 - Call the function
+        tree.add_command(make_command("beta"))
+        new_hash = app_command_sync.get_tree_hash(tree)
+
+        # Step 3 - Assert that everything works
+        assert old_hash != new_hash
+
+
+class Test_SyncChangedScopes:
+    """Tests to ensure that only scopes that changed are synced"""
+
+    @pytest.mark.asyncio
+    async def test_scopes_skipped(self: Self) -> None:
+        """Test to ensure that unchanged scopes and guilds that were never synced
+        and have no commands are skipped, but guilds whose commands were removed
+        or added are synced"""
+        # Step 1 - Setup env
+        tree = app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+        tree.add_command(make_command("alpha"))
+        tree.add_command(make_command("beta"), guild=discord.Object(id=7))
+        tree.sync = AsyncMock(return_value=[])
+        rows = [
+            SimpleNamespace(
+                scope=app_command_sync.GLOBAL_SCOPE,
+                tree_hash=app_command_sync.get_tree_hash(tree),
+            ),
+            SimpleNamespace(scope="6", tree_hash="removed commands"),
+        ]
+        discord_bot = MagicMock(tree=tree, guilds=[MagicMock(id=5), MagicMock(id=7)])
+        discord_bot.models.AppCommandTree.query.gino.all = AsyncMock(return_value=rows)
+
+        # Step 2 - Call the function
+        with patch.object(app_command_sync, "save_tree_hash", AsyncMock()):
+            synced = await app_command_sync.sync_changed_scopes(discord_bot)
+            forced = await app_command_sync.sync_changed_scopes(discord_bot, force=True)
+
+        # Step 3 - Assert that everything works
+        assert set(synced) == {"6", "7"}
+        assert set(forced) == {app_command_sync.GLOBAL_SCOPE, "6", "7"}
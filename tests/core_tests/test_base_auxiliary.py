@@ -1,11 +1,13 @@
 """
 This is a file to test the base/auxiliary.py file
-This contains 23 tests
+This contains 32 tests
 """
 
 from __future__ import annotations
 
+import asyncio
 import importlib
+from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING, Self
 from unittest.mock import AsyncMock, MagicMock, call
 
@@ -14,7 +16,7 @@ import pytest
 from hypothesis import given
 from hypothesis.strategies import text
 
-from core import auxiliary
+from core import auxiliary, message_window
 from tests import config_for_tests
 
 if TYPE_CHECKING:
@@ -229,6 +231,221 @@ class Test_SearchForMessage:
             assert not found_message.content.startswith(config_for_tests.PREFIX)
 
 
+class Test_SearchMessageWindow:
+    """Tests to ensure that searches are served from the recent message window"""
+
+    def make_channel(self: Self, message_history: list[MagicMock]) -> MagicMock:
+        """Makes a mock channel that tracks how often its history is read
+
+        Args:
+            message_history (list[MagicMock]): The messages in the channel, newest first
+
+        Returns:
+            MagicMock: The mock channel
+        """
+        channel = MagicMock(id=1, guild=None)
+        channel.history_reads = 0
+
+        async def history(limit: int) -> AsyncGenerator[MagicMock, None]:
+            channel.history_reads += 1
+            for message in message_history[:limit]:
+                yield message
+
+        channel.history = history
+        for index, message in enumerate(message_history):
+            message.id = len(message_history) - index
+            message.channel = channel
+        return channel
+
+    @pytest.mark.asyncio
+    async def test_cold_window_falls_back(self: Self) -> None:
+        """Test to ensure that an untracked channel is read from history,
+        and that the next search is served from the window"""
+        # Step 1 - Setup env
+        message_window.recent_messages.clear()
+        message = MagicMock(content="message")
+        channel = self.make_channel([message])
+
+        # Step 2 - Call the function
+        first = await auxiliary.search_channel_for_message(channel=channel)
+        second = await auxiliary.search_channel_for_message(channel=channel)
+
+        # Step 3 - Assert that everything works
+        assert first == message
+        assert second == message
+        assert channel.history_reads == 1
+
+    @pytest.mark.asyncio
+    async def test_window_tracks_new_messages(self: Self) -> None:
+        """Test to ensure that sent and deleted messages update the window"""
+        # Step 1 - Setup env
+        message_window.recent_messages.clear()
+        old_message = MagicMock(content="old")
+        channel = self.make_channel([old_message])
+        await auxiliary.search_channel_for_message(channel=channel)
+        new_message = MagicMock(id=5, content="new", channel=channel)
+        message_window.recent_messages.add_message(new_message)
+
+        # Step 2 - Call the function
+        newest = await auxiliary.search_channel_for_message(channel=channel)
+        message_window.recent_messages.delete_messages(None, 1, [5])
+        after_delete = await auxiliary.search_channel_for_message(channel=channel)
+
+        # Step 3 - Assert that everything works
+        assert newest == new_message
+        assert after_delete == old_message
+        assert channel.history_reads == 1
+
+    @pytest.mark.asyncio
+    async def test_long_search_reads_history(self: Self) -> None:
+        """Test to ensure that a search past the window size isn't answered from
+        a window that was filled from a longer, but short, history"""
+        # Step 1 - Setup env
+        message_window.recent_messages.clear()
+        message_history = [MagicMock(content=f"message {index}") for index in range(80)]
+        channel = self.make_channel(message_history)
+        await auxiliary.search_channel_for_message(channel=channel, limit=100)
+
+        # Step 2 - Call the function
+        oldest = await auxiliary.search_channel_for_message(
+            channel=channel, content_to_match="message 79", limit=100
+        )
+
+        # Step 3 - Assert that everything works
+        assert oldest == message_history[79]
+        assert channel.history_reads == 2
+
+    def test_full_window_not_complete(self: Self) -> None:
+        """Test to ensure that a complete window stops being complete once it
+        has to drop its oldest message"""
+        # Step 1 - Setup env
+        window = message_window.ChannelWindow(2)
+        window.complete = True
+
+        # Step 2 - Call the function
+        window.add(MagicMock(id=1))
+        window.add(MagicMock(id=2))
+        still_complete = window.can_answer(10)
+        window.add(MagicMock(id=3))
+
+        # Step 3 - Assert that everything works
+        assert still_complete
+        assert not window.can_answer(10)
+        assert window.can_answer(2)
+
+
+class Test_BuildAttachmentFiles:
+    """Tests to ensure that attachments are downloaded once and within the size limit"""
+
+    def make_attachment(self: Self, attachment_id: int, size: int) -> MagicMock:
+        """Makes a mock attachment with a readable body
+
+        Args:
+            attachment_id (int): The ID of the attachment
+            size (int): The size of the attachment, in bytes
+
+        Returns:
+            MagicMock: The mock attachment
+        """
+        attachment = MagicMock(
+            id=attachment_id, size=size, filename=f"{attachment_id}.txt"
+        )
+        attachment.description = None
+        attachment.is_spoiler.return_value = False
+        attachment.read = AsyncMock(return_value=b"a" * size)
+        return attachment
+
+    @pytest.mark.asyncio
+    async def test_size_limit(self: Self) -> None:
+        """Test to ensure that attachments past the size limit aren't downloaded"""
+        # Step 1 - Setup env
+        small = self.make_attachment(101, 10)
+        large = self.make_attachment(102, 100)
+
+        # Step 2 - Call the function
+        files = await auxiliary.build_attachment_files([small, large], 50)
+
+        # Step 3 - Assert that everything works
+        assert [attachment.filename for attachment in files] == ["101.txt"]
+        large.read.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_shared_download(self: Self) -> None:
+        """Test to ensure that reposting an attachment twice at once only downloads it once"""
+        # Step 1 - Setup env
+        attachment = self.make_attachment(103, 10)
+
+        # Step 2 - Call the function
+        first, second = await asyncio.gather(
+            auxiliary.build_attachment_files([attachment], 50),
+            auxiliary.build_attachment_files([attachment], 50),
+        )
+
+        # Step 3 - Assert that everything works
+        assert first[0].fp.read() == second[0].fp.read() == b"a" * 10
+        attachment.read.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_finished_download_not_kept(self: Self) -> None:
+        """Test to ensure that the contents of a finished download aren't kept"""
+        # Step 1 - Setup env
+        attachment = self.make_attachment(104, 10)
+
+        # Step 2 - Call the function
+        await auxiliary.get_attachment_bytes(attachment)
+        await asyncio.sleep(0)
+        await auxiliary.get_attachment_bytes(attachment)
+        await asyncio.sleep(0)
+
+        # Step 3 - Assert that everything works
+        assert attachment.read.await_count == 2
+        assert 104 not in auxiliary._attachment_bytes  # pylint: disable=W0212
+
+
+class Test_AttachmentHash:
+    """Tests to ensure that attachment hashes share a download and session"""
+
+    @pytest.mark.asyncio
+    async def test_failure_not_kept(
+        self: Self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test to ensure that a hash that fails with any error is tried again
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Used to replace the file download
+        """
+        # Step 1 - Setup env
+        stream_file_hash = AsyncMock(side_effect=[ValueError("failed"), "abc"])
+        monkeypatch.setattr(auxiliary, "stream_file_hash", stream_file_hash)
+        attachment = MagicMock(id=201, url="https://example.com/file")
+
+        # Step 2 - Call the function
+        with pytest.raises(ValueError):
+            await auxiliary.get_attachment_hash(attachment)
+        file_hash = await auxiliary.get_attachment_hash(attachment)
+
+        # Step 3 - Assert that everything works
+        assert file_hash == "abc"
+        assert stream_file_hash.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_session_reused(self: Self) -> None:
+        """Test to ensure that one session is used until it is closed"""
+        # Step 1 - Setup env
+        first = auxiliary.get_download_session()
+
+        # Step 2 - Call the function
+        second = auxiliary.get_download_session()
+        await auxiliary.close_download_session()
+        third = auxiliary.get_download_session()
+        await auxiliary.close_download_session()
+
+        # Step 3 - Assert that everything works
+        assert first is second
+        assert first.closed
+        assert third is not first
+
+
 class Test_GenerateBasicEmbed:
     """Basic tests to test the generate_basic_embed function"""
 
@@ -0,0 +1,105 @@
+"""
+This is a file to test the core/command_checks.py file
+This contains 3 tests
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import shutil
+from types import SimpleNamespace
+from typing import Self
+from unittest.mock import AsyncMock
+
+import pytest
+
+import configuration
+from core import command_checks
+
+
+class Test_CheckPlanner:
+    """Tests to ensure that check plans and guild config snapshots are correct"""
+
+    def test_plan_from_command(self: Self) -> None:
+        """Test to ensure that the plan has the extension name and extras of a command"""
+        # Step 1 - Setup env
+        planner = command_checks.CheckPlanner("modules")
+        command = SimpleNamespace(
+            module="modules.internal.privacy", extras={"always_enabled": True}
+        )
+
+        # Step 2 - Call the function
+        plan = planner.build_plan(command)
+
+        # Step 3 - Assert that everything works
+        assert plan == command_checks.CheckPlan(
+            extension_name="internal.privacy",
+            always_enabled=True,
+            suppress_logs=False,
+        )
+
+    def test_snapshot_read_again_on_change(
+        self: Self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test to ensure that a guild config is only read again once it changes
+
+        Args:
+            tmp_path (pathlib.Path): A temporary directory to hold the configs
+            monkeypatch (pytest.MonkeyPatch): Used to point the config at tmp_path
+        """
+        # Step 1 - Setup env
+        shutil.copy(
+            os.path.join(configuration.config.BASE_PATH, "config.default.json"),
+            tmp_path,
+        )
+        monkeypatch.setattr(configuration.config, "BASE_PATH", f"{tmp_path}/")
+        os.makedirs(tmp_path / "guild_configs")
+        config_path = tmp_path / "guild_configs" / "1.json"
+        config_path.write_text(
+            json.dumps({"core_guild_id": 1, "core_enabled_extensions": ["fun.duck"]})
+        )
+        planner = command_checks.CheckPlanner("modules")
+
+        # Step 2 - Call the function
+        first = planner.get_guild_config(1)
+        second = planner.get_guild_config(1)
+        config_path.write_text(
+            json.dumps(
+                {
+                    "core_guild_id": 1,
+                    "core_enabled_extensions": ["fun.duck", "fun.hangman"],
+                }
+            )
+        )
+        third = planner.get_guild_config(1)
+
+        # Step 3 - Assert that everything works
+        assert first is second
+        assert first.enabled_extensions == frozenset({"fun.duck"})
+        assert third.enabled_extensions == frozenset({"fun.duck", "fun.hangman"})
+
+
+class Test_CommandAuditLog:
+    """Tests to ensure that commands are logged in batches"""
+
+    @pytest.mark.asyncio
+    async def test_one_log_per_batch(self: Self) -> None:
+        """Test to ensure that commands in the same guild are logged together"""
+        # Step 1 - Setup env
+        discord_bot = SimpleNamespace(logger=SimpleNamespace(send_log=AsyncMock()))
+        audit_log = command_checks.CommandAuditLog(discord_bot)
+        guild = SimpleNamespace(id=1)
+        channel = SimpleNamespace(id=2, name="general")
+        for index in range(3):
+            audit_log.add(guild, channel, f"user{index}", f"/ping {index}", "3")
+
+        # Step 2 - Call the function
+        await audit_log.flush()
+
+        # Step 3 - Assert that everything works
+        discord_bot.logger.send_log.assert_awaited_once()
+        message = discord_bot.logger.send_log.call_args.kwargs["message"]
+        assert message.count("\n") == 3
+        assert not audit_log.pending
@@ -0,0 +1,61 @@
+"""
+This is a file to test the benchmarks/gateway_replay.py file
+This contains 2 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+import pytest
+
+from benchmarks import gateway_replay
+
+
+class Test_GenerateEvents:
+    """Tests to ensure that generated event streams can be replayed"""
+
+    def test_same_seed_same_events(self: Self) -> None:
+        """Test to ensure that the same seed always gives the same events,
+        and that edits and reactions only refer to messages sent before them"""
+        # Step 1 - Setup env
+        sent = set()
+
+        # Step 2 - Call the function
+        events = gateway_replay.generate_events(500, seed=3)
+
+        # Step 3 - Assert that everything works
+        assert events == gateway_replay.generate_events(500, seed=3)
+        for event in events:
+            if event["type"] == "message":
+                sent.add(event["message_id"])
+            elif event["type"] in ("edit", "reaction"):
+                assert event["message_id"] in sent
+
+
+class Test_Replay:
+    """Tests to ensure that the replay counts the work done by the extensions"""
+
+    @pytest.mark.asyncio
+    async def test_factoid_call_counted(self: Self) -> None:
+        """Test to ensure that a factoid call makes one query and one reply"""
+        # Step 1 - Setup env
+        replay = gateway_replay.GatewayReplay(extensions=("operation.factoids",))
+        events = [
+            {
+                "type": "message",
+                "message_id": 1,
+                "channel_id": gateway_replay.GENERAL_CHANNEL_ID,
+                "author_id": gateway_replay.FIRST_MEMBER_ID,
+                "content": "?hello",
+            }
+        ]
+
+        # Step 2 - Call the function
+        result = await replay.replay(events)
+
+        # Step 3 - Assert that everything works
+        assert not result.errors
+        assert result.db_queries["Factoid.first"] == 1
+        assert result.rest_calls["send message"] == 1
+        assert result.to_dict()["events"]["message"]["events"] == 1
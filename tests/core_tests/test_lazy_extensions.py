@@ -0,0 +1,254 @@
+"""
+This is a file to test the core/lazy_extensions.py file
+This contains 8 tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+from types import SimpleNamespace
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from discord.ext import commands
+
+import bot
+from core import lazy_extensions
+
+ENTRY = {
+    "fingerprint": "abc",
+    "lazy_eligible": True,
+    "commands": [
+        {
+            "name": "hug",
+            "aliases": ["cuddle"],
+            "usage": "[user]",
+            "brief": "Hugs a user",
+            "description": "Hugs a mentioned user",
+        }
+    ],
+}
+
+
+def make_extension_bot(cog_type: str, listeners: list) -> SimpleNamespace:
+    """Makes a fake bot with a single loaded fun.hug extension
+
+    Args:
+        cog_type (str): The COG_TYPE of the extension cog
+        listeners (list): The listeners of the extension cog
+
+    Returns:
+        SimpleNamespace: The fake bot
+    """
+    cog = MagicMock(COG_TYPE=cog_type)
+    cog.__module__ = "modules.fun.hug"
+    cog.get_listeners.return_value = listeners
+    cog.get_app_commands.return_value = []
+    command = SimpleNamespace(
+        name="hug",
+        aliases=["cuddle"],
+        usage="[user]",
+        brief="Hugs a user",
+        description="Hugs a mentioned user",
+        module="modules.fun.hug",
+        parent=None,
+    )
+    return SimpleNamespace(
+        EXTENSIONS_DIR_NAME="modules",
+        cogs={"Hugger": cog},
+        walk_commands=lambda: [command],
+    )
+
+
+def make_lazy_bot() -> bot.TechSupportBot:
+    """Makes a bot, without starting it, with fun.hug registered lazily
+
+    Returns:
+        bot.TechSupportBot: The bot
+    """
+    discord_bot = bot.TechSupportBot.__new__(bot.TechSupportBot)
+    discord_bot.all_commands = {}
+    discord_bot.lazy_extensions = {}
+    discord_bot.lazy_extension_locks = {}
+    discord_bot._BotBase__cogs = {}  # pylint: disable=W0212
+    discord_bot.dispatch = MagicMock()
+    discord_bot.register_lazy_extension("fun.hug", ENTRY)
+    return discord_bot
+
+
+class Test_Manifest:
+    """Tests to ensure that the manifest is saved and loaded"""
+
+    def test_round_trip(self: Self, tmp_path: pathlib.Path) -> None:
+        """Test to ensure that a saved manifest loads back the same,
+        and that a missing manifest loads as empty
+
+        Args:
+            tmp_path (pathlib.Path): A temporary directory to write the manifest to
+        """
+        # Step 1 - Setup env
+        manifest_path = str(tmp_path / "manifest.json")
+        missing = lazy_extensions.load_manifest(manifest_path)
+
+        # Step 2 - Call the function
+        lazy_extensions.save_manifest(manifest_path, {"fun.hug": ENTRY})
+        loaded = lazy_extensions.load_manifest(manifest_path)
+
+        # Step 3 - Assert that everything works
+        assert not missing
+        assert loaded == {"fun.hug": ENTRY}
+
+
+class Test_StubCommands:
+    """Tests to ensure that stub commands stand in for the real commands"""
+
+    def test_stub_keeps_help(self: Self) -> None:
+        """Test to ensure that stubs have the names, help and extension of the real command"""
+        # Step 1 - Setup env
+        loader = AsyncMock()
+
+        # Step 2 - Call the function
+        stubs = lazy_extensions.build_stub_commands(
+            "fun.hug", "modules.fun.hug", ENTRY, loader
+        )
+
+        # Step 3 - Assert that everything works
+        assert len(stubs) == 1
+        assert stubs[0].name == "hug"
+        assert stubs[0].aliases == ["cuddle"]
+        assert stubs[0].usage == "[user]"
+        assert stubs[0].module == "modules.fun.hug"
+
+    @pytest.mark.asyncio
+    async def test_stub_loads_extension(self: Self) -> None:
+        """Test to ensure that running a stub loads the real extension"""
+        # Step 1 - Setup env
+        loader = AsyncMock()
+        stubs = lazy_extensions.build_stub_commands(
+            "fun.hug", "modules.fun.hug", ENTRY, loader
+        )
+        ctx = MagicMock()
+
+        # Step 2 - Call the function
+        await stubs[0].callback(ctx)
+
+        # Step 3 - Assert that everything works
+        loader.assert_awaited_once_with(ctx, "fun.hug")
+
+
+class Test_DescribeExtension:
+    """Tests to ensure that only extensions with plain prefix commands are lazy"""
+
+    def test_plain_commands_eligible(self: Self) -> None:
+        """Test to ensure that a base cog with only prefix commands can be lazy"""
+        # Step 1 - Setup env
+        discord_bot = make_extension_bot("Base", [])
+
+        # Step 2 - Call the function
+        entry = lazy_extensions.describe_extension(discord_bot, "fun.hug", "abc")
+
+        # Step 3 - Assert that everything works
+        assert entry == ENTRY
+
+    def test_listeners_not_eligible(self: Self) -> None:
+        """Test to ensure that cogs with listeners or matches are never lazy"""
+        # Step 1 - Setup env
+        listener_bot = make_extension_bot("Base", [("on_message", MagicMock())])
+        match_bot = make_extension_bot("Match", [])
+
+        # Step 2 - Call the function
+        listener_entry = lazy_extensions.describe_extension(
+            listener_bot, "fun.hug", "abc"
+        )
+        match_entry = lazy_extensions.describe_extension(match_bot, "fun.hug", "abc")
+
+        # Step 3 - Assert that everything works
+        assert not listener_entry["lazy_eligible"]
+        assert not match_entry["lazy_eligible"]
+
+
+class Test_LazyBot:
+    """Tests to ensure that the bot loads, unloads and reloads lazy extensions"""
+
+    @pytest.mark.asyncio
+    async def test_load_waits_for_preconfig(self: Self) -> None:
+        """Test to ensure that a stub loads the extension, waits for the
+        preconfig of its cogs, then runs the real command without invoking it again"""
+        # Step 1 - Setup env
+        discord_bot = make_lazy_bot()
+        events = []
+
+        async def preconfig() -> None:
+            """A slow preconfig"""
+            await asyncio.sleep(0)
+            events.append("preconfig")
+
+        async def load_extension(name: str) -> None:
+            """Loads a cog with a preconfig task
+
+            Args:
+                name (str): The dotted path of the extension to load
+            """
+            discord_bot.lazy_extensions.pop("fun.hug")
+            cog = MagicMock(preconfig_task=asyncio.create_task(preconfig()))
+            cog.__module__ = name
+            discord_bot._BotBase__cogs["Hugger"] = cog  # pylint: disable=W0212
+
+        async def invoke(ctx: commands.Context) -> None:
+            """Records that the real command was run
+
+            Args:
+                ctx (commands.Context): The context to run
+            """
+            events.append("invoke")
+
+        new_ctx = MagicMock()
+        new_ctx.command.invoke = invoke
+        discord_bot.load_extension = load_extension
+        discord_bot.get_context = AsyncMock(return_value=new_ctx)
+        discord_bot.invoke = AsyncMock()
+
+        # Step 2 - Call the function
+        await discord_bot.load_lazy_extension(MagicMock(), "fun.hug")
+
+        # Step 3 - Assert that everything works
+        assert events == ["preconfig", "invoke"]
+        # Running the bot's invoke again would fire on_command a second time
+        discord_bot.invoke.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unload_removes_stubs(self: Self) -> None:
+        """Test to ensure that unloading a lazy extension removes its stubs"""
+        # Step 1 - Setup env
+        discord_bot = make_lazy_bot()
+
+        # Step 2 - Call the function
+        await discord_bot.unload_extension("modules.fun.hug")
+
+        # Step 3 - Assert that everything works
+        assert not discord_bot.all_commands
+        assert "fun.hug" not in discord_bot.lazy_extensions
+        discord_bot.dispatch.assert_called_once_with("commands_changed")
+
+    @pytest.mark.asyncio
+    async def test_reload_loads(self: Self) -> None:
+        """Test to ensure that reloading a lazy extension loads it for the first time"""
+        # Step 1 - Setup env
+        discord_bot = make_lazy_bot()
+
+        # Step 2 - Call the function
+        with (
+            patch.object(commands.Bot, "load_extension", AsyncMock()) as load_extension,
+            patch.object(
+                commands.Bot, "reload_extension", AsyncMock()
+            ) as reload_extension,
+        ):
+            await discord_bot.reload_extension("modules.fun.hug")
+
+        # Step 3 - Assert that everything works
+        load_extension.assert_awaited_once_with("modules.fun.hug", package=None)
+        reload_extension.assert_not_awaited()
+        assert not discord_bot.all_commands
+        assert "fun.hug" not in discord_bot.lazy_extensions
@@ -0,0 +1,55 @@
+"""
+This is a file to test the core/loop_monitor.py file
+This contains 2 tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Self
+
+import pytest
+
+from core import loop_monitor
+
+
+class Test_LoopWatchdog:
+    """Tests to ensure that the watchdog finds the code blocking the loop"""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_caught(self: Self) -> None:
+        """Test to ensure that a blocking sleep is caught, with its location"""
+        # Step 1 - Setup env
+        watchdog = loop_monitor.LoopWatchdog(SimpleNamespace(), threshold=0.1)
+        watchdog.start()
+        await asyncio.sleep(0.1)
+
+        # Step 2 - Call the function
+        time.sleep(0.4)
+        await asyncio.sleep(0.2)
+        watchdog.stop()
+        offenders = watchdog.take_offenders()
+
+        # Step 3 - Assert that everything works
+        assert len(offenders) == 1
+        assert offenders[0].location.startswith("tests/core_tests/test_loop_monitor.py")
+        assert offenders[0].count == 1
+        assert offenders[0].max_seconds >= 0.25
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_tasks(self: Self) -> None:
+        """Test to ensure that stopping the watchdog stops its loop timer and reports"""
+        # Step 1 - Setup env
+        watchdog = loop_monitor.LoopWatchdog(SimpleNamespace(), threshold=0.1)
+        watchdog.start()
+        tasks = list(watchdog.tasks)
+
+        # Step 2 - Call the function
+        watchdog.stop()
+        await asyncio.sleep(0)
+
+        # Step 3 - Assert that everything works
+        assert len(tasks) == 2
+        assert all(task.cancelled() for task in tasks)
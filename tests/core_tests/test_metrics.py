@@ -0,0 +1,115 @@
+"""
+This is a file to test the core/metrics.py file
+This contains 5 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+import pytest
+
+from core import metrics
+
+
+class Test_Histogram:
+    """Tests to ensure that histograms are rendered in the prometheus format"""
+
+    def test_buckets_cumulative(self: Self) -> None:
+        """Test to ensure that bucket counts include every smaller bucket"""
+        # Step 1 - Setup env
+        histogram = metrics.Histogram("test_seconds", "Test", ("cog",), (0.1, 1))
+
+        # Step 2 - Call the function
+        histogram.observe(0.05, cog="Factoids")
+        histogram.observe(0.5, cog="Factoids")
+        histogram.observe(5, cog="Factoids")
+        lines = histogram.render()
+
+        # Step 3 - Assert that everything works
+        assert 'test_seconds_bucket{cog="Factoids",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{cog="Factoids",le="1"} 2' in lines
+        assert 'test_seconds_bucket{cog="Factoids",le="+Inf"} 3' in lines
+        assert 'test_seconds_count{cog="Factoids"} 3' in lines
+
+
+class Test_Counter:
+    """Tests to ensure that counters escape their labels"""
+
+    def test_label_escaped(self: Self) -> None:
+        """Test to ensure that quotes in a label value are escaped"""
+        # Step 1 - Setup env
+        counter = metrics.Counter("test_total", "Test", ("command",))
+
+        # Step 2 - Call the function
+        counter.inc(command='say "hi"')
+        counter.inc(command='say "hi"')
+
+        # Step 3 - Assert that everything works
+        assert 'test_total{command="say \\"hi\\""} 2' in counter.render()
+
+
+class Test_MetricsRegistry:
+    """Tests to ensure that collectors are only registered once"""
+
+    def test_collector_added_once(self: Self) -> None:
+        """Test to ensure that adding a collector twice only runs it once,
+        and that a removed collector isn't run"""
+        # Step 1 - Setup env
+        registry = metrics.MetricsRegistry()
+        calls = []
+
+        def collector() -> None:
+            """Records that it was run"""
+            calls.append(1)
+
+        # Step 2 - Call the function
+        registry.add_collector(collector)
+        registry.add_collector(collector)
+        registry.render()
+        registry.remove_collector(collector)
+        registry.render()
+
+        # Step 3 - Assert that everything works
+        assert len(calls) == 1
+
+
+class Test_GetQueryTable:
+    """Tests to ensure that queries are labelled with their table"""
+
+    def test_raw_sql(self: Self) -> None:
+        """Test to ensure that raw SQL is labelled as raw"""
+        # Step 1 - Setup env
+        query = "SELECT 1"
+
+        # Step 2 - Call the function
+        result = metrics.get_query_table(query)
+
+        # Step 3 - Assert that everything works
+        assert result == "raw"
+
+
+class Test_TimeListener:
+    """Tests to ensure that timed listeners still run the listener"""
+
+    @pytest.mark.asyncio
+    async def test_listener_timed(self: Self) -> None:
+        """Test to ensure that the listener runs, and is counted once"""
+        # Step 1 - Setup env
+        calls = []
+
+        async def on_test_event(value: int) -> None:
+            """A listener that records its argument
+
+            Args:
+                value (int): The argument of the event
+            """
+            calls.append(value)
+
+        # Step 2 - Call the function
+        await metrics.time_listener(on_test_event, "on_test_event")(1)
+
+        # Step 3 - Assert that everything works
+        assert calls == [1]
+        assert metrics.listener_seconds.counts[("on_test_event", "bot")][-1] == 0
+        assert sum(metrics.listener_seconds.counts[("on_test_event", "bot")]) == 1
@@ -0,0 +1,69 @@
+"""
+This is a file to test the core/rate_limit.py file
+This contains 4 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+from core import rate_limit
+
+
+class Test_RateLimiter:
+    """Tests to ensure that the rate limiter counts commands correctly"""
+
+    def test_burst_then_limited(self: Self) -> None:
+        """Test to ensure that a full burst is allowed, and the next command isn't"""
+        # Step 1 - Setup env
+        limiter = rate_limit.RateLimiter(max_keys=10)
+
+        # Step 2 - Call the function
+        results = [
+            limiter.check((1, 1), command_id, limit=3, period=10, now=0)
+            for command_id in range(4)
+        ]
+
+        # Step 3 - Assert that everything works
+        assert results == [True, True, True, False]
+
+    def test_same_command_counted_once(self: Self) -> None:
+        """Test to ensure that checking the same command twice only counts it once"""
+        # Step 1 - Setup env
+        limiter = rate_limit.RateLimiter(max_keys=10)
+
+        # Step 2 - Call the function
+        limiter.check((1, 1), 1, limit=2, period=10, now=0)
+        limiter.check((1, 1), 1, limit=2, period=10, now=0)
+        result = limiter.check((1, 1), 2, limit=2, period=10, now=0)
+
+        # Step 3 - Assert that everything works
+        assert result is True
+
+    def test_recovers_after_period(self: Self) -> None:
+        """Test to ensure that a limited key can run commands after the period"""
+        # Step 1 - Setup env
+        limiter = rate_limit.RateLimiter(max_keys=10)
+        for command_id in range(3):
+            limiter.check((1, 1), command_id, limit=2, period=10, now=0)
+
+        # Step 2 - Call the function
+        result = limiter.check((1, 1), 5, limit=2, period=10, now=10)
+
+        # Step 3 - Assert that everything works
+        assert result is True
+
+    def test_idle_keys_dropped(self: Self) -> None:
+        """Test to ensure that idle keys are dropped, and the key count is bounded"""
+        # Step 1 - Setup env
+        limiter = rate_limit.RateLimiter(max_keys=2)
+
+        # Step 2 - Call the function
+        for member_id in range(5):
+            limiter.check((1, member_id), 1, limit=2, period=10, now=0)
+        bounded_keys = limiter.get_stats()["keys"]
+        limiter.check((1, 10), 1, limit=2, period=10, now=100)
+
+        # Step 3 - Assert that everything works
+        assert bounded_keys == 2
+        assert list(limiter.entries) == [(1, 10)]
@@ -0,0 +1,58 @@
+"""
+This is a file to test the core/startup.py file
+This contains 3 tests
+"""
+
+from __future__ import annotations
+
+from typing import Self
+
+from core import startup
+
+
+class Test_StartupTimeline:
+    """Tests to ensure that the startup timeline records and reports timings"""
+
+    def test_phases_added_together(self: Self) -> None:
+        """Test to ensure that a phase recorded twice is added together"""
+        # Step 1 - Setup env
+        timeline = startup.StartupTimeline()
+
+        # Step 2 - Call the function
+        timeline.record_extension("fun.duck", "preconfig", 0.5)
+        timeline.record_extension("fun.duck", "preconfig", 0.25)
+
+        # Step 3 - Assert that everything works
+        assert timeline.extensions["fun.duck"]["preconfig"] == 0.75
+
+    def test_report_slowest_first(self: Self) -> None:
+        """Test to ensure that the report lists the slowest extensions first"""
+        # Step 1 - Setup env
+        timeline = startup.StartupTimeline()
+        with timeline.time_stage("postgres"):
+            pass
+        timeline.record_extension("fun.hug", "import", 0.1)
+        timeline.record_extension("fun.duck", "import", 0.3)
+
+        # Step 2 - Call the function
+        report = timeline.build_report(limit=1)
+
+        # Step 3 - Assert that everything works
+        assert "postgres" in report
+        assert "fun.duck" in report
+        assert "fun.hug" not in report
+
+
+class Test_ImportModules:
+    """Tests to ensure that modules are imported ahead of time"""
+
+    def test_import_errors_ignored(self: Self) -> None:
+        """Test to ensure that a module that can't be imported doesn't stop the others"""
+        # Step 1 - Setup env
+        names = ["core.rate_limit", "core.does_not_exist"]
+
+        # Step 2 - Call the function
+        import_times = startup.import_modules(names)
+
+        # Step 3 - Assert that everything works
+        assert list(import_times) == names
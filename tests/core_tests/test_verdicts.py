@@ -0,0 +1,51 @@
+"""
+This is a file to test the core/verdicts.py file
+This contains 2 tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Self
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core import verdicts
+
+
+class Test_VerdictCache:
+    """Tests to ensure that verdicts are shared, and failures aren't kept"""
+
+    @pytest.mark.asyncio
+    async def test_running_check_shared(self: Self) -> None:
+        """Test to ensure that a check that is still running is awaited, not run again"""
+        # Step 1 - Setup env
+        cache = verdicts.VerdictCache()
+        evaluate = AsyncMock(return_value="verdict")
+
+        # Step 2 - Call the function
+        results = await asyncio.gather(
+            cache.get(("message", 1), evaluate), cache.get(("message", 1), evaluate)
+        )
+
+        # Step 3 - Assert that everything works
+        assert results == ["verdict", "verdict"]
+        evaluate.assert_awaited_once()
+        assert cache.duplicates_avoided == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_not_kept(self: Self) -> None:
+        """Test to ensure that a check that fails is run again next time"""
+        # Step 1 - Setup env
+        cache = verdicts.VerdictCache()
+        evaluate = AsyncMock(side_effect=[ValueError("failed"), "verdict"])
+
+        # Step 2 - Call the function
+        with pytest.raises(ValueError):
+            await cache.get(("message", 1), evaluate)
+        result = await cache.get(("message", 1), evaluate)
+
+        # Step 3 - Assert that everything works
+        assert result == "verdict"
+        assert evaluate.await_count == 2